@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Benchmark bulk contact upsert throughput against a local mock backend.
+
+Seeds the mock with existing contacts, then upserts N rows of which a share
+already exist (spelled differently: mixed-case emails, formatted phones) and
+a share are repeated within the input. Compares:
+
+- naive: one find_by_email + create/update per row, serially (today's path)
+- bulk_upsert at several concurrency levels
+
+and checks that no contact was created twice.
+
+Usage:
+    python scripts/bench_bulk_upsert.py
+    python scripts/bench_bulk_upsert.py --rows 20000 --existing 50000 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import itertools
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from ghl_assistant.api import GHLClient, GHLConfig, RateLimitConfig
+from ghl_assistant.api.normalize import normalize_email
+from mock_backend import MockBackend, MockResponse
+
+
+class ContactStore:
+    """In-memory contacts behind the mock routes."""
+
+    def __init__(self, existing: int):
+        self.ids = itertools.count()
+        self.contacts: dict[str, dict] = {}
+        for i in range(existing):
+            self.add({"firstName": "Existing", "email": f"person{i}@example.com",
+                      "phone": f"+1555{i:07d}", "tags": ["old"]})
+
+    def add(self, data: dict) -> dict:
+        cid = f"c{next(self.ids):08d}"
+        contact = {"id": cid, **data}
+        self.contacts[cid] = contact
+        return contact
+
+    def routes(self, backend: MockBackend) -> None:
+        @backend.route("GET", r"/contacts/")
+        def list_contacts(req):
+            limit = int(req.query.get("limit", 20))
+            query = req.query.get("query")
+            if query:
+                needle = query.lower().lstrip("+")
+                hits = [c for c in self.contacts.values()
+                        if needle in (c.get("email") or "") or needle in (c.get("phone") or "")]
+                return MockResponse(body={"contacts": hits[:limit], "meta": {"total": len(hits)}})
+            ids = sorted(self.contacts)
+            after = req.query.get("startAfterId")
+            start = ids.index(after) + 1 if after else 0
+            page = [self.contacts[cid] for cid in ids[start:start + limit]]
+            meta = {"total": len(ids), "startAfterId": page[-1]["id"] if page else None}
+            return MockResponse(body={"contacts": page, "meta": meta})
+
+        @backend.route("POST", r"/contacts/")
+        def create_contact(req):
+            return MockResponse(status=201, body={"contact": self.add(req.json())})
+
+        @backend.route("PUT", r"/contacts/(?P<contact_id>[^/]+)")
+        def update_contact(req):
+            contact = self.contacts[req.params["contact_id"]]
+            contact.update(req.json())
+            return MockResponse(body={"contact": contact})
+
+    def duplicates(self) -> int:
+        emails = [normalize_email(c.get("email")) for c in self.contacts.values()]
+        emails = [e for e in emails if e]
+        return len(emails) - len(set(emails))
+
+
+def make_rows(total: int, existing: int) -> list[dict]:
+    rows = []
+    for i in range(total):
+        if i % 10 < 3 and existing:
+            n = i % existing  # ~30% already exist, spelled differently
+            rows.append({"email": f"Person{n}@Example.com ", "phone": f"(555) {n:07d}"[:14],
+                         "tags": ["imported"]})
+        elif i % 20 == 19:
+            rows.append({"email": f"NEW{i - 1}@example.com", "tags": ["dupe"]})  # repeated row
+        else:
+            rows.append({"firstName": "New", "email": f"new{i}@example.com",
+                         "phone": f"+1666{i:07d}", "tags": ["imported"]})
+    return rows
+
+
+async def naive(ghl: GHLClient, rows: list[dict]) -> None:
+    for row in rows:
+        row = dict(row)
+        existing = await ghl.contacts.find_by_email(row["email"].strip())
+        if existing:
+            await ghl.contacts.update(existing["id"], **row)
+        else:
+            await ghl.contacts.create(**row)
+
+
+async def run(mode: str, rows: list[dict], existing: int, latency: float):
+    store = ContactStore(existing)
+    backend = MockBackend(latency=latency)
+    store.routes(backend)
+    async with backend:
+        client = GHLClient(
+            GHLConfig(token="bench", location_id="l0cat10n"),
+            rate_limit=RateLimitConfig(enabled=False),
+            base_url=backend.url,
+        )
+        async with client as ghl:
+            start = time.perf_counter()
+            if mode == "naive":
+                await naive(ghl, rows)
+                report = None
+            else:
+                report = await ghl.contacts.bulk_upsert(rows, concurrency=int(mode))
+            elapsed = time.perf_counter() - start
+    return elapsed, report, store.duplicates(), len(store.contacts) - existing
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--existing", type=int, default=5000)
+    parser.add_argument("--latency", type=float, default=0.02, help="Simulated server latency")
+    parser.add_argument("--skip-naive", action="store_true")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows, args.existing)
+    print(f"{args.rows} rows, {args.existing} existing contacts, "
+          f"{args.latency * 1000:.0f} ms simulated latency\n")
+    print(f"{'mode':<16}{'seconds':>9}{'rows/s':>9}{'created':>9}{'updated':>9}"
+          f"{'lookups':>9}{'dupes':>7}")
+
+    modes = ([] if args.skip_naive else ["naive"]) + ["1", "10", "50"]
+    for mode in modes:
+        elapsed, report, dupes, created = await run(mode, rows, args.existing, args.latency)
+        label = "naive serial" if mode == "naive" else f"bulk c={mode}"
+        updated = report.updated if report else args.rows - created
+        lookups = report.lookups if report else args.rows
+        print(f"{label:<16}{elapsed:>9.2f}{args.rows / elapsed:>9.0f}{created:>9}{updated:>9}"
+              f"{lookups:>9}{dupes:>7}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
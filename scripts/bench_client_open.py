@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark client open latency with and without cached resolved IDs.
+
+Opening a client from a session file loads the session, scans its captured API
+calls for account IDs and, without a location, calls search_locations. With
+resolved_ids.json next to the session both steps are skipped.
+
+Usage:
+    python scripts/bench_client_open.py
+    python scripts/bench_client_open.py --calls 20000 --rtt 0.12
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from ghl_assistant.api import GHLClient, GHLConfig, RateLimitConfig
+from ghl_assistant.api.session import RESOLVED_IDS_FILE
+from mock_backend import MockBackend, MockResponse
+
+USER_ID = "dJv1aXj2NN2nV8r6xcF6"
+COMPANY_ID = "AJqfXhpsvU0HR0Wcd6YH"
+LOCATION_ID = "x8YkQ3pLm2Nd9RtUv4Wz"
+
+
+def write_session(path: Path, calls: int) -> None:
+    api_calls = [
+        {
+            "url": f"https://backend.leadconnectorhq.com/notifications/count?i={i}",
+            "method": "GET",
+            "response_status": 200,
+            "response_body": json.dumps({"count": i, "items": ["x" * 40] * 5}),
+        }
+        for i in range(calls)
+    ]
+    # IDs only show up late in the capture, as they do after a long session
+    api_calls.append({"url": f"https://backend.leadconnectorhq.com/users/{USER_ID}"})
+    api_calls.append(
+        {"url": f"https://backend.leadconnectorhq.com/oauth/keys/?companyId={COMPANY_ID}"}
+    )
+    with open(path, "w") as f:
+        json.dump({"auth": {"access_token": "bench-token"}, "api_calls": api_calls}, f)
+
+
+async def open_once(session: Path, backend_url: str) -> float:
+    start = time.perf_counter()
+    config = GHLConfig.from_session_file(session)
+    client = GHLClient(config, rate_limit=RateLimitConfig(enabled=False), base_url=backend_url)
+    async with client:
+        assert client.config.location_id == LOCATION_ID
+    return time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=5000, help="Captured API calls in session")
+    parser.add_argument("--rtt", type=float, default=0.08, help="Simulated round trip (s)")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    backend = MockBackend(latency=args.rtt)
+    backend.route("GET", r"/locations/search")(
+        lambda req: MockResponse(body={"locations": [{"_id": LOCATION_ID, "name": "Bench"}]})
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        session = Path(tmp) / "session_20240101_000000.json"
+        write_session(session, args.calls)
+        resolved = Path(tmp) / RESOLVED_IDS_FILE
+
+        async with backend:
+            cold = []
+            for _ in range(args.runs):
+                resolved.unlink(missing_ok=True)
+                cold.append(await open_once(session, backend.url))
+            searches_cold = backend.requests
+
+            warm = []
+            for _ in range(args.runs):
+                warm.append(await open_once(session, backend.url))
+            searches_warm = backend.requests - searches_cold
+
+    print(f"session: {args.calls} captured calls, simulated RTT {args.rtt * 1000:.0f} ms")
+    print(f"{'':<28}{'median ms':>10}{'searches':>10}")
+    print(f"{'before (scan + search)':<28}{statistics.median(cold) * 1000:>10.1f}"
+          f"{searches_cold:>10}")
+    print(f"{'after (resolved_ids.json)':<28}{statistics.median(warm) * 1000:>10.1f}"
+          f"{searches_warm:>10}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Micro-benchmark JSON backends on realistic contact payloads.
+
+Times decoding and encoding of a contacts page (100 contacts with tags,
+custom fields, attribution and DND settings) for every installed backend.
+
+Usage:
+    python scripts/bench_codec.py
+    python scripts/bench_codec.py --contacts 100 --iterations 500
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ghl_assistant import codec
+
+
+def make_contact(i: int) -> dict:
+    rng = random.Random(i)
+    return {
+        "id": f"{rng.getrandbits(64):016x}{i:04d}",
+        "locationId": "x8YkQ3pLm2Nd9RtUv4Wz",
+        "contactName": f"contact {i}",
+        "firstName": "Jane",
+        "lastName": f"Doe{i}",
+        "firstNameRaw": "Jane",
+        "lastNameRaw": f"Doe{i}",
+        "companyName": None,
+        "email": f"jane.doe{i}@example.com",
+        "phone": f"+1555{rng.randint(1000000, 9999999)}",
+        "dnd": False,
+        "dndSettings": {
+            channel: {"status": "inactive", "message": "", "code": ""}
+            for channel in ("Call", "Email", "SMS", "WhatsApp", "GMB", "FB")
+        },
+        "type": "lead",
+        "source": "api",
+        "assignedTo": None,
+        "address1": f"{rng.randint(1, 9999)} Main St",
+        "city": "Springfield",
+        "state": "IL",
+        "country": "US",
+        "postalCode": f"{rng.randint(10000, 99999)}",
+        "website": None,
+        "timezone": "America/Chicago",
+        "dateAdded": "2024-01-15T10:30:00.000Z",
+        "dateUpdated": "2024-03-02T18:04:11.512Z",
+        "tags": rng.sample(["lead", "customer", "vip", "newsletter", "webinar", "cold"], 3),
+        "customFields": [
+            {"id": f"cf{n:02d}aBcDeFgHiJkLmN", "value": rng.choice(["yes", 42, "2024-02-01"])}
+            for n in range(12)
+        ],
+        "attributionSource": {
+            "sessionSource": "Direct traffic",
+            "medium": "form",
+            "mediumId": f"form{rng.getrandbits(32):08x}",
+            "url": "https://example.com/landing?utm_source=google&utm_medium=cpc",
+        },
+        "followers": [],
+    }
+
+
+def make_page(contacts: int) -> dict:
+    return {
+        "contacts": [make_contact(i) for i in range(contacts)],
+        "meta": {"total": 48211, "startAfter": 1709402651512, "startAfterId": "abc123"},
+    }
+
+
+def bench(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--contacts", type=int, default=100, help="Contacts per page")
+    parser.add_argument("--iterations", type=int, default=300)
+    args = parser.parse_args()
+
+    page = make_page(args.contacts)
+    payload = codec.dumps(page)
+    print(f"page: {args.contacts} contacts, {len(payload) / 1024:.0f} KiB\n")
+    print(f"{'backend':<10}{'decode ms':>12}{'encode ms':>12}{'decode MB/s':>14}")
+
+    active = codec.BACKEND
+    for name in codec.BACKENDS:
+        try:
+            codec.set_backend(name)
+        except ImportError:
+            print(f"{name:<10}{'not installed':>12}")
+            continue
+        decode = bench(lambda: codec.loads(payload), args.iterations)
+        encode = bench(lambda: codec.dumps(page), args.iterations)
+        rate = len(payload) / decode / 1e6
+        print(f"{name:<10}{decode * 1000:>12.3f}{encode * 1000:>12.3f}{rate:>14.0f}")
+    codec.set_backend(active)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark GHLClient throughput across pool settings and HTTP versions.
+
+Runs a fixed number of contact GETs against a local mock backend at
+concurrency 1, 10 and 50 and reports requests per second and how many TCP
+connections the server saw.
+
+Usage:
+    python scripts/bench_http.py
+    python scripts/bench_http.py --requests 2000 --latency 0.01
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from ghl_assistant.api import GHLClient, GHLConfig, PoolConfig, RateLimitConfig
+from mock_backend import MockBackend, MockResponse
+
+CONTACT = {
+    "contact": {
+        "id": "c0ntact1d",
+        "locationId": "l0cat10n",
+        "firstName": "Jane",
+        "lastName": "Doe",
+        "email": "jane@example.com",
+        "phone": "+15551234567",
+        "tags": ["lead", "newsletter"],
+        "customFields": [{"id": f"cf{i}", "value": f"value {i}"} for i in range(10)],
+    }
+}
+
+MODES = {
+    "http1 (httpx defaults)": PoolConfig(max_connections=100, max_keepalive_connections=20,
+                                         keepalive_expiry=5.0),
+    "http1 (pool=10)": PoolConfig(max_connections=10, max_keepalive_connections=10),
+    "http2": PoolConfig(http2=True),
+}
+
+
+async def run(pool: PoolConfig, concurrency: int, total: int, latency: float) -> tuple[float, int]:
+    backend = MockBackend(latency=latency)
+    backend.route("GET", r"/contacts/(?P<contact_id>[^/]+)")(lambda req: MockResponse(body=CONTACT))
+
+    async with backend:
+        client = GHLClient(
+            GHLConfig(token="bench", location_id="l0cat10n"),
+            rate_limit=RateLimitConfig(enabled=False),
+            pool=pool,
+            base_url=backend.url,
+        )
+        async with client as ghl:
+            remaining = iter(range(total))
+
+            async def worker():
+                for i in remaining:
+                    await ghl.contacts.get(f"c{i}")
+
+            start = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            elapsed = time.perf_counter() - start
+
+    return total / elapsed, backend.connections
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.005, help="Simulated server latency")
+    args = parser.parse_args()
+
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        print("h2 not installed - skipping HTTP/2 (pip install 'ghl-assistant[http2]')")
+        MODES.pop("http2")
+
+    print(f"{args.requests} requests, {args.latency * 1000:.1f} ms simulated latency\n")
+    print(f"{'mode':<26}{'concurrency':>12}{'req/s':>10}{'connections':>13}")
+    for name, pool in MODES.items():
+        for concurrency in (1, 10, 50):
+            rps, connections = await run(pool, concurrency, args.requests, args.latency)
+            print(f"{name:<26}{concurrency:>12}{rps:>10.0f}{connections:>13}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Memory benchmark: compact Contact records vs plain dicts.
+
+Decodes N contacts page by page (as the API delivers them) and measures the
+memory retained by the resulting list with tracemalloc, once as dicts and
+once as ``Contact`` records, plus the cost of touching a lazy field.
+
+Usage:
+    python scripts/bench_models.py
+    python scripts/bench_models.py --contacts 100000
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from ghl_assistant import codec
+from ghl_assistant.models import Contact
+from bench_codec import make_contact
+
+PAGE_SIZE = 100
+
+
+def encoded_pages(total: int) -> list[bytes]:
+    pages = []
+    for start in range(0, total, PAGE_SIZE):
+        end = min(start + PAGE_SIZE, total)
+        pages.append(codec.dumps({"contacts": [make_contact(i) for i in range(start, end)]}))
+    return pages
+
+
+def load(pages: list[bytes], as_records: bool) -> tuple[list, int, int, float]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    contacts = []
+    for payload in pages:
+        page = codec.loads(payload)
+        if as_records:
+            Contact.from_page(page, "contacts")
+        contacts.extend(page["contacts"])
+        del page
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return contacts, current, peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--contacts", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"Generating {args.contacts} contacts...")
+    pages = encoded_pages(args.contacts)
+
+    dicts, dict_mem, dict_peak, dict_s = load(pages, as_records=False)
+    del dicts
+    records, rec_mem, rec_peak, rec_s = load(pages, as_records=True)
+
+    start = time.perf_counter()
+    touched = sum(1 for c in records[:10_000] if c.custom_field("cf00aBcDeFgHiJkLmN") is not None)
+    lazy_us = (time.perf_counter() - start) / 10_000 * 1e6
+
+    mb = 1024 * 1024
+    print(f"\n{'':<10}{'retained MB':>13}{'peak MB':>10}{'bytes/contact':>15}{'load s':>9}")
+    print(f"{'dict':<10}{dict_mem / mb:>13.1f}{dict_peak / mb:>10.1f}"
+          f"{dict_mem / args.contacts:>15.0f}{dict_s:>9.2f}")
+    print(f"{'Contact':<10}{rec_mem / mb:>13.1f}{rec_peak / mb:>10.1f}"
+          f"{rec_mem / args.contacts:>15.0f}{rec_s:>9.2f}")
+    print(f"\nreduction: {dict_mem / rec_mem:.1f}x; "
+          f"lazy customFields access: {lazy_us:.1f} us/contact ({touched} hits)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Benchmark harvesting every form submission, serially vs with parallel pages.
+
+Serves N submissions from a local mock backend with simulated latency and
+times ``forms.iter_submissions`` at several concurrency levels, in page order
+and as pages arrive. Rate limiting is disabled so the numbers show the
+harvester itself; against GHL the client's limiter caps request rate.
+
+Usage:
+    python scripts/bench_pagination.py
+    python scripts/bench_pagination.py --submissions 200000 --latency 0.15
+"""
+
+import argparse
+import asyncio
+import math
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from ghl_assistant.api import GHLClient, GHLConfig, RateLimitConfig
+from mock_backend import MockBackend, MockResponse
+
+
+def make_backend(submissions: int, latency: float) -> MockBackend:
+    backend = MockBackend(latency=latency)
+
+    @backend.route("GET", r"/forms/submissions")
+    def list_submissions(req):
+        limit = int(req.query.get("limit", 20))
+        page = int(req.query.get("page", 1))
+        start = (page - 1) * limit
+        rows = [
+            {"id": f"s{i:07d}", "formId": req.query.get("formId"), "email": f"lead{i}@example.com"}
+            for i in range(start, min(start + limit, submissions))
+        ]
+        return MockResponse(body={
+            "submissions": rows,
+            "meta": {"total": submissions, "currentPage": page,
+                     "nextPage": page + 1 if start + limit < submissions else None},
+        })
+
+    return backend
+
+
+async def harvest(url: str, concurrency: int, ordered: bool) -> tuple[int, float]:
+    client = GHLClient(
+        GHLConfig(token="bench", location_id="l0cat10n"),
+        rate_limit=RateLimitConfig(enabled=False),
+        base_url=url,
+    )
+    async with client as ghl:
+        start = time.perf_counter()
+        count = 0
+        async for _ in ghl.forms.iter_submissions("f0rm", concurrency=concurrency, ordered=ordered):
+            count += 1
+        return count, time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--submissions", type=int, default=20_000)
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated server latency")
+    args = parser.parse_args()
+
+    pages = math.ceil(args.submissions / 100)
+    print(f"{args.submissions} submissions ({pages} pages), "
+          f"{args.latency * 1000:.0f} ms simulated latency\n")
+    print(f"{'concurrency':<14}{'order':<10}{'seconds':>9}{'rows/s':>10}")
+
+    async with make_backend(args.submissions, args.latency) as backend:
+        for concurrency, ordered in ((1, True), (8, True), (8, False), (32, True), (32, False)):
+            count, elapsed = await harvest(backend.url, concurrency, ordered)
+            assert count == args.submissions, count
+            order = "page" if ordered else "arrival"
+            print(f"{concurrency:<14}{order:<10}{elapsed:>9.2f}{count / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
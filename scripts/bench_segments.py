@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Segment query benchmark: vectorized SegmentIndex vs filtering dicts.
+
+Fills a temporary replica with N synthetic contacts, loads it into a
+``SegmentIndex``, and times one segment ("tag A and not tag B, custom field
+> 30, created in the last 90 days") against the same filter written as a
+Python loop over the decoded contacts.
+
+Usage:
+    python scripts/bench_segments.py
+    python scripts/bench_segments.py --contacts 1000000
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ghl_assistant.api.replica import ContactReplica
+from ghl_assistant.api.segments import CreatedWithin, Field, Tag
+
+TAGS = ["lead", "customer", "vip", "newsletter", "webinar", "cold"]
+NOW = datetime(2025, 6, 1, tzinfo=timezone.utc)
+
+
+def make_contact(i: int) -> dict:
+    rng = random.Random(i)
+    added = NOW - timedelta(days=rng.uniform(0, 720))
+    return {
+        "id": f"c{i:08d}",
+        "firstName": "Jane",
+        "lastName": f"Doe{i}",
+        "email": f"jane.doe{i}@example.com",
+        "source": rng.choice(["api", "form", "import"]),
+        "tags": rng.sample(TAGS, 3),
+        "dateAdded": added.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+        "dateUpdated": added.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+        "customFields": [
+            {"id": "cfScore", "value": rng.randint(0, 100)},
+            {"id": "cfPlan", "value": rng.choice(["free", "pro", "team"])},
+        ],
+    }
+
+
+def python_filter(replica: ContactReplica) -> list[str]:
+    cutoff = (NOW - timedelta(days=90)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    ids = []
+    for contact in replica.iter_contacts(batch_size=10_000):
+        tags = set(contact.get("tags") or ())
+        score = next(
+            (f["value"] for f in contact.get("customFields") or () if f["id"] == "cfScore"), None
+        )
+        if (
+            "vip" in tags
+            and "cold" not in tags
+            and score is not None
+            and score > 30
+            and contact["dateAdded"] >= cutoff
+        ):
+            ids.append(contact["id"])
+    return ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--contacts", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        replica = ContactReplica("bench", path=Path(tmp) / "bench.sqlite")
+        print(f"Writing {args.contacts} contacts to a replica...")
+        for start in range(0, args.contacts, 10_000):
+            end = min(start + 10_000, args.contacts)
+            replica._upsert_many([make_contact(i) for i in range(start, end)])
+
+        start = time.perf_counter()
+        index = replica.segments()
+        load_s = time.perf_counter() - start
+
+        segment = Tag("vip") & ~Tag("cold") & (Field("cfScore") > 30) & CreatedWithin(90, now=NOW)
+        index.select(segment)  # warm up
+        runs = 20
+        start = time.perf_counter()
+        for _ in range(runs):
+            ids = index.select(segment)
+        query_ms = (time.perf_counter() - start) / runs * 1000
+
+        start = time.perf_counter()
+        expected = python_filter(replica)
+        loop_s = time.perf_counter() - start
+        replica.close()
+
+    assert sorted(ids) == sorted(expected), "segment and loop disagree"
+    print(f"\nindex load:       {load_s:8.2f} s")
+    print(f"segment query:    {query_ms:8.2f} ms  ({len(ids)} contacts)")
+    print(f"python loop:      {loop_s * 1000:8.0f} ms")
+    print(f"speedup per query: {loop_s * 1000 / query_ms:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark config loading from a large session file vs its credential profile.
+
+Writes a synthetic session of the requested size (captured calls with large
+response bodies), then times:
+
+- full parse: json.load of the whole session plus the api_calls ID scan
+  (what every client start used to do)
+- first load: GHLConfig.from_session_file on a session without a profile
+  (parses once and writes the profile)
+- profile load: GHLConfig.from_session_file once the profile exists
+
+Usage:
+    python scripts/bench_session_load.py
+    python scripts/bench_session_load.py --size-mb 500 --runs 5
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ghl_assistant.api import GHLConfig
+from ghl_assistant.api.session import extract_ids, profile_path_for
+
+
+def write_session(path: Path, size_mb: int) -> None:
+    """Stream a session file of roughly ``size_mb`` megabytes to disk."""
+    body = json.dumps({"contacts": [{"id": f"c{i}", "notes": "x" * 180} for i in range(95)]})
+    calls = max(1, size_mb * 1_000_000 // (len(body) + 300))
+    with open(path, "w") as f:
+        f.write('{"profile": "bench", "captured_at": "2024-01-01T00:00:00",')
+        f.write('"auth": {"access_token": "bench-token"}, "api_calls": [')
+        for i in range(calls):
+            call = {
+                "url": f"https://backend.leadconnectorhq.com/contacts/?locationId=L0c{i}",
+                "method": "GET",
+                "headers": {"version": "2021-07-28"},
+                "response_status": 200,
+                "response_body": body,
+            }
+            if i == calls - 1:
+                call["url"] = "https://backend.leadconnectorhq.com/users/U5er?companyId=C0mp"
+            f.write(("," if i else "") + json.dumps(call))
+        f.write("]}")
+
+
+def full_parse(path: Path) -> dict:
+    with open(path) as f:
+        data = json.load(f)
+    return extract_ids(data.get("api_calls", []))
+
+
+def timed(fn, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=300)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        session = Path(tmp) / "session_20240101_000000.json"
+        print(f"Writing ~{args.size_mb} MB session...")
+        write_session(session, args.size_mb)
+        size = session.stat().st_size / 1e6
+
+        parse_s = timed(lambda: full_parse(session), args.runs)
+        first_s = timed(lambda: GHLConfig.from_session_file(session), 1)
+        profile_s = timed(lambda: GHLConfig.from_session_file(session), max(args.runs, 10))
+        profile_size = profile_path_for(session).stat().st_size
+
+    print(f"\nsession: {size:.0f} MB, profile: {profile_size} bytes")
+    print(f"{'full parse (before)':<24}{parse_s * 1000:>12.1f} ms")
+    print(f"{'first load + backfill':<24}{first_s * 1000:>12.1f} ms")
+    print(f"{'profile load (after)':<24}{profile_s * 1000:>12.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
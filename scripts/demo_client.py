@@ -27,7 +27,7 @@ async def main():
     print(f"User ID: {config.user_id}")
     print(f"Company ID: {config.company_id}")
 
-    async with GHLClient(config) as client:
+    async with GHLClient(config, persistent_cache=True) as client:
         # Get user
         print("\n=== User Profile ===")
         user = await client.get_user()
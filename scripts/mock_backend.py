@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""Local mock of the GHL backend for benchmarks.
+
+Serves HTTP/1.1 with keep-alive and, when the ``h2`` package is installed,
+HTTP/2 over cleartext with prior knowledge (h2c). Routes are registered per
+benchmark; every response can be delayed to simulate network latency.
+
+Usage:
+    backend = MockBackend(latency=0.005)
+
+    @backend.route("GET", r"/contacts/(?P<contact_id>[^/]+)")
+    def get_contact(req):
+        return MockResponse(body={"contact": {"id": req.params["contact_id"]}})
+
+    async with backend:
+        async with GHLClient(config, base_url=backend.url) as ghl:
+            ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+from urllib.parse import parse_qsl, urlsplit
+
+H2_PREFACE_LINE = b"PRI * HTTP/2.0\r\n"
+H2_PREFACE_REST = b"\r\nSM\r\n\r\n"
+
+
+@dataclass
+class MockRequest:
+    """A request received by the mock backend."""
+
+    method: str
+    path: str
+    query: dict[str, str]
+    headers: dict[str, str]
+    body: bytes = b""
+    params: dict[str, str] = field(default_factory=dict)
+
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else None
+
+
+@dataclass
+class MockResponse:
+    """A response returned by a route handler."""
+
+    status: int = 200
+    body: Any = None
+    headers: dict[str, str] = field(default_factory=dict)
+
+    def encode(self) -> bytes:
+        if isinstance(self.body, bytes):
+            return self.body
+        return json.dumps(self.body if self.body is not None else {}).encode()
+
+
+Handler = Callable[[MockRequest], "MockResponse | Awaitable[MockResponse]"]
+
+
+class MockBackend:
+    """Minimal asyncio HTTP server with regex routing."""
+
+    def __init__(self, latency: float = 0.0, host: str = "127.0.0.1", port: int = 0):
+        self.latency = latency
+        self.host = host
+        self.port = port
+        self.routes: list[tuple[str, re.Pattern, Handler]] = []
+        self.connections = 0
+        self.requests = 0
+        self._server: asyncio.AbstractServer | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def route(self, method: str, pattern: str) -> Callable[[Handler], Handler]:
+        """Register a handler for ``method`` and a full-match path regex."""
+
+        def decorator(handler: Handler) -> Handler:
+            self.routes.append((method.upper(), re.compile(pattern), handler))
+            return handler
+
+        return decorator
+
+    async def __aenter__(self) -> "MockBackend":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.stop()
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._on_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.url
+
+    async def stop(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def dispatch(self, req: MockRequest) -> MockResponse:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        for method, pattern, handler in self.routes:
+            if method != req.method:
+                continue
+            match = pattern.fullmatch(req.path)
+            if match:
+                req.params = match.groupdict()
+                result = handler(req)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+        return MockResponse(404, {"message": f"No route for {req.method} {req.path}"})
+
+    @staticmethod
+    def _make_request(method: str, target: str, headers: dict, body: bytes) -> MockRequest:
+        parts = urlsplit(target)
+        return MockRequest(
+            method=method.upper(),
+            path=parts.path,
+            query=dict(parse_qsl(parts.query)),
+            headers=headers,
+            body=body,
+        )
+
+    async def _on_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        try:
+            first = await reader.readline()
+            if first == H2_PREFACE_LINE:
+                rest = await reader.readexactly(len(H2_PREFACE_REST))
+                await self._serve_h2(reader, writer, first + rest)
+            else:
+                await self._serve_h1(reader, writer, first)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    # HTTP/1.1
+
+    async def _serve_h1(self, reader, writer, request_line: bytes):
+        while request_line:
+            method, target, _ = request_line.decode().split(" ", 2)
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode().partition(":")
+                headers[name.strip().lower()] = value.strip()
+            length = int(headers.get("content-length", 0))
+            body = await reader.readexactly(length) if length else b""
+
+            resp = await self.dispatch(self._make_request(method, target, headers, body))
+            payload = resp.encode()
+            head = [f"HTTP/1.1 {resp.status} X", f"Content-Length: {len(payload)}"]
+            head += ["Content-Type: application/json", "Connection: keep-alive"]
+            head += [f"{k}: {v}" for k, v in resp.headers.items()]
+            writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + payload)
+            await writer.drain()
+
+            if headers.get("connection", "").lower() == "close":
+                break
+            request_line = await reader.readline()
+
+    # HTTP/2 (h2c, prior knowledge)
+
+    async def _serve_h2(self, reader, writer, preface: bytes):
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        conn.initiate_connection()
+        streams: dict[int, tuple[dict, bytearray]] = {}
+        window_open = asyncio.Event()
+        tasks: set[asyncio.Task] = set()
+
+        def flush():
+            data = conn.data_to_send()
+            if data:
+                writer.write(data)
+
+        async def respond(stream_id: int, headers: dict, body: bytes):
+            req = self._make_request(headers[":method"], headers[":path"], headers, body)
+            resp = await self.dispatch(req)
+            payload = resp.encode()
+            conn.send_headers(
+                stream_id,
+                [
+                    (":status", str(resp.status)),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(payload))),
+                    *resp.headers.items(),
+                ],
+            )
+            view = memoryview(payload)
+            while view:
+                window = min(
+                    conn.local_flow_control_window(stream_id), conn.max_outbound_frame_size
+                )
+                if window <= 0:
+                    window_open.clear()
+                    await window_open.wait()
+                    continue
+                conn.send_data(stream_id, bytes(view[:window]))
+                view = view[window:]
+                flush()
+            conn.end_stream(stream_id)
+            flush()
+            await writer.drain()
+
+        events = conn.receive_data(preface)
+        while True:
+            for event in events:
+                if isinstance(event, h2.events.RequestReceived):
+                    streams[event.stream_id] = (dict(event.headers), bytearray())
+                elif isinstance(event, h2.events.DataReceived):
+                    streams[event.stream_id][1].extend(event.data)
+                    conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, h2.events.WindowUpdated):
+                    window_open.set()
+                elif isinstance(event, h2.events.StreamEnded):
+                    headers, body = streams.pop(event.stream_id)
+                    task = asyncio.create_task(respond(event.stream_id, headers, bytes(body)))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    flush()
+                    return
+            flush()
+            await writer.drain()
+            data = await reader.read(65535)
+            if not data:
+                return
+            events = conn.receive_data(data)
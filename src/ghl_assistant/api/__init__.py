@@ -17,21 +17,67 @@ Usage:
         # And more...
 """
 
-from .client import GHLClient, GHLConfig
+from .client import GHLClient, GHLConfig, PoolConfig
 from .contacts import ContactsAPI
 from .workflows import WorkflowsAPI
 from .calendars import CalendarsAPI
 from .forms import FormsAPI
-from .opportunities import OpportunitiesAPI
+from .opportunities import OpportunitiesAPI, ShardProgress
 from .conversations import ConversationsAPI
+from .bulk import UpsertReport, UpsertResult
+from .cache import CacheConfig, CacheStats, ResponseCache
+from .contact_index import ContactIndex
+from .contact_state import ContactStateCache, ContactStateConfig
+from .custom_fields import CustomField, CustomFieldError, CustomFieldResolver
+from .diff import DiffReport
+from .disk_cache import PersistentCache
+from .enrollment import EnrollmentReport
+from .exporter import ExportReport
+from .importer import ImportReport
+from .journal import Journal
+from .ratelimit import RateLimitConfig, RateLimiter
+from .replica import ContactReplica, SyncReport
+from .retry import RetryMetrics, RetryPolicy
+from .tags import TagBuffer, TagFlushReport
+from .write_behind import WriteBehindBuffer, WriteBehindConfig, WriteBehindStats
 
 __all__ = [
     "GHLClient",
     "GHLConfig",
+    "PoolConfig",
     "ContactsAPI",
     "WorkflowsAPI",
     "CalendarsAPI",
     "FormsAPI",
     "OpportunitiesAPI",
+    "ShardProgress",
     "ConversationsAPI",
+    "UpsertReport",
+    "UpsertResult",
+    "CacheConfig",
+    "CacheStats",
+    "ResponseCache",
+    "ContactIndex",
+    "ContactStateCache",
+    "ContactStateConfig",
+    "CustomField",
+    "CustomFieldError",
+    "CustomFieldResolver",
+    "DiffReport",
+    "PersistentCache",
+    "EnrollmentReport",
+    "ExportReport",
+    "ImportReport",
+    "Journal",
+    "RateLimitConfig",
+    "RateLimiter",
+    "ContactReplica",
+    "SyncReport",
+    "RetryMetrics",
+    "RetryPolicy",
+    "TagBuffer",
+    "TagFlushReport",
+    "WriteBehindBuffer",
+    "WriteBehindConfig",
+    "WriteBehindStats",
 ]
@@ -0,0 +1,322 @@
+"""Bulk upsert - Create or update many contacts, deduplicated on email and phone.
+
+Rows are plain contact dicts in API (camelCase) form:
+
+    {"firstName": "Jane", "email": "Jane@Example.com", "phone": "(555) 123-4567",
+     "tags": ["imported"], "customFields": [...]}
+
+Each row's email and phone are normalized (see ``normalize``) and matched
+against existing contacts. Matches become updates, everything else a create.
+Existing contacts are resolved in batch: by scanning the location once into
+a local key index when that is cheaper than one search per row, otherwise by
+concurrent per-row searches. Rows sharing a key (within the input or with a
+contact created earlier in the run) are serialized on that key, so the same
+person is never created twice. With ``merge_tags`` (the default) an update
+adds the row's tags through the per-contact tag endpoint rather than
+rewriting the contact's tag list.
+
+Usage:
+    report = await ghl.contacts.bulk_upsert(rows, concurrency=10)
+    print(report.summary())
+    for result in report.failed:
+        print(result.row, result.error)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterable, TYPE_CHECKING
+
+import httpx
+
+from .normalize import normalize_email, normalize_phone
+from .tags import write_tags
+
+if TYPE_CHECKING:
+    from .contacts import ContactsAPI
+
+RESOLVE_MODES = ("auto", "scan", "search", "none")
+
+
+@dataclass
+class UpsertResult:
+    """Outcome of one input row."""
+
+    row: int
+    action: str  # "created", "updated", "skipped" or "failed"
+    contact_id: str | None = None
+    matched_on: str | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "row": self.row,
+            "action": self.action,
+            "contact_id": self.contact_id,
+            "matched_on": self.matched_on,
+            "error": self.error,
+        }
+
+
+@dataclass
+class UpsertReport:
+    """Per-row results and totals of a bulk upsert."""
+
+    results: list[UpsertResult] = field(default_factory=list)
+    resolve_mode: str = "none"
+    lookups: int = 0
+    elapsed: float = 0.0
+
+    def count(self, action: str) -> int:
+        return sum(1 for r in self.results if r.action == action)
+
+    @property
+    def created(self) -> int:
+        return self.count("created")
+
+    @property
+    def updated(self) -> int:
+        return self.count("updated")
+
+    @property
+    def skipped(self) -> int:
+        return self.count("skipped")
+
+    @property
+    def failed(self) -> list[UpsertResult]:
+        return [r for r in self.results if r.action == "failed"]
+
+    @property
+    def rows_per_second(self) -> float:
+        return len(self.results) / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{len(self.results)} rows in {self.elapsed:.1f}s "
+            f"({self.rows_per_second:.0f} rows/s): {self.created} created, "
+            f"{self.updated} updated, {self.skipped} skipped, {len(self.failed)} failed"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "rows": len(self.results),
+            "created": self.created,
+            "updated": self.updated,
+            "skipped": self.skipped,
+            "failed": len(self.failed),
+            "resolve_mode": self.resolve_mode,
+            "lookups": self.lookups,
+            "elapsed": round(self.elapsed, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+            "results": [r.to_dict() for r in self.results],
+        }
+
+
+def row_keys(
+    row: dict[str, Any], match_on: tuple[str, ...], default_country_code: str = "1"
+) -> list[tuple[str, str]]:
+    """Normalized (field, value) match keys of a row, in ``match_on`` order."""
+    keys = []
+    for name in match_on:
+        if name == "email":
+            value = normalize_email(row.get("email"))
+        elif name == "phone":
+            value = normalize_phone(row.get("phone"), default_country_code)
+        else:
+            raise ValueError(f"Cannot match on {name!r} (choose from email, phone)")
+        if value:
+            keys.append((name, value))
+    return keys
+
+
+class _KeyIndex:
+    """Normalized key -> (contact ID, tags) for contacts known to exist."""
+
+    def __init__(self):
+        self._entries: dict[tuple[str, str], tuple[str, tuple[str, ...]]] = {}
+
+    def add(self, contact: Any, default_country_code: str) -> None:
+        get = contact.get
+        cid = get("id")
+        if not cid:
+            return
+        tags = tuple(get("tags") or ())
+        email = normalize_email(get("email"))
+        phone = normalize_phone(get("phone"), default_country_code)
+        if email:
+            self._entries[("email", email)] = (cid, tags)
+        if phone:
+            self._entries[("phone", phone)] = (cid, tags)
+
+    def put(self, key: tuple[str, str], cid: str, tags: tuple[str, ...]) -> None:
+        self._entries[key] = (cid, tags)
+
+    def get(self, key: tuple[str, str]) -> tuple[str, tuple[str, ...]] | None:
+        return self._entries.get(key)
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class BulkUpserter:
+    """Runs one bulk upsert against a location. Use ``ContactsAPI.bulk_upsert``."""
+
+    def __init__(
+        self,
+        contacts: "ContactsAPI",
+        location_id: str,
+        match_on: tuple[str, ...] = ("email", "phone"),
+        concurrency: int = 10,
+        batch_size: int = 1000,
+        resolve: str = "auto",
+        merge_tags: bool = True,
+        default_country_code: str = "1",
+    ):
+        if resolve not in RESOLVE_MODES:
+            raise ValueError(f"Unknown resolve mode: {resolve} (choose from {RESOLVE_MODES})")
+        self.contacts = contacts
+        self.location_id = location_id
+        self.match_on = match_on
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.resolve = resolve
+        self.merge_tags = merge_tags
+        self.default_country_code = default_country_code
+
+        self._index = _KeyIndex()
+        self._searched: set[tuple[str, str]] = set()
+        self._locks: dict[tuple[str, str], asyncio.Lock] = {}
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.report = UpsertReport(resolve_mode=resolve)
+
+    async def run(self, rows: Iterable[dict[str, Any]]) -> UpsertReport:
+        start = time.perf_counter()
+        if self.resolve == "scan":
+            await self._scan()
+        batch: list[tuple[int, dict[str, Any]]] = []
+        for i, row in enumerate(rows):
+            batch.append((i, row))
+            if len(batch) >= self.batch_size:
+                await self._run_batch(batch)
+                batch = []
+        if batch:
+            await self._run_batch(batch)
+        self.report.elapsed = time.perf_counter() - start
+        return self.report
+
+    async def _run_batch(self, batch: list[tuple[int, dict[str, Any]]]) -> None:
+        if self.report.resolve_mode == "auto":
+            await self._choose_mode(len(batch))
+        results = await asyncio.gather(*(self._upsert(i, row) for i, row in batch))
+        self.report.results.extend(results)
+        self._locks.clear()
+
+    async def _choose_mode(self, batch_rows: int) -> None:
+        """Scan the location if that takes fewer requests than searching this batch."""
+        first = await self.contacts.list(limit=1, location_id=self.location_id)
+        self.report.lookups += 1
+        total = (first.get("meta") or {}).get("total") or 0
+        scan_requests = -(-total // 100)
+        if scan_requests <= batch_rows:
+            await self._scan()
+        else:
+            self.report.resolve_mode = "search"
+
+    async def _scan(self) -> None:
+        self.report.resolve_mode = "scan"
+        async for page in self.contacts.iter_pages(
+            location_id=self.location_id, as_records=True
+        ):
+            self.report.lookups += 1
+            for contact in page.get("contacts") or []:
+                self._index.add(contact, self.default_country_code)
+
+    async def _search(self, key: tuple[str, str]) -> None:
+        """Look a key up remotely once per run (search mode)."""
+        if key in self._searched or key in self._index:
+            return
+        self._searched.add(key)
+        name, value = key
+        self.report.lookups += 1
+        if name == "email":
+            contact = await self.contacts.find_by_email(value, location_id=self.location_id)
+        else:
+            contact = await self.contacts.find_by_phone(value, location_id=self.location_id)
+        if contact:
+            self._index.add(contact, self.default_country_code)
+            self._index.put(key, contact["id"], tuple(contact.get("tags") or ()))
+
+    async def _upsert(self, i: int, row: dict[str, Any]) -> UpsertResult:
+        try:
+            keys = row_keys(row, self.match_on, self.default_country_code)
+        except ValueError as e:
+            return UpsertResult(i, "failed", error=str(e))
+        if not keys and not (row.get("firstName") or row.get("lastName") or row.get("name")):
+            return UpsertResult(i, "skipped", error="row has no email, phone or name")
+
+        # Serialize rows that share a key; lock in sorted order to avoid deadlock
+        locks = [self._locks.setdefault(key, asyncio.Lock()) for key in sorted(keys)]
+        for lock in locks:
+            await lock.acquire()
+        try:
+            async with self._semaphore:
+                return await self._write(i, row, keys)
+        except Exception as e:
+            # One bad row must not abort a 500k-row run; report it and move on
+            return UpsertResult(i, "failed", error=_describe(e))
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    async def _write(
+        self, i: int, row: dict[str, Any], keys: list[tuple[str, str]]
+    ) -> UpsertResult:
+        if self.report.resolve_mode == "search":
+            for key in keys:
+                await self._search(key)
+
+        match = next(((key, self._index.get(key)) for key in keys if key in self._index), None)
+        data = dict(row)
+        for name, value in keys:
+            data[name] = value
+        data.pop("id", None)
+        data.pop("locationId", None)
+        if "customFields" in data:
+            # Resolved (names/keys to IDs) and validated by create/update
+            data["custom_fields"] = data.pop("customFields")
+
+        if match is None:
+            result = await self.contacts.create(location_id=self.location_id, **data)
+            contact = result.get("contact") or {}
+            cid = contact.get("id")
+            tags = tuple(contact.get("tags") or data.get("tags") or ())
+            action, matched_on = "created", None
+        else:
+            (matched_on, _), (cid, existing_tags) = match
+            tags = existing_tags
+            new_tags = (data.pop("tags", None) or []) if self.merge_tags else []
+            if data:
+                await self.contacts.update(cid, location_id=self.location_id, **data)
+                if "tags" in data:
+                    tags = tuple(data["tags"] or ())
+            if new_tags:
+                # Send only the additions, so tags changed by others since the scan survive
+                result = await write_tags(self.contacts, cid, {t: True for t in new_tags})
+                tags = tuple(result.get("tags") or tags)
+            action = "updated"
+
+        if cid:
+            for key in keys:
+                self._index.put(key, cid, tags)
+        return UpsertResult(i, action, contact_id=cid, matched_on=matched_on)
+
+
+def _describe(error: Exception) -> str:
+    if isinstance(error, httpx.HTTPStatusError):
+        return f"HTTP {error.response.status_code}: {error.response.text[:200]}"
+    return str(error) or type(error).__name__
@@ -0,0 +1,180 @@
+"""Response cache - TTL/LRU cache for rarely changing reference data.
+
+Locations, pipelines, calendars, workflows, forms, custom fields and custom
+values change rarely but are read constantly. Each of these endpoint families
+gets its own TTL; entries are evicted least-recently-used once ``max_entries``
+is reached, and any write the same client makes to a family drops that
+family's entries.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import httpx
+
+
+@dataclass(frozen=True)
+class CacheFamily:
+    """A group of endpoints cached and invalidated together."""
+
+    name: str
+    pattern: str
+    ttl: float
+
+    def matches(self, endpoint: str) -> bool:
+        return re.match(self.pattern, endpoint.split("?", 1)[0]) is not None
+
+
+DEFAULT_FAMILIES: tuple[CacheFamily, ...] = (
+    CacheFamily("locations", r"^/locations/(?:search|[^/]+)/?$", 3600),
+    CacheFamily("pipelines", r"^/opportunities/pipelines(?:/|$)", 600),
+    CacheFamily("calendars", r"^/calendars/(?!slots|appointments)(?:[^/]+/?)?$", 600),
+    CacheFamily("workflows", r"^/workflows/(?:[^/]+/?)?$", 300),
+    CacheFamily("forms", r"^/forms/(?!submissions)(?:[^/]+/?)?$", 600),
+    CacheFamily("custom_fields", r"^/locations/[^/]+/customFields(?:/|$)", 900),
+    CacheFamily("custom_values", r"^/locations/[^/]+/customValues(?:/|$)", 900),
+)
+
+
+@dataclass
+class CacheConfig:
+    """Response cache settings for a GHLClient.
+
+    Attributes:
+        max_entries: LRU bound across all families
+        ttl: Per-family TTL overrides in seconds, e.g. {"workflows": 60}
+        families: Endpoint families eligible for caching
+    """
+
+    max_entries: int = 512
+    ttl: dict[str, float] = field(default_factory=dict)
+    families: tuple[CacheFamily, ...] = DEFAULT_FAMILIES
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters, overall and per family."""
+
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    by_family: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    def record(self, family: str, outcome: str) -> None:
+        counts = self.by_family.setdefault(family, {"hits": 0, "misses": 0})
+        counts[outcome] += 1
+        if outcome == "hits":
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 3),
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "by_family": {k: dict(v) for k, v in self.by_family.items()},
+        }
+
+
+def match_family(families: tuple[CacheFamily, ...], endpoint: str) -> CacheFamily | None:
+    """Return the first family an endpoint belongs to, if any."""
+    for family in families:
+        if family.matches(endpoint):
+            return family
+    return None
+
+
+class ResponseCache:
+    """In-memory TTL/LRU cache of GET responses, keyed by path and params.
+
+    Usage:
+        cache = ResponseCache(CacheConfig(ttl={"workflows": 60}))
+        resp = cache.get(key, "/workflows/")
+        if resp is None:
+            generation = cache.generation("/workflows/")
+            resp = await fetch()
+            cache.put(key, "/workflows/", resp, generation)
+    """
+
+    def __init__(self, config: CacheConfig | None = None):
+        self.config = config or CacheConfig()
+        self.stats = CacheStats()
+        self._entries: OrderedDict[tuple, tuple[float, str, httpx.Response]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+
+    def family_for(self, endpoint: str) -> CacheFamily | None:
+        """Return the cache family an endpoint belongs to, if any."""
+        return match_family(self.config.families, endpoint)
+
+    def ttl(self, family: CacheFamily) -> float:
+        return self.config.ttl.get(family.name, family.ttl)
+
+    def generation(self, endpoint: str) -> int:
+        """Invalidation counter for the endpoint's family.
+
+        Capture it before fetching and pass it to ``put`` so a response that was
+        in flight while the family was written to is not cached.
+        """
+        family = self.family_for(endpoint)
+        return self._generations.get(family.name, 0) if family else 0
+
+    def get(self, key: tuple, endpoint: str) -> httpx.Response | None:
+        """Return a fresh cached response, or None (counted as a miss)."""
+        family = self.family_for(endpoint)
+        if family is None:
+            return None
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.stats.record(family.name, "hits")
+            return entry[2]
+        if entry is not None:
+            del self._entries[key]
+        self.stats.record(family.name, "misses")
+        return None
+
+    def put(self, key: tuple, endpoint: str, resp: httpx.Response, generation: int) -> None:
+        """Cache a response if its endpoint is cacheable and still current."""
+        family = self.family_for(endpoint)
+        if family is None or self._generations.get(family.name, 0) != generation:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl(family), family.name, resp)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.config.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, endpoint: str) -> None:
+        """Drop every entry in the family a write to ``endpoint`` touches."""
+        family = self.family_for(endpoint)
+        if family is None:
+            return
+        self._generations[family.name] = self._generations.get(family.name, 0) + 1
+        stale = [key for key, entry in self._entries.items() if entry[1] == family.name]
+        for key in stale:
+            del self._entries[key]
+        self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        for family in self.config.families:
+            self._generations[family.name] = self._generations.get(family.name, 0) + 1
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any, TYPE_CHECKING
 
+from ..models import Appointment
+
 if TYPE_CHECKING:
     from .client import GHLClient
 
@@ -95,6 +97,7 @@ class CalendarsAPI:
         start_date: str | None = None,
         end_date: str | None = None,
         location_id: str | None = None,
+        as_records: bool = False,
     ) -> dict[str, Any]:
         """Get appointments.
 
@@ -104,6 +107,7 @@ class CalendarsAPI:
             start_date: Filter by start date
             end_date: Filter by end date
             location_id: Override default location
+            as_records: Return appointments as compact ``Appointment`` records
 
         Returns:
             {"appointments": [...]}
@@ -119,7 +123,8 @@ class CalendarsAPI:
         if end_date:
             params["endDate"] = end_date
 
-        return await self._client._get("/calendars/appointments", **params)
+        result = await self._client._get("/calendars/appointments", **params)
+        return Appointment.from_page(result, "appointments") if as_records else result
 
     async def book(
         self,
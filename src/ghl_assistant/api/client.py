@@ -5,14 +5,39 @@ Based on reverse-engineered endpoints from browser traffic capture.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
 
 import httpx
 
+from .. import codec
+from .cache import CacheConfig, ResponseCache
+from .contact_index import ContactIndex
+from .contact_state import ContactStateCache, ContactStateConfig
+from .custom_fields import CustomFieldResolver
+from .disk_cache import PersistentCache
+from .ratelimit import RateLimitConfig, RateLimiter, parse_retry_after
+from .retry import (
+    NOT_SENT_ERRORS,
+    IdempotencyGuard,
+    RetryMetrics,
+    RetryPolicy,
+    failure_reason,
+)
+from .session import (
+    ID_FIELDS,
+    extract_ids,
+    latest_session,
+    load_profile,
+    load_resolved_ids,
+    save_resolved_ids,
+    write_profile,
+)
+from .write_behind import WriteBehindBuffer, WriteBehindConfig
+
 if TYPE_CHECKING:
     from .contacts import ContactsAPI
     from .workflows import WorkflowsAPI
@@ -21,6 +46,9 @@ if TYPE_CHECKING:
     from .opportunities import OpportunitiesAPI
     from .conversations import ConversationsAPI
 
+# The location a /locations/{id}/... endpoint addresses (not /locations/search)
+LOCATION_PATH_RE = re.compile(r"^/locations/(?!search(?:/|$))([^/]+)")
+
 
 @dataclass
 class GHLConfig:
@@ -30,57 +58,43 @@ class GHLConfig:
     user_id: str | None = None
     company_id: str | None = None
     location_id: str | None = None
+    session_dir: str | None = None
 
     @classmethod
     def from_session_file(cls, filepath: str | Path | None = None) -> "GHLConfig":
         """Load config from a captured session file.
 
-        If no filepath provided, uses the most recent session.
+        If no filepath provided, uses the most recent session. Reads the
+        session's compact credential profile; the full session file is only
+        parsed (once) for sessions captured before profiles existed.
         """
         if filepath is None:
-            # Find most recent session
-            log_dir = Path(__file__).parent.parent.parent.parent / "data" / "network_logs"
-            sessions = sorted(log_dir.glob("session_*.json"))
-            if not sessions:
-                raise FileNotFoundError(
-                    "No session files found. Run 'ghl auth login' first."
-                )
-            filepath = sessions[-1]
-
-        with open(filepath) as f:
-            data = json.load(f)
-
-        token = data.get("auth", {}).get("access_token")
-        if not token:
-            raise ValueError("No access token found in session file")
-
-        # Extract IDs from API calls
-        user_id = None
-        company_id = None
-        location_id = None
-
-        for call in data.get("api_calls", []):
-            url = call.get("url", "")
-            if "/users/" in url and not user_id:
-                parts = url.split("/users/")
-                if len(parts) > 1:
-                    uid = parts[1].split("/")[0].split("?")[0]
-                    if uid and uid != "identify":
-                        user_id = uid
-            if "companyId=" in url and not company_id:
-                match = re.search(r"companyId=([a-zA-Z0-9]+)", url)
-                if match:
-                    company_id = match.group(1)
-            if "locationId=" in url and not location_id:
-                match = re.search(r"locationId=([a-zA-Z0-9]+)", url)
-                if match and match.group(1) != "undefined":
-                    location_id = match.group(1)
+            filepath = latest_session()
+
+        profile = load_profile(filepath)
+        if profile is None:
+            with open(filepath, "rb") as f:
+                data = codec.loads(f.read())
+
+            token = data.get("auth", {}).get("access_token")
+            if not token:
+                raise ValueError("No access token found in session file")
+
+            # Extract IDs from API calls and keep them for next time
+            ids = extract_ids(data.get("api_calls", []))
+            profile = write_profile(filepath, token, ids, data.get("captured_at"))
+
+        token = profile["token"]
+        session_dir = Path(filepath).parent
+        ids = {key: profile.get(key) for key in ID_FIELDS}
+        ids.update(load_resolved_ids(token, session_dir))
 
         return cls(
             token=token,
-            user_id=user_id,
-            company_id=company_id,
-            location_id=location_id,
+            user_id=ids.get("user_id"),
+            company_id=ids.get("company_id"),
+            location_id=ids.get("location_id"),
+            session_dir=str(session_dir),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -93,6 +107,32 @@ class GHLConfig:
         }
 
 
+@dataclass
+class PoolConfig:
+    """HTTP connection pool settings for GHLClient.
+
+    Attributes:
+        max_connections: Upper bound on open connections
+        max_keepalive_connections: Idle connections kept for reuse
+        keepalive_expiry: Seconds an idle connection is kept open
+        http2: Multiplex concurrent requests over HTTP/2 (requires the ``h2`` package)
+        timeout: Per-request timeout in seconds
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    timeout: float = 30.0
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
 class GHLClient:
     """GoHighLevel API client with domain-specific sub-APIs.
 
@@ -104,6 +144,49 @@ class GHLClient:
 
             workflows = await ghl.workflows.list()
             calendars = await ghl.calendars.list()
+
+    All requests are scheduled through a token-bucket rate limiter that
+    follows GHL's rate-limit headers. Tune or disable it per client:
+
+        GHLClient(config, rate_limit=RateLimitConfig(burst=50, headroom=0.8))
+        GHLClient(config, rate_limit=RateLimitConfig(enabled=False))
+
+    Transient failures (502/503/504, connection resets) are retried with
+    jittered exponential backoff according to ``retry``; see ``retry_metrics``.
+
+    Connection pooling and HTTP/2 are configured with ``pool``:
+
+        GHLClient(config, pool=PoolConfig(max_connections=20, http2=True))
+
+    Request and response bodies go through ``ghl_assistant.codec``, which uses
+    orjson or msgspec when installed.
+
+    Concurrent identical GETs (same path and params) share one in-flight
+    request unless ``coalesce_gets=False``; see ``coalesced_gets``.
+
+    Reference data (pipelines, calendars, workflows, forms, custom fields and
+    values) can be cached in memory by passing ``cache=CacheConfig()``; writes
+    through this client invalidate the affected family. See ``cache.stats``.
+
+    ``persistent_cache=True`` (or a path) additionally keeps those responses in
+    a SQLite cache under ``data/cache/`` shared by every process, revalidating
+    stale entries with conditional requests. See ``persistent_cache.stats``.
+
+    Contacts read or written through this client are remembered briefly in
+    ``contact_state`` so diff-based updates can skip re-reading them;
+    tune or disable with ``contact_state=ContactStateConfig(...)``.
+
+    ``contact_index=True`` (or a path) opens a local email/phone index for the
+    location under ``data/cache/contact_index/``; ``find_by_email`` and
+    ``find_by_phone`` consult it before searching. See ``contact_index.sync``.
+
+    Custom field names and keys are translated to IDs by ``custom_fields``,
+    which loads each location's definitions once; ``contacts.create`` and
+    ``contacts.update`` accept ``custom_fields={"Plan": "gold"}``.
+
+    ``write_behind=WriteBehindConfig()`` enables ``write_behind``, which merges
+    each contact's mutations within a short window into one update; anything
+    still pending is flushed when the client exits.
     """
 
     BASE_URL = "https://backend.leadconnectorhq.com"
@@ -114,10 +197,50 @@ class GHLClient:
         "source": "WEB_USER",
     }
 
-    def __init__(self, config: GHLConfig):
+    def __init__(
+        self,
+        config: GHLConfig,
+        rate_limit: RateLimitConfig | None = None,
+        retry: RetryPolicy | None = None,
+        pool: PoolConfig | None = None,
+        base_url: str | None = None,
+        coalesce_gets: bool = True,
+        cache: CacheConfig | None = None,
+        persistent_cache: bool | str | Path = False,
+        contact_state: ContactStateConfig | None = None,
+        contact_index: bool | str | Path = False,
+        write_behind: WriteBehindConfig | None = None,
+    ):
         self.config = config
+        self.pool = pool or PoolConfig()
+        self.base_url = base_url or self.BASE_URL
         self._client: httpx.AsyncClient | None = None
 
+        self.coalesce_gets = coalesce_gets
+        self.coalesced_gets = 0
+        self._inflight: dict[tuple, tuple[int, asyncio.Future[httpx.Response]]] = {}
+        self._writes = 0  # Completed writes; GETs never join a request older than one
+        self.cache: ResponseCache | None = ResponseCache(cache) if cache is not None else None
+        self.persistent_cache: PersistentCache | None = None
+        if persistent_cache:
+            self.persistent_cache = PersistentCache(
+                None if persistent_cache is True else persistent_cache, config=cache
+            )
+        self.contact_state = ContactStateCache(contact_state)
+        self.custom_fields = CustomFieldResolver(self)
+        self._contact_index_path = contact_index
+        self.contact_index: ContactIndex | None = None
+        self.write_behind: WriteBehindBuffer | None = (
+            WriteBehindBuffer(self, write_behind) if write_behind is not None else None
+        )
+
+        rate_limit = rate_limit or RateLimitConfig()
+        self.rate_limiter: RateLimiter | None = (
+            RateLimiter(rate_limit) if rate_limit.enabled else None
+        )
+        self.retry_policy = retry or RetryPolicy()
+        self.retry_metrics = RetryMetrics()
+
         # Domain APIs (initialized on enter)
         self._contacts: ContactsAPI | None = None
         self._workflows: WorkflowsAPI | None = None
@@ -127,15 +250,36 @@ class GHLClient:
         self._conversations: ConversationsAPI | None = None
 
     @classmethod
-    def from_session(cls, filepath: str | Path | None = None) -> "GHLClient":
-        """Create client from session file."""
+    def from_session(cls, filepath: str | Path | None = None, **kwargs) -> "GHLClient":
+        """Create client from session file.
+
+        Extra keyword arguments (e.g. ``rate_limit``, ``retry``, ``pool``) are
+        passed to the constructor.
+        """
         config = GHLConfig.from_session_file(filepath)
-        return cls(config)
+        return cls(config, **kwargs)
 
-    async def __aenter__(self) -> "GHLClient":
-        self._client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
-            timeout=30.0,
+    def _build_http_client(self) -> httpx.AsyncClient:
+        """Create the pooled httpx client used for every request."""
+        pool = self.pool
+        http1 = True
+        if pool.http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    "HTTP/2 requires the h2 package: pip install 'ghl-assistant[http2]'"
+                ) from e
+            # Plain-http endpoints (local mocks) have no TLS ALPN to negotiate
+            # HTTP/2, so speak it with prior knowledge.
+            http1 = not self.base_url.startswith("http://")
+
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=pool.timeout,
+            limits=pool.limits(),
+            http1=http1,
+            http2=pool.http2,
             headers={
                 "Authorization": f"Bearer {self.config.token}",
                 "Content-Type": "application/json",
@@ -144,6 +288,13 @@ class GHLClient:
             },
         )
 
+    async def __aenter__(self) -> "GHLClient":
+        self._client = self._build_http_client()
+        if self.persistent_cache is not None:
+            # Opened here, not in __init__, so an unentered client holds no connection;
+            # before location detection, whose search is itself cached
+            self.persistent_cache.open()
+
         # Initialize domain APIs
         from .contacts import ContactsAPI
         from .workflows import WorkflowsAPI
@@ -159,20 +310,50 @@ class GHLClient:
         self._opportunities = OpportunitiesAPI(self)
         self._conversations = ConversationsAPI(self)
 
-        # Auto-detect location if not set
+        # Auto-detect location if not set, reusing the last resolution
+        if not self.config.location_id:
+            cached = load_resolved_ids(self.config.token, self.config.session_dir)
+            self.config.user_id = self.config.user_id or cached.get("user_id")
+            self.config.company_id = self.config.company_id or cached.get("company_id")
+            self.config.location_id = cached.get("location_id")
         if not self.config.location_id and self.config.company_id:
             try:
                 locations = await self.search_locations()
                 if locations.get("locations"):
                     self.config.location_id = locations["locations"][0]["_id"]
+                    save_resolved_ids(
+                        self.config.token,
+                        {
+                            "user_id": self.config.user_id,
+                            "company_id": self.config.company_id,
+                            "location_id": self.config.location_id,
+                        },
+                        self.config.session_dir,
+                    )
             except Exception:
                 pass  # Location detection is optional
 
+        if self._contact_index_path and self.config.location_id and self.contact_index is None:
+            lid = self.config.location_id
+            path = self._contact_index_path
+            self.contact_index = ContactIndex(
+                lid, ContactIndex.default_path(lid) if path is True else path
+            )
+
         return self
 
     async def __aexit__(self, *args):
-        if self._client:
-            await self._client.aclose()
+        try:
+            if self.write_behind is not None and self._client:
+                await self.write_behind.flush()
+        finally:
+            if self._client:
+                await self._client.aclose()
+            if self.contact_index is not None:
+                self.contact_index.close()
+                self.contact_index = None
+            if self.persistent_cache is not None:
+                self.persistent_cache.close()
 
     # Domain API properties
     @property
@@ -218,29 +399,279 @@ class GHLClient:
         return self._conversations
 
     # HTTP methods
+    async def _send(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """Send a single request through the rate limiter.
+
+        429 responses are waited out (honoring ``Retry-After``) and re-sent up to
+        ``RateLimitConfig.max_429_retries`` times; the request was rejected, so
+        re-sending is safe for every verb.
+        """
+        limiter = self.rate_limiter
+        attempts = 0
+        while True:
+            if limiter:
+                await limiter.acquire()
+            resp = await self._client.request(method, endpoint, **kwargs)
+            if limiter:
+                limiter.update(resp.headers)
+                if resp.status_code == 429 and attempts < limiter.config.max_429_retries:
+                    attempts += 1
+                    limiter.penalize(
+                        parse_retry_after(
+                            resp.headers.get("retry-after"),
+                            limiter.config.default_retry_after,
+                        )
+                    )
+                    continue
+            return resp
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        idempotency_guard: IdempotencyGuard | None = None,
+        idempotent: bool = False,
+        retry_safe: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """Send a request, retrying transient failures per ``retry_policy``.
+
+        Writes invalidate the response cache family of ``endpoint`` and, for
+        custom field endpoints, the resolved custom field definitions.
+
+        Args:
+            method: HTTP verb
+            endpoint: Path relative to BASE_URL
+            idempotency_guard: For non-idempotent verbs, an async lookup run before
+                each re-send. It returns the record the failed attempt already
+                created (returned to the caller instead of re-sending) or None
+                when it is safe to send again.
+            idempotent: The request only reads (e.g. a POST search), so it may be
+                retried like a GET and does not invalidate caches
+            retry_safe: The write has the same effect when applied twice (e.g.
+                adding a tag), so it may be retried; caches are still invalidated
+            **kwargs: Passed to ``httpx.AsyncClient.request``
+        """
+        if idempotent:
+            return await self._request_with_retry(
+                method, endpoint, idempotency_guard, idempotent=True, **kwargs
+            )
+        if method.upper() != "GET":
+            try:
+                return await self._request_with_retry(
+                    method, endpoint, idempotency_guard, idempotent=retry_safe, **kwargs
+                )
+            finally:
+                # Invalidate even on failure: the write may have been applied
+                self._writes += 1
+                if self.cache is not None:
+                    self.cache.invalidate(endpoint)
+                disk = self.persistent_cache
+                if disk is not None and disk.family_for(endpoint) is not None:
+                    # Only resolve the scope (possibly decoding the body) for cached families
+                    scope = self._scope_for(endpoint, kwargs.get("params"), kwargs.get("content"))
+                    disk.invalidate(scope, endpoint)
+                self.custom_fields.invalidate_endpoint(endpoint)
+        return await self._request_with_retry(method, endpoint, idempotency_guard, **kwargs)
+
+    async def _request_with_retry(
+        self,
+        method: str,
+        endpoint: str,
+        idempotency_guard: IdempotencyGuard | None,
+        idempotent: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """Retry loop behind ``_request``."""
+        policy = self.retry_policy
+        metrics = self.retry_metrics
+        attempt = 0
+        while True:
+            attempt += 1
+            error: Exception | None = None
+            status: int | None = None
+            try:
+                resp = await self._send(method, endpoint, **kwargs)
+            except httpx.TransportError as e:
+                error = e
+            else:
+                status = resp.status_code
+                if status not in policy.retry_statuses:
+                    # 304 answers a conditional GET from the persistent cache
+                    if status != 304:
+                        resp.raise_for_status()
+                    if attempt > 1:
+                        metrics.recovered += 1
+                    return resp
+
+            transient = policy.enabled and policy.is_transient(error, status)
+            safe = (
+                idempotent
+                or method.upper() in policy.idempotent_methods
+                or isinstance(error, NOT_SENT_ERRORS)
+                or idempotency_guard is not None
+            )
+            if not (transient and safe):
+                metrics.not_retried += 1
+                return self._fail(error, resp if error is None else None)
+            if attempt >= policy.max_attempts:
+                metrics.give_ups += 1
+                return self._fail(error, resp if error is None else None)
+
+            delay = policy.backoff(attempt)
+            metrics.record_retry(failure_reason(error, status), delay)
+            await asyncio.sleep(delay)
+
+            if idempotency_guard is not None and not isinstance(error, NOT_SENT_ERRORS):
+                metrics.guard_checks += 1
+                existing = await idempotency_guard()
+                if existing is not None:
+                    metrics.guard_hits += 1
+                    return httpx.Response(
+                        200,
+                        content=codec.dumps(existing),
+                        request=httpx.Request(method, self._client.base_url.join(endpoint)),
+                    )
+
+    @staticmethod
+    def _fail(error: Exception | None, resp: httpx.Response | None) -> httpx.Response:
+        """Raise the final error of a request that will not be retried."""
+        if error is not None:
+            raise error
+        resp.raise_for_status()
+        return resp
+
+    @staticmethod
+    def _encode(data: dict | None) -> bytes | None:
+        """Encode a request body with the active JSON codec."""
+        return codec.dumps(data) if data is not None else None
+
     async def _get(self, endpoint: str, **params) -> dict[str, Any]:
         """Make GET request."""
-        resp = await self._client.get(endpoint, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        key = (endpoint, tuple(sorted((k, repr(v)) for k, v in params.items())))
+        cache = self.cache
+        resp = cache.get(key, endpoint) if cache is not None else None
+        if resp is None:
+            generation = cache.generation(endpoint) if cache is not None else 0
+            if self.coalesce_gets:
+                resp = await self._get_single_flight(key, endpoint, params)
+            else:
+                resp = await self._fetch(endpoint, params)
+            if cache is not None:
+                cache.put(key, endpoint, resp, generation)
+        # Each caller decodes its own copy, so callers may mutate results freely
+        return codec.loads(resp.content)
 
-    async def _post(self, endpoint: str, data: dict | None = None) -> dict[str, Any]:
-        """Make POST request."""
-        resp = await self._client.post(endpoint, json=data)
-        resp.raise_for_status()
-        return resp.json()
+    @property
+    def _cache_scope(self) -> str:
+        """Persistent cache partition: the location (or company) being accessed."""
+        return self.config.location_id or self.config.company_id or ""
+
+    def _scope_for(
+        self, endpoint: str, params: dict | None = None, content: bytes | None = None
+    ) -> str:
+        """Persistent cache partition for one request: the location it addresses.
+
+        Taken from a ``/locations/{id}`` path, else a ``locationId`` query
+        parameter or JSON body field, else the client's default scope.
+        """
+        match = LOCATION_PATH_RE.match(endpoint)
+        if match:
+            return match[1]
+        if params and params.get("locationId"):
+            return str(params["locationId"])
+        if content:
+            try:
+                body = codec.loads(content)
+            except codec.DecodeError:
+                body = None
+            if isinstance(body, dict) and body.get("locationId"):
+                return str(body["locationId"])
+        return self._cache_scope
+
+    async def _fetch(self, endpoint: str, params: dict) -> httpx.Response:
+        """GET through the persistent cache, when one is configured."""
+        disk = self.persistent_cache
+        family = disk.family_for(endpoint) if disk is not None else None
+        if family is None:
+            return await self._request("GET", endpoint, params=params)
+
+        scope = self._scope_for(endpoint, params)
+        entry = disk.lookup(scope, endpoint, params)
+        if entry is not None and entry.is_fresh(disk.ttl(family)):
+            disk.stats.record(family.name, "hits")
+            request = httpx.Request("GET", self._client.base_url.join(endpoint), params=params)
+            return entry.to_response(request)
+        disk.stats.record(family.name, "misses")
+
+        headers = entry.validators() if entry is not None else {}
+        resp = await self._request("GET", endpoint, params=params, headers=headers)
+        if resp.status_code == 304 and entry is not None:
+            disk.touch(scope, endpoint, params)
+            return entry.to_response(resp.request)
+        disk.store(scope, endpoint, params, family.name, resp)
+        return resp
+
+    async def _get_single_flight(
+        self, key: tuple, endpoint: str, params: dict
+    ) -> httpx.Response:
+        """Share one in-flight request between concurrent identical GETs.
+
+        A GET only joins a request started after the client's last completed
+        write, so it never returns data from before a write it was issued after.
+        """
+        entry = self._inflight.get(key)
+        if entry is None or entry[0] != self._writes:
+            inflight = asyncio.ensure_future(self._fetch(endpoint, params))
+            self._inflight[key] = (self._writes, inflight)
+
+            def done(future: asyncio.Future) -> None:
+                if self._inflight.get(key, (0, None))[1] is future:
+                    del self._inflight[key]
+                if not future.cancelled():
+                    future.exception()  # Mark retrieved if every waiter was cancelled
+
+            inflight.add_done_callback(done)
+        else:
+            inflight = entry[1]
+            self.coalesced_gets += 1
+        # Shield so one cancelled caller does not cancel the request for the others
+        return await asyncio.shield(inflight)
+
+    async def _post(
+        self,
+        endpoint: str,
+        data: dict | None = None,
+        idempotency_guard: IdempotencyGuard | None = None,
+        idempotent: bool = False,
+        retry_safe: bool = False,
+    ) -> dict[str, Any]:
+        """Make POST request.
+
+        POSTs are only retried after a transient failure when ``idempotency_guard``
+        confirms the first attempt did not take effect, when ``idempotent``
+        marks a read-only POST such as a search, or when ``retry_safe`` marks a
+        write that is harmless to apply twice.
+        """
+        resp = await self._request(
+            "POST",
+            endpoint,
+            idempotency_guard=idempotency_guard,
+            idempotent=idempotent,
+            retry_safe=retry_safe,
+            content=self._encode(data),
+        )
+        return codec.loads(resp.content)
 
     async def _put(self, endpoint: str, data: dict | None = None) -> dict[str, Any]:
         """Make PUT request."""
-        resp = await self._client.put(endpoint, json=data)
-        resp.raise_for_status()
-        return resp.json()
+        resp = await self._request("PUT", endpoint, content=self._encode(data))
+        return codec.loads(resp.content)
 
-    async def _delete(self, endpoint: str) -> dict[str, Any]:
-        """Make DELETE request."""
-        resp = await self._client.delete(endpoint)
-        resp.raise_for_status()
-        return resp.json()
+    async def _delete(self, endpoint: str, data: dict | None = None) -> dict[str, Any]:
+        """Make DELETE request (with a JSON body when ``data`` is given)."""
+        resp = await self._request("DELETE", endpoint, content=self._encode(data))
+        return codec.loads(resp.content)
 
     # User & Company
     async def get_user(self, user_id: str | None = None) -> dict[str, Any]:
@@ -0,0 +1,298 @@
+"""Contact index - Local email/phone to contact ID lookup.
+
+``find_by_email`` and ``find_by_phone`` run a remote full-text search per
+call. This index maps normalized emails and E.164 phones to contact IDs for
+one location so lookups are answered locally. It stores IDs, not contacts:
+``lookup_email``/``lookup_phone`` cost no request, while a ``find_by_*`` hit
+replaces the search with one GET of the contact (skipped when the client's
+``contact_state`` holds it), which also checks the entry is not stale.
+
+- Built by one full scan of the location, then kept fresh by incremental
+  syncs that fetch only contacts updated since the last checkpoint.
+- Written through by ``ContactsAPI.create/update/delete``.
+- Recent keys live in memory; beyond ``max_memory_keys`` they spill to a
+  SQLite file, which also persists the index and its checkpoint between runs.
+
+Usage:
+    async with GHLClient.from_session(contact_index=True) as ghl:
+        await ghl.contact_index.sync(ghl.contacts)       # full first, then incremental
+        cid = ghl.contact_index.lookup_email("Jane@Example.com")   # no request
+        contact = await ghl.contacts.find_by_email("jane@example.com")  # index, then search
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, TYPE_CHECKING
+
+from .disk_cache import DATA_DIR
+from .normalize import normalize_email, normalize_phone
+
+if TYPE_CHECKING:
+    from .contacts import ContactsAPI
+
+DEFAULT_INDEX_DIR = DATA_DIR / "cache" / "contact_index"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS contact_keys (
+    key TEXT PRIMARY KEY,
+    contact_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS contact_keys_id ON contact_keys (contact_id);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+@dataclass
+class ContactIndexStats:
+    hits: int = 0
+    misses: int = 0
+    spills: int = 0
+    synced: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "spills": self.spills,
+            "synced": self.synced,
+        }
+
+
+def _email_key(email: str | None) -> str | None:
+    email = normalize_email(email)
+    return "e:" + email if email else None
+
+
+def _phone_key(phone: str | None, default_country_code: str) -> str | None:
+    phone = normalize_phone(phone, default_country_code)
+    return "p:" + phone if phone else None
+
+
+class ContactIndex:
+    """Normalized email/phone -> contact ID for one location.
+
+    Args:
+        location_id: Location whose contacts are indexed
+        path: SQLite file for spilled keys and the checkpoint; a temporary
+            file (not persisted) if None
+        max_memory_keys: Keys held in memory before spilling to SQLite
+        default_country_code: Calling code for phones without one
+    """
+
+    def __init__(
+        self,
+        location_id: str,
+        path: str | Path | None = None,
+        max_memory_keys: int = 200_000,
+        default_country_code: str = "1",
+    ):
+        self.location_id = location_id
+        self.max_memory_keys = max_memory_keys
+        self.default_country_code = default_country_code
+        self.stats = ContactIndexStats()
+
+        self._temp = None
+        if path is None:
+            self._temp = tempfile.NamedTemporaryFile(prefix="ghl_index_", suffix=".sqlite")
+            path = self._temp.name
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        # Scratch table for counting in-memory keys against spilled ones
+        self._db.execute("CREATE TEMP TABLE memory_keys (key TEXT PRIMARY KEY)")
+
+        # Keys not yet spilled, and their reverse mapping for updates/deletes
+        self._keys: dict[str, str] = {}
+        self._by_id: dict[str, tuple[str, ...]] = {}
+        self._spilled = bool(self._db.execute("SELECT 1 FROM contact_keys LIMIT 1").fetchone())
+
+    @classmethod
+    def default_path(cls, location_id: str) -> Path:
+        return DEFAULT_INDEX_DIR / f"{location_id}.sqlite"
+
+    # ---------------------------------------------------------------------
+    # Lookups
+    # ---------------------------------------------------------------------
+
+    def _lookup(self, key: str | None) -> str | None:
+        if key is None:
+            return None
+        cid = self._keys.get(key)
+        if cid is None and self._spilled:
+            row = self._db.execute(
+                "SELECT contact_id FROM contact_keys WHERE key = ?", (key,)
+            ).fetchone()
+            cid = row[0] if row else None
+        if cid is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return cid
+
+    def lookup_email(self, email: str) -> str | None:
+        """Contact ID for an email, or None. Never makes a request."""
+        return self._lookup(_email_key(email))
+
+    def lookup_phone(self, phone: str) -> str | None:
+        """Contact ID for a phone number, or None. Never makes a request."""
+        return self._lookup(_phone_key(phone, self.default_country_code))
+
+    # ---------------------------------------------------------------------
+    # Updates
+    # ---------------------------------------------------------------------
+
+    def apply(self, contact: Any, replace: bool = True) -> None:
+        """Index a contact (dict or record) as it now is, replacing its old keys.
+
+        ``replace=False`` skips dropping old keys, for contacts known not to be
+        indexed yet (a full scan into an empty index).
+        """
+        get = contact.get
+        cid = get("id")
+        if not cid:
+            return
+        keys = tuple(
+            key
+            for key in (
+                _email_key(get("email")),
+                _phone_key(get("phone"), self.default_country_code),
+            )
+            if key
+        )
+        if replace:
+            if self._by_id.get(cid) == keys:
+                return
+            self.remove(cid)
+        for key in keys:
+            self._keys[key] = cid
+        self._by_id[cid] = keys
+        if len(self._keys) > self.max_memory_keys:
+            self.spill()
+
+    def apply_many(self, contacts: Iterable[Any], replace: bool = True) -> int:
+        count = 0
+        for contact in contacts:
+            self.apply(contact, replace)
+            count += 1
+        return count
+
+    def remove(self, contact_id: str) -> None:
+        """Drop every key pointing at a contact."""
+        for key in self._by_id.pop(contact_id, ()):
+            if self._keys.get(key) == contact_id:
+                del self._keys[key]
+        if self._spilled:
+            self._db.execute("DELETE FROM contact_keys WHERE contact_id = ?", (contact_id,))
+
+    def spill(self) -> None:
+        """Move in-memory keys to SQLite."""
+        if not self._keys:
+            return
+        with self._db:
+            self._db.execute("BEGIN")
+            # Keys that moved to another contact since the last spill
+            self._db.executemany(
+                "DELETE FROM contact_keys WHERE contact_id = ?",
+                [(cid,) for cid in self._by_id],
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO contact_keys (key, contact_id) VALUES (?, ?)",
+                self._keys.items(),
+            )
+        self._keys.clear()
+        self._by_id.clear()
+        self._spilled = True
+        self.stats.spills += 1
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._by_id.clear()
+        self._db.execute("DELETE FROM contact_keys")
+        self._db.execute("DELETE FROM meta")
+        self._spilled = False
+
+    # ---------------------------------------------------------------------
+    # Sync
+    # ---------------------------------------------------------------------
+
+    @property
+    def checkpoint(self) -> str | None:
+        """ISO timestamp up to which updates have been synced, or None if never built."""
+        row = self._db.execute(
+            "SELECT value FROM meta WHERE name = ?", (f"checkpoint:{self.location_id}",)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_checkpoint(self, value: str) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+            (f"checkpoint:{self.location_id}", value),
+        )
+
+    async def sync(self, contacts: "ContactsAPI", full: bool = False) -> int:
+        """Bring the index up to date.
+
+        The first sync (or ``full=True``) scans every contact; later syncs
+        fetch only contacts whose ``dateUpdated`` is past the checkpoint.
+        Incremental syncs do not see deletions made by other clients; a stale
+        hit is caught when ``find_by_*`` fetches the contact.
+
+        Returns:
+            Number of contacts applied
+        """
+        started = time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())
+        since = None if full else self.checkpoint
+        count = 0
+        latest = since
+        if since is None:
+            self.clear()
+            async for page in contacts.iter_pages(location_id=self.location_id, as_records=True):
+                count += self.apply_many(page.get("contacts") or [], replace=False)
+            latest = started
+        else:
+            async for contact in contacts.iter_updated(since, location_id=self.location_id):
+                self.apply(contact)
+                count += 1
+                updated = contact.get("dateUpdated")
+                if updated and updated > latest:
+                    latest = updated
+        self.spill()
+        self._set_checkpoint(latest)
+        self.stats.synced += count
+        return count
+
+    def __len__(self) -> int:
+        if not self._spilled:
+            return len(self._keys)
+        if not self._keys:
+            return self._db.execute("SELECT COUNT(*) FROM contact_keys").fetchone()[0]
+        # A spilled key reassigned to another contact is also held in memory;
+        # count it once, in one query against the in-memory keys
+        with self._db:
+            self._db.execute("BEGIN")
+            self._db.executemany(
+                "INSERT INTO memory_keys (key) VALUES (?)", ((key,) for key in self._keys)
+            )
+            spilled = self._db.execute(
+                "SELECT COUNT(*) FROM contact_keys"
+                " WHERE key NOT IN (SELECT key FROM memory_keys)"
+            ).fetchone()[0]
+            self._db.execute("DELETE FROM memory_keys")
+        return spilled + len(self._keys)
+
+    def close(self) -> None:
+        self.spill()
+        self._db.close()
+        if self._temp is not None:
+            self._temp.close()
@@ -0,0 +1,104 @@
+"""Contact state cache - Recently seen contacts, for skipping read-before-write.
+
+Diff-based updates (``update_changed``) compare desired fields with the
+contact's current state. Every contact this client reads or writes (``get``,
+``create``, ``update``) is remembered here for a short TTL, so a follow-up
+update can use the known state instead of fetching it again. Entries are evicted
+least-recently-used once ``max_entries`` is reached, and dropped when the
+contact is deleted.
+
+Only mutations consult this cache; ``ContactsAPI.get`` always hits the API.
+"""
+
+from __future__ import annotations
+
+import copy
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from .diff import apply_payload
+
+
+@dataclass
+class ContactStateConfig:
+    """Contact state cache settings for a GHLClient.
+
+    Attributes:
+        enabled: Remember contacts seen by this client
+        ttl: Seconds a remembered contact counts as fresh
+        max_entries: LRU bound
+    """
+
+    enabled: bool = True
+    ttl: float = 30.0
+    max_entries: int = 10_000
+
+
+@dataclass
+class ContactStateStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+        }
+
+
+class ContactStateCache:
+    """LRU of contact dicts by ID with a freshness TTL."""
+
+    def __init__(self, config: ContactStateConfig | None = None):
+        self.config = config or ContactStateConfig()
+        self.stats = ContactStateStats()
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def get(self, contact_id: str) -> dict[str, Any] | None:
+        """Return a copy of the contact if it was seen within the TTL."""
+        entry = self._entries.get(contact_id)
+        if entry is None or time.monotonic() - entry[0] > self.config.ttl:
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(contact_id)
+        self.stats.hits += 1
+        return copy.deepcopy(entry[1])
+
+    def put(self, contact: dict[str, Any] | None) -> None:
+        """Remember a contact as returned by the API."""
+        if not self.config.enabled or not contact or not contact.get("id"):
+            return
+        cid = contact["id"]
+        self._entries[cid] = (time.monotonic(), copy.deepcopy(contact))
+        self._entries.move_to_end(cid)
+        self.stats.stores += 1
+        while len(self._entries) > self.config.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def merge(self, contact_id: str, fields: dict[str, Any]) -> None:
+        """Apply fields just written to a remembered contact, keeping its timestamp.
+
+        ``customFields`` merge by field ID and ``dndSettings`` by channel, as
+        GHL applies a partial update.
+        """
+        entry = self._entries.get(contact_id)
+        if entry is not None:
+            self._entries[contact_id] = (
+                entry[0], apply_payload(entry[1], copy.deepcopy(fields))
+            )
+
+    def invalidate(self, contact_id: str) -> None:
+        self._entries.pop(contact_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -2,10 +2,41 @@
 
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Iterable, TYPE_CHECKING
+
+import httpx
+
+from ..models import Contact
+from .normalize import normalize_email, normalize_phone
+from .pagination import cursor_pages
+from .tags import TagBuffer, TagFlushReport, bulk_tag, write_tags
 
 if TYPE_CHECKING:
+    from .bulk import UpsertReport
     from .client import GHLClient
+    from .contact_index import ContactIndex
+    from .diff import DiffReport
+    from .exporter import ExportReport
+    from .importer import ImportReport
+    from .replica import ContactReplica
+
+
+def _added_filters(start: str | None, end: str | None) -> list[dict[str, Any]]:
+    """Search filters for contacts added in ``[start, end)``."""
+    bounds = {}
+    if start is not None:
+        bounds["gte"] = start
+    if end is not None:
+        bounds["lt"] = end
+    return [{"field": "dateAdded", "operator": "range", "value": bounds}] if bounds else []
+
+
+def _is_resolved(custom_fields: Any) -> bool:
+    """Whether custom field values are already in the API's ``[{"id", "value"}]`` form."""
+    return isinstance(custom_fields, list) and all(
+        isinstance(item, dict) and item.keys() == {"id", "value"} for item in custom_fields
+    )
 
 
 class ContactsAPI:
@@ -16,6 +47,10 @@ class ContactsAPI:
             # List contacts
             contacts = await ghl.contacts.list(limit=50)
 
+            # Stream every contact in the location
+            async for contact in ghl.contacts.iter_all():
+                ...
+
             # Create contact
             contact = await ghl.contacts.create(
                 first_name="John",
@@ -51,6 +86,20 @@ class ContactsAPI:
             raise ValueError("location_id required. Set via config or run 'ghl auth login'")
         return lid
 
+    def _remember(self, contact: dict[str, Any] | None) -> None:
+        """Record a contact returned by the API in the state cache and index."""
+        if not contact:
+            return
+        self._client.contact_state.put(contact)
+        index = self._client.contact_index
+        if index is not None and contact.get("locationId", index.location_id) == index.location_id:
+            index.apply(contact)
+
+    def _forget(self, contact_id: str) -> None:
+        self._client.contact_state.invalidate(contact_id)
+        if self._client.contact_index is not None:
+            self._client.contact_index.remove(contact_id)
+
     # =========================================================================
     # CRUD Operations
     # =========================================================================
@@ -60,6 +109,7 @@ class ContactsAPI:
         limit: int = 20,
         query: str | None = None,
         location_id: str | None = None,
+        as_records: bool = False,
     ) -> dict[str, Any]:
         """List contacts for location.
 
@@ -67,6 +117,7 @@ class ContactsAPI:
             limit: Max contacts to return (default 20, max 100)
             query: Search query (searches name, email, phone)
             location_id: Override default location
+            as_records: Return contacts as compact ``Contact`` records
 
         Returns:
             {"contacts": [...], "meta": {"total": N, ...}}
@@ -75,7 +126,81 @@ class ContactsAPI:
         params = {"locationId": lid, "limit": min(limit, 100)}
         if query:
             params["query"] = query
-        return await self._client._get("/contacts/", **params)
+        result = await self._client._get("/contacts/", **params)
+        return Contact.from_page(result, "contacts") if as_records else result
+
+    async def iter_pages(
+        self,
+        page_size: int = 100,
+        query: str | None = None,
+        location_id: str | None = None,
+        as_records: bool = False,
+        prefetch: bool = True,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over every page of contacts, following the startAfter cursor.
+
+        Args:
+            page_size: Contacts per request (max 100)
+            query: Search query (searches name, email, phone)
+            location_id: Override default location
+            as_records: Return contacts as compact ``Contact`` records
+            prefetch: Fetch the next page while the current one is processed
+
+        Yields:
+            {"contacts": [...], "meta": {...}} pages in order
+        """
+        lid = location_id or self._location_id
+        params = {"locationId": lid, "limit": min(page_size, 100)}
+        if query:
+            params["query"] = query
+
+        async def fetch(cursor: dict[str, Any]) -> dict[str, Any]:
+            result = await self._client._get("/contacts/", **params, **cursor)
+            return Contact.from_page(result, "contacts") if as_records else result
+
+        def next_cursor(page: dict[str, Any]) -> dict[str, Any] | None:
+            meta = page.get("meta") or {}
+            if len(page.get("contacts") or []) < params["limit"] or not meta.get("startAfterId"):
+                return None
+            cursor = {"startAfterId": meta["startAfterId"]}
+            if meta.get("startAfter") is not None:
+                cursor["startAfter"] = meta["startAfter"]
+            return cursor
+
+        async for page in cursor_pages(fetch, next_cursor, prefetch=prefetch):
+            yield page
+
+    async def iter_all(
+        self,
+        page_size: int = 100,
+        query: str | None = None,
+        location_id: str | None = None,
+        as_records: bool = False,
+        prefetch: bool = True,
+    ) -> AsyncIterator[dict[str, Any] | Contact]:
+        """Iterate over every contact in the location, one at a time.
+
+        Pages are requested as the consumer advances (one page ahead when
+        ``prefetch`` is set), so memory stays bounded however many contacts
+        the location has.
+
+        Args:
+            page_size: Contacts per request (max 100)
+            query: Search query (searches name, email, phone)
+            location_id: Override default location
+            as_records: Yield compact ``Contact`` records instead of dicts
+            prefetch: Fetch the next page while the current one is processed
+
+        Yields:
+            Contact dicts (or records)
+
+        Usage:
+            async for contact in ghl.contacts.iter_all(as_records=True):
+                print(contact.id, contact.email)
+        """
+        async for page in self.iter_pages(page_size, query, location_id, as_records, prefetch):
+            for contact in page.get("contacts") or []:
+                yield contact
 
     async def get(self, contact_id: str) -> dict[str, Any]:
         """Get a single contact by ID.
@@ -86,7 +211,9 @@ class ContactsAPI:
         Returns:
             {"contact": {...}}
         """
-        return await self._client._get(f"/contacts/{contact_id}")
+        result = await self._client._get(f"/contacts/{contact_id}")
+        self._remember(result.get("contact"))
+        return result
 
     async def create(
         self,
@@ -109,12 +236,16 @@ class ContactsAPI:
             phone: Phone number (E.164 format preferred, e.g., +15551234567)
             source: Lead source (default: "api")
             tags: List of tag names to add
-            custom_fields: Custom field values
+            custom_fields: Custom field values, ``{name, key or ID: value}`` or
+                ``[{"id"|"key"|"name": ..., "value": ...}]``; validated locally
             location_id: Override default location
             **kwargs: Additional fields (companyName, address, city, state, etc.)
 
         Returns:
             {"contact": {...}} with created contact data
+
+        Raises:
+            CustomFieldError: Unknown custom field or invalid value
         """
         lid = location_id or self._location_id
 
@@ -131,12 +262,25 @@ class ContactsAPI:
         if tags:
             data["tags"] = tags
         if custom_fields:
-            data["customFields"] = custom_fields
+            data["customFields"] = await self._client.custom_fields.resolve(custom_fields, lid)
 
         # Add any extra fields
         data.update(kwargs)
 
-        return await self._client._post("/contacts/", data)
+        async def already_created() -> dict[str, Any] | None:
+            # A failed attempt may still have created the contact; look it up
+            # by its unique keys before sending again.
+            existing = None
+            if email:
+                existing = await self.find_by_email(email, location_id=lid)
+            if existing is None and phone:
+                existing = await self.find_by_phone(phone, location_id=lid)
+            return {"contact": existing} if existing else None
+
+        guard = already_created if (email or phone) else None
+        result = await self._client._post("/contacts/", data, idempotency_guard=guard)
+        self._remember(result.get("contact"))
+        return result
 
     async def update(
         self,
@@ -147,6 +291,7 @@ class ContactsAPI:
         phone: str | None = None,
         tags: list[str] | None = None,
         custom_fields: dict[str, Any] | None = None,
+        location_id: str | None = None,
         **kwargs,
     ) -> dict[str, Any]:
         """Update an existing contact.
@@ -158,11 +303,16 @@ class ContactsAPI:
             email: New email
             phone: New phone
             tags: Replace all tags with this list
-            custom_fields: Update custom field values
+            custom_fields: Update custom field values, by name, key or ID (see
+                ``create``); a list already in ``[{"id", "value"}]`` form is sent as-is
+            location_id: Location the custom fields belong to (default location if omitted)
             **kwargs: Additional fields to update
 
         Returns:
             {"contact": {...}} with updated contact data
+
+        Raises:
+            CustomFieldError: Unknown custom field or invalid value
         """
         data = {}
 
@@ -177,11 +327,86 @@ class ContactsAPI:
         if tags is not None:
             data["tags"] = tags
         if custom_fields is not None:
-            data["customFields"] = custom_fields
+            if _is_resolved(custom_fields):
+                data["customFields"] = list(custom_fields)
+            else:
+                data["customFields"] = await self._client.custom_fields.resolve(
+                    custom_fields, location_id
+                )
 
         data.update(kwargs)
 
-        return await self._client._put(f"/contacts/{contact_id}", data)
+        result = await self._client._put(f"/contacts/{contact_id}", data)
+        if result.get("contact"):
+            self._remember(result["contact"])
+        else:
+            self._client.contact_state.merge(contact_id, data)
+            if self._client.contact_index is not None and ("email" in data or "phone" in data):
+                # New keys unknown without the full contact; lookups fall back to search
+                self._client.contact_index.remove(contact_id)
+        return result
+
+    async def update_changed(
+        self,
+        contact_id: str,
+        replica: "ContactReplica | None" = None,
+        read_missing: bool = True,
+        location_id: str | None = None,
+        **fields: Any,
+    ) -> dict[str, Any]:
+        """Update a contact, sending only fields that differ from its current state.
+
+        Current state comes from ``contact_state``, then ``replica``, then one
+        read (unless ``read_missing=False``, which sends the full update). Nothing
+        is sent when nothing would change.
+
+        Args:
+            contact_id: The contact ID
+            replica: Local mirror to diff against
+            read_missing: Read the contact when its state is not known locally
+            location_id: Location the custom fields belong to
+            **fields: Desired values, as for ``update``
+
+        Returns:
+            The update response, or {"contact": current state} when nothing changed
+        """
+        from .diff import DiffUpdater
+
+        updater = DiffUpdater(
+            self, replica=replica, read_missing=read_missing, location_id=location_id
+        )
+        return await updater.update(contact_id, **fields)
+
+    async def bulk_update(
+        self,
+        updates: Iterable[tuple[str, dict[str, Any]]],
+        concurrency: int = 10,
+        replica: "ContactReplica | None" = None,
+        read_missing: bool = True,
+        location_id: str | None = None,
+    ) -> "DiffReport":
+        """Apply many updates as minimal diffs, skipping those that change nothing.
+
+        Args:
+            updates: ``(contact_id, fields)`` pairs; fields as for ``update``
+            concurrency: Max contacts updated at once
+            replica: Local mirror to diff against (sync it first)
+            read_missing: Read contacts whose state is not known locally
+            location_id: Location the custom fields belong to
+
+        Returns:
+            ``DiffReport`` with writes made and avoided
+        """
+        from .diff import DiffUpdater
+
+        updater = DiffUpdater(
+            self,
+            replica=replica,
+            read_missing=read_missing,
+            concurrency=concurrency,
+            location_id=location_id,
+        )
+        return await updater.run(updates)
 
     async def delete(self, contact_id: str) -> dict[str, Any]:
         """Delete a contact.
@@ -192,7 +417,147 @@ class ContactsAPI:
         Returns:
             {"succeeded": true} or error
         """
-        return await self._client._delete(f"/contacts/{contact_id}")
+        result = await self._client._delete(f"/contacts/{contact_id}")
+        self._forget(contact_id)
+        return result
+
+    async def bulk_upsert(
+        self,
+        rows: Iterable[dict[str, Any]],
+        match_on: tuple[str, ...] = ("email", "phone"),
+        concurrency: int = 10,
+        batch_size: int = 1000,
+        resolve: str = "auto",
+        merge_tags: bool = True,
+        default_country_code: str = "1",
+        location_id: str | None = None,
+    ) -> "UpsertReport":
+        """Create or update many contacts, matching existing ones on email and phone.
+
+        Args:
+            rows: Contact dicts in API form (firstName, email, phone, tags, ...)
+            match_on: Keys to deduplicate on, in priority order
+            concurrency: Max writes in flight (all still pass the rate limiter)
+            batch_size: Rows read from ``rows`` at a time
+            resolve: How existing contacts are found: "scan" (index the whole
+                location once), "search" (one search per key), "none", or
+                "auto" (scan when it needs fewer requests than searching)
+            merge_tags: Add row tags to an existing contact's tags instead of replacing them
+            default_country_code: Calling code for phone numbers without one
+            location_id: Override default location
+
+        Returns:
+            ``UpsertReport`` with one ``UpsertResult`` per row, in input order
+        """
+        from .bulk import BulkUpserter
+
+        upserter = BulkUpserter(
+            self,
+            location_id or self._location_id,
+            match_on=match_on,
+            concurrency=concurrency,
+            batch_size=batch_size,
+            resolve=resolve,
+            merge_tags=merge_tags,
+            default_country_code=default_country_code,
+        )
+        return await upserter.run(rows)
+
+    async def import_file(
+        self,
+        path: str | Path,
+        mapping: dict[str, str] | None = None,
+        format: str | None = None,
+        concurrency: int = 10,
+        journal: bool | str | Path = True,
+        source: str = "import",
+        tags: Iterable[str] = (),
+        location_id: str | None = None,
+        on_progress: Callable[["ImportReport"], None] | None = None,
+    ) -> "ImportReport":
+        """Create contacts from a CSV or NDJSON file, streaming it row by row.
+
+        Args:
+            path: Input file (``.csv``, ``.ndjson``/``.jsonl``, optionally ``.gz``)
+            mapping: Column -> contact field, ``"custom:<name>"``, or "" to ignore;
+                other columns are matched by name
+            format: "csv" or "ndjson" (default: from the file name)
+            concurrency: Max creates in flight (all still pass the rate limiter)
+            journal: Resume journal path; True for ``<path>.journal``, False for none
+            source: Lead source for rows without one
+            tags: Tags added to every imported contact
+            location_id: Override default location
+            on_progress: Called with the running ``ImportReport`` after each row
+
+        Returns:
+            ``ImportReport``
+        """
+        from .importer import ContactImporter, read_rows
+        from .journal import Journal
+
+        lid = location_id or self._location_id
+        path = Path(path)
+        job = None
+        if journal:
+            journal_path = Path(f"{path}.journal") if journal is True else Path(journal)
+            job = Journal(journal_path, meta={"import": str(path.resolve()), "location_id": lid})
+        importer = ContactImporter(
+            self,
+            lid,
+            mapping=mapping,
+            concurrency=concurrency,
+            source=source,
+            tags=tags,
+            journal=job,
+            on_progress=on_progress,
+        )
+        try:
+            return await importer.run(read_rows(path, format))
+        finally:
+            if job is not None:
+                job.close()
+
+    async def export(
+        self,
+        path: str | Path,
+        format: str | None = None,
+        compress: bool | None = None,
+        flatten: bool = True,
+        columns: list[str] | None = None,
+        parquet_compression: str = "snappy",
+        location_id: str | None = None,
+        on_progress: Callable[["ExportReport"], None] | None = None,
+    ) -> "ExportReport":
+        """Write every contact in the location to a file, one page at a time.
+
+        Args:
+            path: Output file; replaced only once the export completes
+            format: "ndjson", "csv" or "parquet" (default: from the file name)
+            compress: Gzip NDJSON/CSV output (default: when ``path`` ends in .gz)
+            flatten: Flatten custom fields into columns (CSV and Parquet always are)
+            columns: Standard contact fields to include (default: all common ones)
+            parquet_compression: Parquet codec ("snappy", "zstd", "gzip", "none")
+            location_id: Override default location
+            on_progress: Called with the running ``ExportReport`` after each page
+
+        Returns:
+            ``ExportReport``
+        """
+        from .exporter import FORMATS, ContactExporter
+        from .importer import detect_format
+
+        path = Path(path)
+        exporter = ContactExporter(
+            self,
+            location_id or self._location_id,
+            format=format or detect_format(path, FORMATS),
+            compress=path.suffix.lower() == ".gz" if compress is None else compress,
+            flatten=flatten,
+            columns=columns,
+            parquet_compression=parquet_compression,
+            on_progress=on_progress,
+        )
+        return await exporter.run(path)
 
     # =========================================================================
     # Tags
@@ -201,41 +566,69 @@ class ContactsAPI:
     async def add_tag(self, contact_id: str, tag: str) -> dict[str, Any]:
         """Add a tag to a contact.
 
+        Sends only the tag (POST ``/contacts/{id}/tags``): no read first, and
+        tags written concurrently by others are kept.
+
         Args:
             contact_id: The contact ID
             tag: Tag name to add
 
         Returns:
-            Updated contact data
+            {"contact": {"id": ..., "tags": [...]}} with the tags after the change;
+            other contact fields are not re-read
         """
-        # Get current tags
-        contact_data = await self.get(contact_id)
-        current_tags = contact_data.get("contact", {}).get("tags", [])
-
-        if tag not in current_tags:
-            current_tags.append(tag)
-            return await self.update(contact_id, tags=current_tags)
-
-        return contact_data
+        return self._tagged(contact_id, await write_tags(self, contact_id, {tag: True}))
 
     async def remove_tag(self, contact_id: str, tag: str) -> dict[str, Any]:
         """Remove a tag from a contact.
 
+        Sends only the tag (DELETE ``/contacts/{id}/tags``).
+
         Args:
             contact_id: The contact ID
             tag: Tag name to remove
 
         Returns:
-            Updated contact data
+            {"contact": {"id": ..., "tags": [...]}} with the tags after the change;
+            other contact fields are not re-read
+        """
+        return self._tagged(contact_id, await write_tags(self, contact_id, {tag: False}))
+
+    @staticmethod
+    def _tagged(contact_id: str, result: dict[str, Any]) -> dict[str, Any]:
+        """Shape a tag endpoint response like the contact payload callers expect."""
+        return {"contact": {"id": contact_id, "tags": result.get("tags", [])}}
+
+    def tag_buffer(self, concurrency: int = 10) -> TagBuffer:
+        """Create a buffer that merges tag operations into one change per contact.
+
+        Args:
+            concurrency: Max contacts written at once on flush
+
+        Returns:
+            ``TagBuffer``; flushed on ``async with`` exit or by ``flush()``
         """
-        contact_data = await self.get(contact_id)
-        current_tags = contact_data.get("contact", {}).get("tags", [])
+        return TagBuffer(self, concurrency=concurrency)
+
+    async def bulk_tag(
+        self,
+        contact_ids: Iterable[str],
+        add: Iterable[str] = (),
+        remove: Iterable[str] = (),
+        concurrency: int = 10,
+    ) -> TagFlushReport:
+        """Add and/or remove tags on many contacts, sending only the tag changes.
 
-        if tag in current_tags:
-            current_tags.remove(tag)
-            return await self.update(contact_id, tags=current_tags)
+        Args:
+            contact_ids: Contacts to change
+            add: Tags to add
+            remove: Tags to remove
+            concurrency: Max contacts written at once
 
-        return contact_data
+        Returns:
+            ``TagFlushReport`` with writes and failed contacts
+        """
+        return await bulk_tag(self, contact_ids, add, remove, concurrency)
 
     # =========================================================================
     # Notes
@@ -382,14 +775,19 @@ class ContactsAPI:
             dnd: True to enable DND, False to disable
             channel: Channel to set DND for ("all", "sms", "email", "call")
 
+        Skips the write when ``contact_state`` shows the setting is already in
+        place; sends only the changed channel otherwise.
+
         Returns:
             Updated contact data
         """
         if channel == "all":
-            return await self.update(contact_id, dnd=dnd)
+            return await self.update_changed(contact_id, read_missing=False, dnd=dnd)
         else:
             dnd_settings = {channel: {"status": "active" if dnd else "inactive"}}
-            return await self.update(contact_id, dndSettings=dnd_settings)
+            return await self.update_changed(
+                contact_id, read_missing=False, dndSettings=dnd_settings
+            )
 
     # =========================================================================
     # Search
@@ -413,11 +811,143 @@ class ContactsAPI:
         """
         return await self.list(limit=limit, query=query, location_id=location_id)
 
+    async def iter_updated(
+        self,
+        since: str,
+        page_size: int = 100,
+        location_id: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over contacts updated after a point in time, oldest change first.
+
+        Uses the contacts search endpoint with a ``dateUpdated`` range filter
+        and follows its ``searchAfter`` cursor.
+
+        Args:
+            since: ISO 8601 timestamp; only contacts with a later ``dateUpdated``
+            page_size: Contacts per request (max 100)
+            location_id: Override default location
+
+        Yields:
+            Contact dicts
+        """
+        lid = location_id or self._location_id
+        body = {
+            "locationId": lid,
+            "pageLimit": min(page_size, 100),
+            "filters": [{"field": "dateUpdated", "operator": "range", "value": {"gt": since}}],
+            "sort": [{"field": "dateUpdated", "direction": "asc"}],
+        }
+        async for contact in self._iter_search(body):
+            yield contact
+
+    async def iter_added(
+        self,
+        start: str | None = None,
+        end: str | None = None,
+        page_size: int = 100,
+        location_id: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over contacts added in ``[start, end)``, oldest first.
+
+        Args:
+            start: ISO 8601 timestamp; only contacts added at or after it (None = no bound)
+            end: ISO 8601 timestamp; only contacts added before it (None = no bound)
+            page_size: Contacts per request (max 100)
+            location_id: Override default location
+
+        Yields:
+            Contact dicts
+        """
+        body = {
+            "locationId": location_id or self._location_id,
+            "pageLimit": min(page_size, 100),
+            "filters": _added_filters(start, end),
+            "sort": [{"field": "dateAdded", "direction": "asc"}],
+        }
+        async for contact in self._iter_search(body):
+            yield contact
+
+    async def count_added(
+        self,
+        start: str | None = None,
+        end: str | None = None,
+        location_id: str | None = None,
+    ) -> int:
+        """Number of contacts added in ``[start, end)``, from one search request.
+
+        Args:
+            start: ISO 8601 timestamp (None = no bound)
+            end: ISO 8601 timestamp (None = no bound)
+            location_id: Override default location
+        """
+        body = {
+            "locationId": location_id or self._location_id,
+            "pageLimit": 1,
+            "filters": _added_filters(start, end),
+        }
+        page = await self._client._post("/contacts/search", body, idempotent=True)
+        total = page.get("total", (page.get("meta") or {}).get("total"))
+        return int(total or 0)
+
+    async def _iter_search(self, body: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+        """Contacts from the search endpoint, following its ``searchAfter`` cursor."""
+
+        async def fetch(cursor: dict[str, Any]) -> dict[str, Any]:
+            return await self._client._post(
+                "/contacts/search", {**body, **cursor}, idempotent=True
+            )
+
+        def next_cursor(page: dict[str, Any]) -> dict[str, Any] | None:
+            contacts = page.get("contacts") or []
+            if len(contacts) < body["pageLimit"] or not contacts[-1].get("searchAfter"):
+                return None
+            return {"searchAfter": contacts[-1]["searchAfter"]}
+
+        async for page in cursor_pages(fetch, next_cursor):
+            for contact in page.get("contacts") or []:
+                yield contact
+
+    def _index_for(self, location_id: str | None) -> "ContactIndex | None":
+        index = self._client.contact_index
+        if index is None or (location_id and location_id != index.location_id):
+            return None
+        return index
+
+    async def _indexed_contact(self, contact_id: str, matches) -> dict[str, Any] | None:
+        """Fetch a contact the index points at, dropping the entry if it went stale.
+
+        The index holds IDs only, so this costs one GET ``/contacts/{id}``
+        unless ``contact_state`` still has the contact. The fetched contact is
+        also what verifies the hit: it must still carry the key looked up.
+        """
+        contact = self._client.contact_state.get(contact_id)
+        if contact is None:
+            try:
+                contact = (await self.get(contact_id)).get("contact")
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in (400, 404, 422):
+                    raise
+                contact = None
+        if not contact:
+            self._forget(contact_id)
+            return None
+        if not matches(contact):
+            self._remember(contact)  # Re-index under its current keys
+            return None
+        return contact
+
     async def find_by_email(
         self, email: str, location_id: str | None = None
     ) -> dict[str, Any] | None:
         """Find a contact by email address.
 
+        Consults the client's ``contact_index`` first when one is open, and
+        falls back to a remote search on a miss. The index maps emails to IDs
+        only: a hit still costs one GET of the contact (unless the client's
+        ``contact_state`` holds it), which replaces the search and confirms the
+        email still matches. Emails compare normalized (trimmed,
+        case-insensitive).
+
         Args:
             email: Email to search for
             location_id: Override default location
@@ -425,10 +955,23 @@ class ContactsAPI:
         Returns:
             Contact data or None if not found
         """
-        result = await self.search(email, limit=1, location_id=location_id)
-        contacts = result.get("contacts", [])
-        for contact in contacts:
-            if contact.get("email", "").lower() == email.lower():
+        target = normalize_email(email) or email.strip().lower()
+
+        def matches(contact: dict[str, Any]) -> bool:
+            return normalize_email(contact.get("email")) == target
+
+        index = self._index_for(location_id)
+        if index is not None:
+            contact_id = index.lookup_email(email)
+            if contact_id:
+                contact = await self._indexed_contact(contact_id, matches)
+                if contact:
+                    return contact
+
+        result = await self.search(email.strip(), limit=10, location_id=location_id)
+        for contact in result.get("contacts", []):
+            if matches(contact):
+                self._remember(contact)
                 return contact
         return None
 
@@ -437,6 +980,11 @@ class ContactsAPI:
     ) -> dict[str, Any] | None:
         """Find a contact by phone number.
 
+        Consults the client's ``contact_index`` first when one is open, and
+        falls back to a remote search on a miss. As with ``find_by_email``, a
+        hit costs one GET of the contact instead of the search, unless the
+        client's ``contact_state`` holds it. Numbers compare in E.164 form.
+
         Args:
             phone: Phone to search for
             location_id: Override default location
@@ -444,9 +992,27 @@ class ContactsAPI:
         Returns:
             Contact data or None if not found
         """
-        result = await self.search(phone, limit=1, location_id=location_id)
-        contacts = result.get("contacts", [])
-        for contact in contacts:
-            if contact.get("phone", "").replace("+", "").replace(" ", "") == phone.replace("+", "").replace(" ", ""):
+
+        def canonical(value: str | None) -> str:
+            value = value or ""
+            return normalize_phone(value) or value.replace("+", "").replace(" ", "")
+
+        target = canonical(phone)
+
+        def matches(contact: dict[str, Any]) -> bool:
+            return bool(contact.get("phone")) and canonical(contact.get("phone")) == target
+
+        index = self._index_for(location_id)
+        if index is not None:
+            contact_id = index.lookup_phone(phone)
+            if contact_id:
+                contact = await self._indexed_contact(contact_id, matches)
+                if contact:
+                    return contact
+
+        result = await self.search(phone.strip(), limit=10, location_id=location_id)
+        for contact in result.get("contacts", []):
+            if matches(contact):
+                self._remember(contact)
                 return contact
         return None
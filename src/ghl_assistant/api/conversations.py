@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, TYPE_CHECKING
+
+from ..models import Message
+from .pagination import concat_streams, cursor_pages
 
 if TYPE_CHECKING:
     from .client import GHLClient
@@ -19,6 +23,10 @@ class ConversationsAPI:
             # Get conversation history
             messages = await ghl.conversations.messages("conversation_id")
 
+            # Stream every message of every conversation
+            async for conversation, message in ghl.conversations.iter_history():
+                ...
+
             # Send SMS
             await ghl.conversations.send_sms("contact_id", "Hello!")
 
@@ -78,20 +86,160 @@ class ConversationsAPI:
         self,
         conversation_id: str,
         limit: int = 50,
+        as_records: bool = False,
     ) -> dict[str, Any]:
         """Get messages in a conversation.
 
         Args:
             conversation_id: The conversation ID
             limit: Max messages to return
+            as_records: Return messages as compact ``Message`` records
 
         Returns:
             {"messages": [...]}
         """
-        return await self._client._get(
+        result = await self._client._get(
             f"/conversations/{conversation_id}/messages",
             limit=limit,
         )
+        if as_records:
+            # Messages may be nested one level: {"messages": {"messages": [...]}}
+            page = result.get("messages")
+            Message.from_page(page if isinstance(page, dict) else result, "messages")
+        return result
+
+    async def iter_conversations(
+        self,
+        page_size: int = 100,
+        unread_only: bool = False,
+        location_id: str | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over every conversation, most recent first.
+
+        Follows the ``startAfterDate`` cursor (the last conversation's sort
+        value), fetching the next page while the current one is processed.
+
+        Args:
+            page_size: Conversations per request (max 100)
+            unread_only: Only unread conversations
+            location_id: Override default location
+            prefetch: Fetch the next page while the current one is processed
+
+        Yields:
+            Conversation dicts
+        """
+        lid = location_id or self._location_id
+        params = {"locationId": lid, "limit": min(page_size, 100)}
+        if unread_only:
+            params["status"] = "unread"
+
+        async def fetch(cursor: dict[str, Any]) -> dict[str, Any]:
+            return await self._client._get("/conversations/search", **params, **cursor)
+
+        def next_cursor(page: dict[str, Any]) -> dict[str, Any] | None:
+            conversations = page.get("conversations") or []
+            if len(conversations) < params["limit"]:
+                return None
+            last = conversations[-1]
+            after = (last.get("sort") or [None])[0] or last.get("lastMessageDate")
+            return {"startAfterDate": after} if after else None
+
+        async for page in cursor_pages(fetch, next_cursor, prefetch=prefetch):
+            for conversation in page.get("conversations") or []:
+                yield conversation
+
+    async def iter_messages(
+        self,
+        conversation_id: str,
+        page_size: int = 100,
+        as_records: bool = False,
+        prefetch: bool = True,
+    ) -> AsyncIterator[dict[str, Any] | Message]:
+        """Iterate over every message in a conversation, newest first.
+
+        Follows the ``lastMessageId`` cursor until the backend reports no
+        next page.
+
+        Args:
+            conversation_id: The conversation ID
+            page_size: Messages per request (max 100)
+            as_records: Yield compact ``Message`` records instead of dicts
+            prefetch: Fetch the next page while the current one is processed
+
+        Yields:
+            Message dicts (or records)
+        """
+        limit = min(page_size, 100)
+
+        async def fetch(cursor: dict[str, Any]) -> dict[str, Any]:
+            result = await self._client._get(
+                f"/conversations/{conversation_id}/messages", limit=limit, **cursor
+            )
+            # Messages are nested one level: {"messages": {"messages": [...], ...}}
+            page = result.get("messages")
+            page = page if isinstance(page, dict) else result
+            return Message.from_page(page, "messages") if as_records else page
+
+        def next_cursor(page: dict[str, Any]) -> dict[str, Any] | None:
+            messages = page.get("messages") or []
+            if not messages or page.get("nextPage") is False:
+                return None
+            last_id = page.get("lastMessageId")
+            if last_id is None:
+                last = messages[-1]
+                last_id = last.id if as_records else last.get("id")
+            return {"lastMessageId": last_id} if last_id else None
+
+        async for page in cursor_pages(fetch, next_cursor, prefetch=prefetch):
+            for message in page.get("messages") or []:
+                yield message
+
+    async def iter_history(
+        self,
+        concurrency: int = 8,
+        page_size: int = 100,
+        unread_only: bool = False,
+        location_id: str | None = None,
+        as_records: bool = False,
+    ) -> AsyncIterator[tuple[dict[str, Any], dict[str, Any] | Message]]:
+        """Stream the message history of every conversation as one ordered stream.
+
+        Conversations come in ``iter_conversations`` order and each
+        conversation's messages are contiguous. Message pages for the next
+        ``concurrency - 1`` conversations are fetched while the current one is
+        consumed, with a bounded buffer per conversation.
+
+        Args:
+            concurrency: Max conversations whose messages are fetched at once
+            page_size: Items per request (max 100)
+            unread_only: Only unread conversations
+            location_id: Override default location
+            as_records: Yield compact ``Message`` records instead of dicts
+
+        Yields:
+            (conversation, message) tuples
+
+        Usage:
+            with open("history.ndjson", "wb") as f:
+                async for conversation, message in ghl.conversations.iter_history():
+                    f.write(codec.dumps(message) + b"\\n")
+        """
+
+        async def with_conversation(conversation: dict[str, Any]):
+            messages = self.iter_messages(
+                conversation["id"], page_size, as_records, prefetch=False
+            )
+            async for message in messages:
+                yield conversation, message
+
+        async def streams():
+            conversations = self.iter_conversations(page_size, unread_only, location_id)
+            async for conversation in conversations:
+                yield with_conversation(conversation)
+
+        async for item in concat_streams(streams(), concurrency, buffer=page_size):
+            yield item
 
     async def get_by_contact(
         self,
@@ -114,6 +262,42 @@ class ConversationsAPI:
             contactId=contact_id,
         )
 
+    async def _find_sent_message(
+        self,
+        contact_id: str,
+        location_id: str,
+        body: str,
+        since: datetime,
+    ) -> dict[str, Any] | None:
+        """Find an outbound message with ``body`` sent to a contact since ``since``.
+
+        Used as the idempotency guard for sends: before a failed send is retried,
+        check whether the first attempt was delivered after all.
+        """
+        result = await self.get_by_contact(contact_id, location_id=location_id)
+        for conversation in result.get("conversations", [])[:1]:
+            page = await self.messages(conversation["id"], limit=20)
+            messages = page.get("messages", [])
+            if isinstance(messages, dict):
+                messages = messages.get("messages", [])
+            for msg in messages:
+                if msg.get("direction") != "outbound" or msg.get("body") != body:
+                    continue
+                added = msg.get("dateAdded")
+                if added:
+                    try:
+                        sent_at = datetime.fromisoformat(added.replace("Z", "+00:00"))
+                    except ValueError:
+                        continue
+                    if sent_at < since:
+                        continue
+                return {
+                    "conversationId": conversation["id"],
+                    "messageId": msg.get("id"),
+                    "msg": msg,
+                }
+        return None
+
     async def send_sms(
         self,
         contact_id: str,
@@ -131,6 +315,8 @@ class ConversationsAPI:
             Sent message data
         """
         lid = location_id or self._location_id
+        # Allow for clock skew between us and GHL when matching the send time
+        started = datetime.now(timezone.utc) - timedelta(minutes=1)
         return await self._client._post(
             "/conversations/messages",
             {
@@ -139,6 +325,9 @@ class ConversationsAPI:
                 "type": "SMS",
                 "message": message,
             },
+            idempotency_guard=lambda: self._find_sent_message(
+                contact_id, lid, message, started
+            ),
         )
 
     async def send_email(
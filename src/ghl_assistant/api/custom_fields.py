@@ -0,0 +1,251 @@
+"""Custom field resolution - Field names and keys to IDs, with local validation.
+
+GHL identifies custom fields by opaque IDs. The resolver loads a location's
+field definitions once, keeps them for ``ttl`` seconds, and translates the
+names, keys (``contact.plan`` or ``plan``) or IDs callers use into the
+``[{"id": ..., "value": ...}]`` form the API expects, in constant time per
+field. Values are checked against the field's type before anything is sent,
+and coerced where the intent is unambiguous ("42" for a number field, "a, b"
+for a multi-option field).
+
+Definitions are dropped when a write through the client touches the
+location's custom fields, and re-read once when an unknown name shows up (at
+most every ``refresh_interval`` seconds), so fields created elsewhere are
+picked up.
+
+Usage:
+    await ghl.contacts.create(email="j@example.com", custom_fields={"Plan": "gold"})
+
+    plan = await ghl.custom_fields.get("Subscription Plan")      # CustomField(id=..., ...)
+    values = await ghl.custom_fields.resolve({"contact.score": "42"})
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Iterable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import GHLClient
+
+ENDPOINT_RE = re.compile(r"^/locations/(?P<location_id>[^/]+)/customFields(?:/|$)")
+
+NUMBER_TYPES = frozenset({"NUMERICAL", "MONETORY", "MONETARY"})
+SINGLE_OPTION_TYPES = frozenset({"SINGLE_OPTIONS", "RADIO", "DROPDOWN"})
+MULTI_OPTION_TYPES = frozenset({"MULTIPLE_OPTIONS", "CHECKBOX"})
+TEXT_TYPES = frozenset({"TEXT", "LARGE_TEXT", "PHONE", "EMAIL", "TEXTBOX_LIST"})
+
+
+class CustomFieldError(ValueError):
+    """A custom field is unknown, or a value does not fit its type."""
+
+
+def field_key(name: str) -> str:
+    """Normalized lookup key: lowercase letters and digits only."""
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+@dataclass(frozen=True)
+class CustomField:
+    """One custom field definition."""
+
+    id: str
+    name: str
+    key: str = ""
+    data_type: str = "TEXT"
+    options: tuple[str, ...] = ()
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> "CustomField":
+        options = data.get("picklistOptions") or data.get("options") or ()
+        return cls(
+            id=data["id"],
+            name=data.get("name") or data["id"],
+            key=data.get("fieldKey") or "",
+            data_type=(data.get("dataType") or "TEXT").upper(),
+            options=tuple(str(o.get("label", o) if isinstance(o, dict) else o) for o in options),
+        )
+
+    def validate(self, value: Any) -> Any:
+        """Check a value against the field type; return it as it should be sent.
+
+        Raises:
+            CustomFieldError: The value does not fit the field
+        """
+        if value is None:
+            return None
+        kind = self.data_type
+        if kind in NUMBER_TYPES:
+            if isinstance(value, bool):
+                raise CustomFieldError(f"{self.name}: expected a number, got {value!r}")
+            if isinstance(value, (int, float)):
+                return value
+            try:
+                number = float(str(value).replace(",", "").strip())
+            except ValueError:
+                raise CustomFieldError(
+                    f"{self.name}: expected a number, got {value!r}"
+                ) from None
+            return int(number) if number.is_integer() else number
+        if kind in MULTI_OPTION_TYPES:
+            items = value if isinstance(value, (list, tuple)) else str(value).split(",")
+            items = [str(item).strip() for item in items if str(item).strip()]
+            self._check_options(items)
+            return items
+        if kind in SINGLE_OPTION_TYPES:
+            value = str(value).strip()
+            self._check_options([value])
+            return value
+        if kind == "DATE":
+            if isinstance(value, (date, datetime)):
+                return value.isoformat()
+            try:
+                datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+            except ValueError:
+                raise CustomFieldError(
+                    f"{self.name}: expected an ISO date, got {value!r}"
+                ) from None
+            return str(value).strip()
+        if kind in TEXT_TYPES and isinstance(value, (dict, list)):
+            raise CustomFieldError(f"{self.name}: expected text, got {type(value).__name__}")
+        return value
+
+    def _check_options(self, items: list[str]) -> None:
+        if not self.options:
+            return
+        allowed = {option.casefold() for option in self.options}
+        unknown = [item for item in items if item.casefold() not in allowed]
+        if unknown:
+            raise CustomFieldError(
+                f"{self.name}: {', '.join(map(repr, unknown))} not in {list(self.options)}"
+            )
+
+
+class CustomFieldSet:
+    """A location's custom fields, indexed by ID, name and key."""
+
+    def __init__(self, fields: Iterable[CustomField] = ()):
+        self.fields = list(fields)
+        self.loaded_at = time.monotonic()
+        self._by_id = {f.id: f for f in self.fields}
+        self._by_name: dict[str, CustomField] = {}
+        for f in self.fields:
+            key = f.key.removeprefix("contact.")
+            for name in (f.name, f.key, key):
+                if name:
+                    self._by_name.setdefault(field_key(name), f)
+
+    def find(self, name: str) -> CustomField | None:
+        """Field by ID, name or key (names and keys compare loosely), or None."""
+        return (
+            self._by_id.get(name)
+            or self._by_name.get(field_key(name))
+            or self._by_name.get(field_key(name.removeprefix("contact.")))
+        )
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+
+class CustomFieldResolver:
+    """Per-location cache of custom field definitions.
+
+    Args:
+        client: The client to load definitions through
+        ttl: Seconds definitions are reused before reloading
+        refresh_interval: Minimum seconds between reloads triggered by an unknown name
+    """
+
+    def __init__(self, client: "GHLClient", ttl: float = 900.0, refresh_interval: float = 30.0):
+        self._client = client
+        self.ttl = ttl
+        self.refresh_interval = refresh_interval
+        self._sets: dict[str, CustomFieldSet] = {}
+
+    def _location(self, location_id: str | None) -> str:
+        lid = location_id or self._client.config.location_id
+        if not lid:
+            raise ValueError("location_id required")
+        return lid
+
+    async def load(self, location_id: str | None = None, refresh: bool = False) -> CustomFieldSet:
+        """Definitions for a location, loaded on first use and after ``ttl``."""
+        lid = self._location(location_id)
+        fields = self._sets.get(lid)
+        if refresh or fields is None or time.monotonic() - fields.loaded_at > self.ttl:
+            if refresh:
+                # Skip the response caches: the point is to see fields added elsewhere
+                endpoint = f"/locations/{lid}/customFields"
+                if self._client.cache is not None:
+                    self._client.cache.invalidate(endpoint)
+                if self._client.persistent_cache is not None:
+                    self._client.persistent_cache.invalidate(lid, endpoint)
+            result = await self._client.get_custom_fields(lid)
+            fields = CustomFieldSet(
+                [CustomField.from_api(d) for d in result.get("customFields") or [] if d.get("id")]
+            )
+            self._sets[lid] = fields
+        return fields
+
+    async def get(self, name: str, location_id: str | None = None) -> CustomField:
+        """One field by ID, name or key.
+
+        Raises:
+            CustomFieldError: No such field in the location
+        """
+        fields = await self.load(location_id)
+        found = fields.find(name)
+        if found is None and time.monotonic() - fields.loaded_at > self.refresh_interval:
+            found = (await self.load(location_id, refresh=True)).find(name)
+        if found is None:
+            raise CustomFieldError(f"Unknown custom field {name!r}")
+        return found
+
+    async def resolve(
+        self,
+        values: dict[str, Any] | Iterable[dict[str, Any]],
+        location_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Translate custom field values to the API's ``[{"id", "value"}]`` form.
+
+        Args:
+            values: ``{name, key or ID: value}``, or a list of ``{"id"|"key"|"name":
+                ..., "value": ...}`` items
+            location_id: Override default location
+
+        Raises:
+            CustomFieldError: Unknown field or invalid value
+        """
+        if isinstance(values, dict):
+            items = list(values.items())
+        else:
+            items = []
+            for item in values:
+                name = item.get("id") or item.get("key") or item.get("name")
+                if not name:
+                    raise CustomFieldError(f"Custom field value without id, key or name: {item}")
+                items.append((name, item.get("value", item.get("field_value"))))
+        resolved = []
+        for name, value in items:
+            f = await self.get(name, location_id)
+            resolved.append({"id": f.id, "value": f.validate(value)})
+        return resolved
+
+    def invalidate(self, location_id: str | None = None) -> None:
+        """Forget one location's definitions, or all of them."""
+        if location_id is None:
+            self._sets.clear()
+        else:
+            self._sets.pop(location_id, None)
+
+    def invalidate_endpoint(self, endpoint: str) -> None:
+        """Forget definitions a write to ``endpoint`` may have changed."""
+        match = ENDPOINT_RE.match(endpoint)
+        if match:
+            self.invalidate(match["location_id"])
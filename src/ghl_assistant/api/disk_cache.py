@@ -0,0 +1,182 @@
+"""Persistent cache - SQLite-backed response cache shared across processes.
+
+Every ``ghl`` invocation and script starts with an empty in-memory cache, so
+location details, custom fields and pipelines were re-fetched on each run.
+This cache stores reference-data responses in ``data/cache/http_cache.sqlite``
+keyed by location, endpoint and params, together with their ETag and
+Last-Modified validators:
+
+- Fresh entries (younger than the family TTL) are served without a request.
+- Stale entries with validators are revalidated with a conditional GET; a 304
+  refreshes the entry and serves the stored body.
+- Writes through any client invalidate the family for that location, which
+  every other process sees on its next lookup.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+
+from .cache import CacheConfig, CacheFamily, CacheStats, match_family
+
+DATA_DIR = Path(__file__).parent.parent.parent.parent / "data"
+DEFAULT_CACHE_PATH = DATA_DIR / "cache" / "http_cache.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    scope TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    params TEXT NOT NULL,
+    family TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (scope, endpoint, params)
+);
+CREATE INDEX IF NOT EXISTS responses_family ON responses (scope, family);
+"""
+
+# Response headers worth keeping; the rest are per-request noise
+KEPT_HEADERS = ("content-type", "etag", "last-modified")
+
+
+@dataclass
+class CachedResponse:
+    """A response row loaded from the persistent cache."""
+
+    family: str
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.stored_at < ttl
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            self.status, headers=self.headers, content=self.body, request=request
+        )
+
+
+class PersistentCache:
+    """SQLite cache of GET responses, safe to share between processes.
+
+    Usage:
+        cache = PersistentCache()
+        cache.open()
+        entry = cache.lookup(location_id, "/opportunities/pipelines", params)
+        if entry and entry.is_fresh(cache.ttl(family)):
+            ...
+    """
+
+    def __init__(self, path: str | Path | None = None, config: CacheConfig | None = None):
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self.config = config or CacheConfig()
+        self.stats = CacheStats()
+        self._db: sqlite3.Connection | None = None
+
+    def open(self) -> None:
+        """Connect to the database, unless already connected."""
+        if self._db is not None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+
+    def family_for(self, endpoint: str) -> CacheFamily | None:
+        return match_family(self.config.families, endpoint)
+
+    def ttl(self, family: CacheFamily) -> float:
+        return self.config.ttl.get(family.name, family.ttl)
+
+    @staticmethod
+    def _params_key(params: dict) -> str:
+        return json.dumps(params, sort_keys=True, default=str)
+
+    def lookup(self, scope: str, endpoint: str, params: dict) -> CachedResponse | None:
+        """Load the stored response for a request, fresh or not."""
+        row = self._db.execute(
+            "SELECT family, status, headers, body, etag, last_modified, stored_at "
+            "FROM responses WHERE scope = ? AND endpoint = ? AND params = ?",
+            (scope, endpoint, self._params_key(params)),
+        ).fetchone()
+        if row is None:
+            return None
+        family, status, headers, body, etag, last_modified, stored_at = row
+        return CachedResponse(
+            family, status, json.loads(headers), body, etag, last_modified, stored_at
+        )
+
+    def store(
+        self, scope: str, endpoint: str, params: dict, family: str, resp: httpx.Response
+    ) -> None:
+        """Save a successful response and its validators."""
+        headers = {k: resp.headers[k] for k in KEPT_HEADERS if k in resp.headers}
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses "
+            "(scope, endpoint, params, family, status, headers, body, etag, last_modified,"
+            " stored_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                scope,
+                endpoint,
+                self._params_key(params),
+                family,
+                resp.status_code,
+                json.dumps(headers),
+                resp.content,
+                resp.headers.get("etag"),
+                resp.headers.get("last-modified"),
+                time.time(),
+            ),
+        )
+
+    def touch(self, scope: str, endpoint: str, params: dict) -> None:
+        """Mark an entry fresh again after a 304 Not Modified."""
+        self.stats.revalidations += 1
+        self._db.execute(
+            "UPDATE responses SET stored_at = ? "
+            "WHERE scope = ? AND endpoint = ? AND params = ?",
+            (time.time(), scope, endpoint, self._params_key(params)),
+        )
+
+    def invalidate(self, scope: str, endpoint: str) -> None:
+        """Drop the family a write to ``endpoint`` touches, for one scope."""
+        family = self.family_for(endpoint)
+        if family is None:
+            return
+        self.stats.invalidations += 1
+        self._db.execute(
+            "DELETE FROM responses WHERE scope = ? AND family = ?", (scope, family.name)
+        )
+
+    def clear(self) -> None:
+        """Drop every stored response."""
+        self._db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -0,0 +1,170 @@
+"""Bulk workflow enrollment - Add many contacts to one workflow, resumably.
+
+``WorkflowsAPI.add_contact`` enrolls one contact per call. An enrollment job
+takes any iterable of contact IDs, enrolls them with bounded concurrency (every
+request still passes the client's rate limiter and retry policy), and records
+each success or failure in a ``Journal``. Running the same job again with the
+same journal skips contacts already enrolled and retries failures. Contact IDs
+are consumed lazily, so a generator over a million IDs is fine.
+
+The report includes throughput and per-enrollment latency percentiles.
+
+Usage:
+    report = await ghl.workflows.bulk_enroll(
+        "workflow_id", contact_ids, concurrency=10, journal="reengage.journal"
+    )
+    print(report.summary())  # 30000 contacts in 310.2s (96.7/s): 29990 enrolled, ... p95 240ms
+"""
+
+from __future__ import annotations
+
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, TYPE_CHECKING
+
+import httpx
+
+from .jobs import describe, keep_error, run_bounded
+from .journal import Journal
+
+if TYPE_CHECKING:
+    from .workflows import WorkflowsAPI
+
+
+def percentile(values: array, q: float) -> float:
+    """Nearest-rank percentile of ``values`` (0 if empty); ``q`` in 0..100."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(q / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+@dataclass
+class EnrollmentReport:
+    """Totals, throughput and latency of a bulk enrollment.
+
+    ``errors`` keeps the first failures; the journal records all of them.
+    Latencies are seconds per enrollment request, including retries and
+    rate-limit waits.
+    """
+
+    workflow_id: str = ""
+    contacts: int = 0
+    enrolled: int = 0
+    resumed: int = 0
+    duplicates: int = 0
+    failed: int = 0
+    errors: list[tuple[str, str]] = field(default_factory=list)
+    latencies: array = field(default_factory=lambda: array("d"))
+    elapsed: float = 0.0
+
+    @property
+    def per_second(self) -> float:
+        done = self.enrolled + self.failed
+        return done / self.elapsed if self.elapsed else 0.0
+
+    def latency(self, q: float) -> float:
+        """Latency percentile in seconds, e.g. ``latency(95)``."""
+        return percentile(self.latencies, q)
+
+    def summary(self) -> str:
+        return (
+            f"{self.contacts} contacts in {self.elapsed:.1f}s ({self.per_second:.1f}/s): "
+            f"{self.enrolled} enrolled, {self.resumed} already done, {self.failed} failed; "
+            f"latency p50 {self.latency(50) * 1000:.0f}ms p95 {self.latency(95) * 1000:.0f}ms "
+            f"p99 {self.latency(99) * 1000:.0f}ms"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "workflow_id": self.workflow_id,
+            "contacts": self.contacts,
+            "enrolled": self.enrolled,
+            "resumed": self.resumed,
+            "duplicates": self.duplicates,
+            "failed": self.failed,
+            "errors": [{"contact_id": cid, "error": error} for cid, error in self.errors],
+            "elapsed": round(self.elapsed, 3),
+            "per_second": round(self.per_second, 1),
+            "latency_ms": {
+                f"p{q}": round(self.latency(q) * 1000, 1) for q in (50, 90, 95, 99, 100)
+            },
+        }
+
+
+class EnrollmentJob:
+    """Enrolls contacts into one workflow with bounded concurrency.
+
+    Args:
+        workflows: The workflows API to enroll through
+        workflow_id: Target workflow
+        location_id: Location of the contacts
+        concurrency: Max enrollments in flight
+        journal: Progress journal for resume (None = no resume)
+        on_progress: Called with the running report after each enrollment
+    """
+
+    def __init__(
+        self,
+        workflows: "WorkflowsAPI",
+        workflow_id: str,
+        location_id: str,
+        concurrency: int = 10,
+        journal: Journal | None = None,
+        on_progress: Callable[[EnrollmentReport], None] | None = None,
+    ):
+        self._workflows = workflows
+        self.workflow_id = workflow_id
+        self.location_id = location_id
+        self.concurrency = concurrency
+        self.journal = journal
+        self.on_progress = on_progress
+        self.report = EnrollmentReport(workflow_id=workflow_id)
+
+    async def _enroll(self, contact_id: str) -> None:
+        report = self.report
+        start = time.perf_counter()
+        try:
+            await self._workflows.add_contact(
+                self.workflow_id, contact_id, location_id=self.location_id
+            )
+        except httpx.HTTPError as e:
+            error = describe(e)
+            report.failed += 1
+            keep_error(report.errors, contact_id, error)
+            if self.journal:
+                self.journal.record(contact_id, error=error)
+        else:
+            report.enrolled += 1
+            if self.journal:
+                self.journal.record(contact_id)
+        report.latencies.append(time.perf_counter() - start)
+        if self.on_progress:
+            self.on_progress(report)
+
+    async def run(self, contact_ids: Iterable[str]) -> EnrollmentReport:
+        """Enroll every contact. Reads IDs only as fast as enrollments finish."""
+        report = self.report
+        journal = self.journal
+        start = time.perf_counter()
+        seen: set[str] = set()
+
+        def pending() -> Iterator[str]:
+            for contact_id in contact_ids:
+                report.contacts += 1
+                if contact_id in seen:
+                    report.duplicates += 1
+                    continue
+                seen.add(contact_id)
+                if journal and journal.is_done(contact_id):
+                    report.resumed += 1
+                    continue
+                yield contact_id
+
+        try:
+            await run_bounded(pending(), self._enroll, self.concurrency)
+        finally:
+            report.elapsed = time.perf_counter() - start
+        return report
@@ -0,0 +1,351 @@
+"""Contact import - Stream CSV/NDJSON rows into contacts, resumably.
+
+Rows are read one at a time (CSV, NDJSON, optionally gzip-compressed), mapped
+to contact fields, and created with bounded concurrency, so memory does not
+grow with the file. Every finished row is written to a ``Journal``; rerunning
+the same import with the same journal skips rows already done, so a crash at
+row 300k resumes at row 300k. Rows that were in flight during a crash (at
+most ``concurrency``) are sent again.
+
+Columns map to contact fields by name ("First Name", "first_name" and
+"firstName" all map to ``firstName``), or to custom fields by the field's name
+or key (resolved and validated through ``client.custom_fields``). Columns
+matching neither are reported as unmapped and ignored. An explicit mapping
+overrides detection: ``{"Mobile": "phone", "Plan": "custom:Subscription
+Plan", "Notes": ""}`` (empty target = ignore). The columns are resolved
+before the first row is sent; a ``custom:`` target naming no field aborts the
+import there, once, instead of failing every row.
+
+Usage:
+    report = await ghl.contacts.import_file("leads.csv", concurrency=10)
+    print(report.summary())
+
+    # Resume after a crash: same file, same journal
+    report = await ghl.contacts.import_file("leads.csv", journal="leads.csv.journal")
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import itertools
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, TYPE_CHECKING
+
+from .. import codec
+from .custom_fields import CustomFieldError, CustomFieldSet, field_key
+from .jobs import describe, keep_error, run_bounded
+from .journal import Journal
+
+if TYPE_CHECKING:
+    from .contacts import ContactsAPI
+
+FORMATS = ("csv", "ndjson")
+
+# Normalized column name -> contact field (API form)
+CONTACT_COLUMNS = {
+    "firstname": "firstName",
+    "lastname": "lastName",
+    "name": "name",
+    "fullname": "name",
+    "email": "email",
+    "emailaddress": "email",
+    "phone": "phone",
+    "phonenumber": "phone",
+    "mobile": "phone",
+    "tags": "tags",
+    "source": "source",
+    "company": "companyName",
+    "companyname": "companyName",
+    "address": "address1",
+    "address1": "address1",
+    "city": "city",
+    "state": "state",
+    "postalcode": "postalCode",
+    "zip": "postalCode",
+    "zipcode": "postalCode",
+    "country": "country",
+    "website": "website",
+    "timezone": "timezone",
+    "dateofbirth": "dateOfBirth",
+    "dnd": "dnd",
+    "customfields": "customFields",
+}
+
+CUSTOM_PREFIX = "custom:"
+WATERMARK_EVERY = 1000
+
+
+def detect_format(path: str | Path, formats: tuple[str, ...] = FORMATS) -> str:
+    """File format from a file name, one of ``formats`` (a trailing .gz is ignored).
+
+    ".jsonl" and ".json" files are NDJSON. Shared by import and export, which
+    accept different formats.
+    """
+    suffixes = [s.lower() for s in Path(path).suffixes if s.lower() != ".gz"]
+    suffix = suffixes[-1].lstrip(".") if suffixes else ""
+    if suffix in ("jsonl", "json"):
+        suffix = "ndjson"
+    if suffix not in formats:
+        raise ValueError(f"Cannot tell the format of {path}; pass format= one of {formats}")
+    return suffix
+
+
+def read_rows(path: str | Path, format: str | None = None) -> Iterator[dict[str, Any]]:
+    """Stream rows from a CSV or NDJSON file (gzip if it ends in .gz), one dict per row."""
+    format = format or detect_format(path)
+    if format not in FORMATS:
+        raise ValueError(f"Unknown format {format!r} (choose from {', '.join(FORMATS)})")
+    path = Path(path)
+    raw = gzip.open(path, "rb") if path.suffix.lower() == ".gz" else open(path, "rb")
+    with raw:
+        if format == "ndjson":
+            for line in raw:
+                if line.strip():
+                    yield codec.loads(line)
+        else:
+            text = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+            yield from csv.DictReader(text)
+
+
+@dataclass
+class ImportReport:
+    """Totals of a contact import.
+
+    ``errors`` keeps the first failures; the journal records all of them.
+    """
+
+    rows: int = 0
+    created: int = 0
+    resumed: int = 0
+    failed: int = 0
+    errors: list[tuple[int, str]] = field(default_factory=list)
+    unmapped: list[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        done = self.created + self.failed
+        return done / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.rows} rows in {self.elapsed:.1f}s ({self.rows_per_second:.0f} rows/s): "
+            f"{self.created} created, {self.resumed} already done, {self.failed} failed"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "created": self.created,
+            "resumed": self.resumed,
+            "failed": self.failed,
+            "errors": [{"row": row, "error": error} for row, error in self.errors],
+            "unmapped": list(self.unmapped),
+            "elapsed": round(self.elapsed, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+class ContactImporter:
+    """Maps rows to contacts and creates them concurrently, journaling progress.
+
+    Args:
+        contacts: The contacts API to write through
+        location_id: Location to import into
+        mapping: Column -> contact field, ``"custom:<name or key>"``, or "" to
+            ignore. Columns not listed are detected by name.
+        concurrency: Max creates in flight
+        source: Lead source for rows without one
+        tags: Tags added to every imported contact
+        journal: Progress journal for resume (None = no resume)
+        on_progress: Called with the running report after each row
+    """
+
+    def __init__(
+        self,
+        contacts: "ContactsAPI",
+        location_id: str,
+        mapping: dict[str, str] | None = None,
+        concurrency: int = 10,
+        source: str = "import",
+        tags: Iterable[str] = (),
+        journal: Journal | None = None,
+        on_progress: Callable[[ImportReport], None] | None = None,
+    ):
+        self._contacts = contacts
+        self.location_id = location_id
+        self.mapping = dict(mapping or {})
+        self.concurrency = concurrency
+        self.source = source
+        self.tags = list(tags)
+        self.journal = journal
+        self.on_progress = on_progress
+        self.report = ImportReport()
+        self._columns: dict[str, tuple[str, str] | None] = {}
+        self._custom_fields = CustomFieldSet()
+
+    # ---------------------------------------------------------------------
+    # Mapping
+    # ---------------------------------------------------------------------
+
+    def _target(self, column: str) -> tuple[str, str] | None:
+        """Where a column goes: ("field", name), ("custom", field ID), or None."""
+        if column in self._columns:
+            return self._columns[column]
+        target = self.mapping.get(column)
+        plan = None
+        if target is None:
+            target = CONTACT_COLUMNS.get(field_key(column))
+        if target == "":
+            pass
+        elif target is None or target.startswith(CUSTOM_PREFIX):
+            name = target[len(CUSTOM_PREFIX):] if target else column
+            found = self._custom_fields.find(name)
+            if found:
+                plan = ("custom", found.id)
+            elif target:
+                raise CustomFieldError(f"Unknown custom field {name!r} for column {column!r}")
+            else:
+                self.report.unmapped.append(column)
+        else:
+            plan = ("field", target)
+        self._columns[column] = plan
+        return plan
+
+    def plan(self, columns: Iterable[str]) -> dict[str, tuple[str, str] | None]:
+        """Resolve the file's columns before any row is imported.
+
+        Every ``custom:`` target in ``mapping`` is checked, whether or not the
+        file has that column, so later rows cannot fail on the mapping.
+
+        Args:
+            columns: Column names (the CSV header, or the first row's keys)
+
+        Returns:
+            Column -> ("field", name), ("custom", field ID), or None (ignored)
+
+        Raises:
+            CustomFieldError: Naming every mapped custom field that does not exist
+        """
+        unknown = []
+        for column, target in self.mapping.items():
+            name = target[len(CUSTOM_PREFIX):] if target.startswith(CUSTOM_PREFIX) else None
+            if name is not None and self._custom_fields.find(name) is None:
+                unknown.append(f"{name!r} (column {column!r})")
+        if unknown:
+            raise CustomFieldError(f"Unknown custom fields: {', '.join(unknown)}")
+        return {column: self._target(column) for column in columns if column is not None}
+
+    def _contact(self, row: dict[str, Any]) -> dict[str, Any]:
+        """A row in API form, per the column plan."""
+        data: dict[str, Any] = {}
+        custom = []
+        for column, value in row.items():
+            target = self._target(column) if column is not None else None
+            if target is None or value is None or value == "":
+                continue
+            kind, name = target
+            if kind == "custom":
+                custom.append({"id": name, "value": value})
+            elif name == "customFields":
+                if isinstance(value, dict):
+                    value = [{"name": k, "value": v} for k, v in value.items()]
+                custom.extend(value)
+            elif name == "tags":
+                if isinstance(value, str):
+                    value = [tag.strip() for tag in value.split(",") if tag.strip()]
+                data["tags"] = list(value)
+            elif name == "name":
+                if isinstance(value, str) and " " in value.strip():
+                    first, last = value.strip().split(" ", 1)
+                    data.setdefault("firstName", first)
+                    data.setdefault("lastName", last.strip())
+                else:
+                    data.setdefault("firstName", value)
+            elif name == "dnd" and isinstance(value, str):
+                data["dnd"] = value.strip().lower() in ("1", "true", "yes", "y")
+            else:
+                data[name] = value.strip() if isinstance(value, str) else value
+        if custom:
+            data["customFields"] = custom
+        if self.tags:
+            data["tags"] = list(dict.fromkeys([*data.get("tags", ()), *self.tags]))
+        return data
+
+    # ---------------------------------------------------------------------
+    # Run
+    # ---------------------------------------------------------------------
+
+    async def _create(self, data: dict[str, Any]) -> dict[str, Any]:
+        return await self._contacts.create(
+            first_name=data.pop("firstName", None),
+            last_name=data.pop("lastName", None),
+            email=data.pop("email", None),
+            phone=data.pop("phone", None),
+            source=data.pop("source", self.source),
+            tags=data.pop("tags", None),
+            custom_fields=data.pop("customFields", None),
+            location_id=self.location_id,
+            **data,
+        )
+
+    async def run(self, rows: Iterable[dict[str, Any]]) -> ImportReport:
+        """Import every row. Reads rows only as fast as creates finish."""
+        report = self.report
+        journal = self.journal
+        start = time.perf_counter()
+        unfinished: set[int] = set()
+        finished = 0
+        next_row = 0
+
+        async def import_row(item: tuple[int, dict[str, Any]]) -> None:
+            nonlocal finished
+            row_no, row = item
+            try:
+                result = await self._create(self._contact(row))
+            except Exception as e:
+                error = describe(e)
+                report.failed += 1
+                keep_error(report.errors, row_no, error)
+                if journal:
+                    journal.record(row_no, error=error)
+            else:
+                report.created += 1
+                if journal:
+                    journal.record(row_no, id=(result.get("contact") or {}).get("id"))
+            finally:
+                unfinished.discard(row_no)
+            finished += 1
+            if journal and finished % WATERMARK_EVERY == 0:
+                journal.advance(min(unfinished, default=next_row))
+            if self.on_progress:
+                self.on_progress(report)
+
+        def pending(rows: Iterator[dict[str, Any]]) -> Iterator[tuple[int, dict[str, Any]]]:
+            nonlocal next_row
+            for row_no, row in enumerate(rows):
+                next_row = row_no + 1
+                report.rows += 1
+                if journal and journal.is_done(row_no):
+                    report.resumed += 1
+                    continue
+                unfinished.add(row_no)
+                yield row_no, row
+
+        self._custom_fields = await self._contacts._client.custom_fields.load(self.location_id)
+        try:
+            rows = iter(rows)
+            first = next(rows, None)
+            if first is not None:
+                self.plan(first)
+                rows = itertools.chain([first], rows)
+            await run_bounded(pending(rows), import_row, self.concurrency)
+            if journal:
+                journal.advance(next_row)
+        finally:
+            report.elapsed = time.perf_counter() - start
+        return report
@@ -0,0 +1,87 @@
+"""Bulk jobs - Bounded-concurrency loop shared by import, enrollment and diff runs.
+
+Each bulk job reads its input lazily, runs one coroutine per item with at
+most ``concurrency`` in flight, and records per-item failures in its report
+(keeping the first ``MAX_ERRORS`` messages) instead of aborting. Items are
+pulled from the iterable only as fast as work finishes, so memory stays
+bounded however large the input is.
+
+Usage:
+    async def work(item) -> None:
+        try:
+            ...
+        except httpx.HTTPError as e:
+            report.failed += 1
+            keep_error(report.errors, item, describe(e))
+
+    await run_bounded(items, work, concurrency=10)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+
+MAX_ERRORS = 100
+
+
+def describe(error: BaseException) -> str:
+    """Error message for a report, falling back to the exception type."""
+    return str(error) or type(error).__name__
+
+
+def keep_error(errors: list[tuple[Any, str]], key: Any, error: str) -> None:
+    """Record a failure in a report's error list, up to ``MAX_ERRORS`` entries."""
+    if len(errors) < MAX_ERRORS:
+        errors.append((key, error))
+
+
+async def run_bounded(
+    items: Iterable[T],
+    work: Callable[[T], Awaitable[None]],
+    concurrency: int,
+) -> None:
+    """Run ``work(item)`` for every item, at most ``concurrency`` at a time.
+
+    ``work`` is expected to record its own per-item failures. An exception
+    escaping it stops reading further items; it is re-raised once the items
+    already in flight have finished. Cancellation cancels everything in flight.
+
+    Args:
+        items: Work items, consumed lazily
+        work: Coroutine function processing one item
+        concurrency: Max items in flight
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks: set[asyncio.Task] = set()
+    crashed: list[BaseException] = []
+
+    async def run(item: T) -> None:
+        try:
+            await work(item)
+        finally:
+            semaphore.release()
+
+    def done(task: asyncio.Task) -> None:
+        tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            crashed.append(task.exception())
+
+    try:
+        for item in items:
+            await semaphore.acquire()
+            if crashed:
+                semaphore.release()
+                break
+            task = asyncio.create_task(run(item))
+            tasks.add(task)
+            task.add_done_callback(done)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if crashed:
+            raise crashed[0]
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,147 @@
+"""Job journal - Append-only progress log for resumable bulk jobs.
+
+Long jobs (imports, bulk enrollments) record every finished item as one
+NDJSON line, flushed as it is written. Rerunning the job with the same
+journal skips the items already done, so a crash at row 300k restarts at row
+300k.
+
+Items are identified by a key: a row number for sequential inputs, or any
+string (e.g. a contact ID). For row numbers, ``advance`` periodically writes a
+watermark line ("every row below N was attempted"); loading keeps only the rows
+finished above the last watermark, so memory stays bounded by the number of
+items in flight rather than the size of the job.
+
+Usage:
+    with Journal("import.journal", meta={"source": "contacts.csv"}) as journal:
+        for row_no, row in rows:
+            if journal.is_done(row_no):
+                continue
+            ...
+            journal.record(row_no, id=contact_id)        # or error="..."
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Hashable
+
+from .. import codec
+
+
+class Journal:
+    """Progress log of a resumable job.
+
+    Args:
+        path: Journal file; created if missing, resumed if present
+        meta: Describes the job (source file, target workflow...). Resuming a
+            journal written with different meta raises ValueError.
+        retry_failed: Treat items that failed last time as not done
+
+    Attributes:
+        watermark: Every integer key below this has been attempted
+        completed: Keys done beyond the watermark
+        failed: Keys whose last attempt failed, with the error
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        meta: dict[str, Any] | None = None,
+        retry_failed: bool = True,
+    ):
+        self.path = Path(path)
+        self.meta = meta or {}
+        self.retry_failed = retry_failed
+        self.watermark = 0
+        self.completed: set[Hashable] = set()
+        self.failed: dict[Hashable, str] = {}
+
+        if self.path.exists():
+            self._load()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab")
+        if self._file.tell() == 0:
+            self._write({"meta": self.meta})
+
+    def _load(self) -> None:
+        with open(self.path, "r+b") as f:
+            good = 0
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("unterminated line")
+                    entry = codec.loads(line)
+                except ValueError:
+                    # Torn last line from a crash; drop it so appends start clean
+                    f.truncate(good)
+                    break
+                good += len(line)
+                if "meta" in entry:
+                    if self.meta and entry["meta"] != self.meta:
+                        raise ValueError(
+                            f"Journal {self.path} belongs to a different job: {entry['meta']}"
+                        )
+                    self.meta = entry["meta"]
+                elif "watermark" in entry:
+                    self.watermark = entry["watermark"]
+                    self._prune()
+                elif "error" in entry:
+                    self.completed.discard(entry["key"])
+                    self.failed[entry["key"]] = entry["error"]
+                else:
+                    self.failed.pop(entry["key"], None)
+                    self.completed.add(entry["key"])
+
+    def _write(self, entry: dict[str, Any]) -> None:
+        self._file.write(codec.dumps(entry) + b"\n")
+        self._file.flush()
+
+    def _prune(self) -> None:
+        self.completed = {
+            key for key in self.completed if not isinstance(key, int) or key >= self.watermark
+        }
+
+    def is_done(self, key: Hashable) -> bool:
+        """Whether an item finished in a previous run (or this one)."""
+        if key in self.failed:
+            return not self.retry_failed
+        return (isinstance(key, int) and key < self.watermark) or key in self.completed
+
+    def record(self, key: Hashable, error: str | None = None, **detail: Any) -> None:
+        """Record an item as done, or as failed when ``error`` is given."""
+        entry = {"key": key, **detail}
+        if error is not None:
+            entry["error"] = error
+            self.completed.discard(key)
+            self.failed[key] = error
+        else:
+            self.failed.pop(key, None)
+            self.completed.add(key)
+        self._write(entry)
+
+    def advance(self, watermark: int) -> None:
+        """Record that every integer key below ``watermark`` has been attempted.
+
+        Failed keys below the watermark stay in ``failed`` and are still
+        retried on resume when ``retry_failed`` is set.
+        """
+        if watermark <= self.watermark:
+            return
+        self.watermark = watermark
+        self._prune()
+        self._write({"watermark": watermark})
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,61 @@
+"""Key normalization - Canonical email and phone forms for contact matching.
+
+GHL matches duplicates on email and phone, but imported data spells them
+many ways ("John@Example.COM ", "(555) 123-4567", "+1 555.123.4567"). These
+helpers reduce both to one canonical key so rows can be matched locally:
+
+    normalize_email(" John@Example.COM ")   -> "john@example.com"
+    normalize_phone("(555) 123-4567")       -> "+15551234567"
+    normalize_phone("020 7946 0958", "44")  -> "+442079460958"
+"""
+
+from __future__ import annotations
+
+import re
+
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_NON_DIGITS = re.compile(r"\D")
+
+
+def normalize_email(email: str | None) -> str | None:
+    """Lowercase and strip an email address. Returns None if it is not an email."""
+    if not email:
+        return None
+    email = email.strip().lower()
+    return email if _EMAIL_RE.match(email) else None
+
+
+def normalize_phone(phone: str | None, default_country_code: str = "1") -> str | None:
+    """Convert a phone number to E.164 (+<country code><number>).
+
+    Numbers without an international prefix are assumed to belong to
+    ``default_country_code``; a single national trunk prefix ("0") is
+    dropped. Returns None if too few or too many digits remain.
+
+    Args:
+        phone: Phone number in any common notation
+        default_country_code: Calling code for national numbers (default: "1", NANP)
+    """
+    if not phone:
+        return None
+    phone = phone.strip()
+    international = phone.startswith("+") or phone.startswith("00")
+    digits = _NON_DIGITS.sub("", phone)
+    if phone.startswith("00"):
+        digits = digits[2:]
+
+    if not international:
+        if default_country_code == "1" and len(digits) == 11 and digits.startswith("1"):
+            pass  # NANP number written with its country code
+        else:
+            if digits.startswith("0"):
+                if default_country_code == "1":
+                    return None  # No trunk prefix in NANP
+                digits = digits[1:]
+            digits = default_country_code + digits
+
+    if not 8 <= len(digits) <= 15:
+        return None
+    if digits.startswith("1") and len(digits) != 11:
+        return None  # NANP numbers are always 1 + 10 digits
+    return "+" + digits
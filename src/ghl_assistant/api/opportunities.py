@@ -2,12 +2,29 @@
 
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, TYPE_CHECKING
+
+from ..models import Opportunity
+from .pagination import cursor_pages, merge_streams
 
 if TYPE_CHECKING:
     from .client import GHLClient
 
 
+@dataclass
+class ShardProgress:
+    """Progress of one pipeline stage during ``OpportunitiesAPI.iter_all``."""
+
+    pipeline_id: str
+    stage_id: str | None
+    pages: int = 0
+    records: int = 0
+    duplicates: int = 0
+    total: int | None = None
+    done: bool = False
+
+
 class OpportunitiesAPI:
     """Opportunities/Pipelines API for GoHighLevel.
 
@@ -27,6 +44,10 @@ class OpportunitiesAPI:
 
             # Move to new stage
             await ghl.opportunities.move_stage("opp_id", "new_stage_id")
+
+            # Scan every opportunity, one concurrent shard per stage
+            async for opp in ghl.opportunities.iter_all(concurrency=8):
+                ...
     """
 
     def __init__(self, client: "GHLClient"):
@@ -55,6 +76,7 @@ class OpportunitiesAPI:
         contact_id: str | None = None,
         limit: int = 20,
         location_id: str | None = None,
+        as_records: bool = False,
     ) -> dict[str, Any]:
         """List opportunities.
 
@@ -64,6 +86,7 @@ class OpportunitiesAPI:
             contact_id: Filter by contact
             limit: Max results
             location_id: Override default location
+            as_records: Return opportunities as compact ``Opportunity`` records
 
         Returns:
             {"opportunities": [...], "meta": {...}}
@@ -77,7 +100,94 @@ class OpportunitiesAPI:
         if contact_id:
             params["contactId"] = contact_id
 
-        return await self._client._get("/opportunities/", **params)
+        result = await self._client._get("/opportunities/", **params)
+        return Opportunity.from_page(result, "opportunities") if as_records else result
+
+    async def iter_all(
+        self,
+        pipeline_id: str | None = None,
+        concurrency: int = 8,
+        page_size: int = 100,
+        location_id: str | None = None,
+        as_records: bool = False,
+        on_progress: Callable[[ShardProgress], None] | None = None,
+    ) -> AsyncIterator[dict[str, Any] | Opportunity]:
+        """Iterate over every opportunity, scanning pipeline stages in parallel.
+
+        Lists pipelines, then runs one cursor-paginated scan per stage (a
+        shard), up to ``concurrency`` at once, and merges them into a single
+        stream in arrival order. An opportunity that moves stage mid-scan can
+        show up in two shards; only the first copy is yielded.
+
+        Args:
+            pipeline_id: Only scan this pipeline's stages (default: all pipelines)
+            concurrency: Max shards scanned at once
+            page_size: Opportunities per request (max 100)
+            location_id: Override default location
+            as_records: Yield compact ``Opportunity`` records instead of dicts
+            on_progress: Called with the shard's ``ShardProgress`` after each page
+
+        Yields:
+            Opportunity dicts (or records)
+
+        Usage:
+            def report(p: ShardProgress):
+                print(f"{p.stage_id}: {p.records}/{p.total}{' done' if p.done else ''}")
+
+            async for opp in ghl.opportunities.iter_all(on_progress=report):
+                ...
+        """
+        lid = location_id or self._location_id
+        limit = min(page_size, 100)
+
+        pipelines = (await self.pipelines(location_id=lid)).get("pipelines") or []
+        shards = []
+        for pipeline in pipelines:
+            if pipeline_id and pipeline.get("id") != pipeline_id:
+                continue
+            stages = pipeline.get("stages") or [{"id": None}]
+            shards.extend(ShardProgress(pipeline["id"], stage.get("id")) for stage in stages)
+
+        seen: set[str] = set()
+
+        async def scan(shard: ShardProgress) -> AsyncIterator[dict[str, Any] | Opportunity]:
+            params = {"locationId": lid, "limit": limit, "pipelineId": shard.pipeline_id}
+            if shard.stage_id:
+                params["stageId"] = shard.stage_id
+
+            async def fetch(cursor: dict[str, Any]) -> dict[str, Any]:
+                result = await self._client._get("/opportunities/", **params, **cursor)
+                return Opportunity.from_page(result, "opportunities") if as_records else result
+
+            def next_cursor(page: dict[str, Any]) -> dict[str, Any] | None:
+                meta = page.get("meta") or {}
+                if len(page.get("opportunities") or []) < limit or not meta.get("startAfterId"):
+                    return None
+                cursor = {"startAfterId": meta["startAfterId"]}
+                if meta.get("startAfter") is not None:
+                    cursor["startAfter"] = meta["startAfter"]
+                return cursor
+
+            async for page in cursor_pages(fetch, next_cursor, prefetch=False):
+                shard.pages += 1
+                if shard.total is None:
+                    shard.total = (page.get("meta") or {}).get("total")
+                for opp in page.get("opportunities") or []:
+                    oid = opp.id if as_records else opp.get("id")
+                    if oid in seen:
+                        shard.duplicates += 1
+                        continue
+                    seen.add(oid)
+                    shard.records += 1
+                    yield opp
+                if on_progress:
+                    on_progress(shard)
+            shard.done = True
+            if on_progress:
+                on_progress(shard)
+
+        async for opp in merge_streams((scan(shard) for shard in shards), concurrency):
+            yield opp
 
     async def get(self, opportunity_id: str) -> dict[str, Any]:
         """Get opportunity details.
@@ -0,0 +1,261 @@
+"""Pagination helpers - Async iteration over paginated endpoints.
+
+List endpoints return one page at a time. These helpers turn a page fetcher
+into an async iterator:
+
+- ``cursor_pages`` follows a cursor (startAfter/startAfterId), keeping one
+  page in flight ahead of the consumer so network time overlaps with
+  processing while memory stays bounded to two pages.
+- ``numbered_pages`` serves page-number endpoints: once the first page
+  reveals the total, the remaining pages are fetched concurrently.
+
+Usage:
+    async def fetch(cursor: dict) -> dict:
+        return await client._get("/contacts/", locationId=lid, limit=100, **cursor)
+
+    def next_cursor(page: dict) -> dict | None:
+        meta = page.get("meta") or {}
+        return {"startAfterId": meta["startAfterId"]} if meta.get("startAfterId") else None
+
+    async for page in cursor_pages(fetch, next_cursor):
+        ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+Page = dict[str, Any]
+Cursor = dict[str, Any]
+
+
+async def cursor_pages(
+    fetch: Callable[[Cursor], Awaitable[Page]],
+    next_cursor: Callable[[Page], Cursor | None],
+    start: Cursor | None = None,
+    prefetch: bool = True,
+) -> AsyncIterator[Page]:
+    """Iterate over pages of a cursor-paginated endpoint.
+
+    Args:
+        fetch: Coroutine function fetching the page for a cursor
+        next_cursor: Returns the cursor of the following page, or None on the last page
+        start: Cursor of the first page (default: no cursor)
+        prefetch: Request the next page before yielding the current one
+
+    Yields:
+        Response pages in order
+    """
+    cursor = start or {}
+    seen = set()
+    pending: asyncio.Task | None = asyncio.ensure_future(fetch(cursor))
+    try:
+        while pending is not None:
+            page = await pending
+            pending = None
+            cursor = next_cursor(page)
+            if cursor is not None:
+                # A backend that echoes the same cursor would loop forever
+                marker = tuple(sorted((k, repr(v)) for k, v in cursor.items()))
+                if marker in seen:
+                    cursor = None
+                seen.add(marker)
+            if cursor is not None and prefetch:
+                pending = asyncio.ensure_future(fetch(cursor))
+            yield page
+            if cursor is not None and not prefetch:
+                pending = asyncio.ensure_future(fetch(cursor))
+    finally:
+        if pending is not None:
+            if pending.done():
+                if not pending.cancelled():
+                    pending.exception()  # Consumer stopped early; don't warn about it
+            else:
+                pending.cancel()
+
+
+async def numbered_pages(
+    fetch: Callable[[int], Awaitable[Page]],
+    page_count: Callable[[Page], int],
+    concurrency: int = 8,
+    ordered: bool = True,
+) -> AsyncIterator[tuple[int, Page]]:
+    """Fetch every page of a page-number-paginated endpoint concurrently.
+
+    The first page is fetched alone to learn the page count; the rest are
+    fetched with at most ``concurrency`` requests in flight (each still passes
+    through the client's rate limiter). In ordered mode, pages that complete
+    early are held back until their predecessors arrive, and no more than
+    ``2 * concurrency`` pages are ever buffered.
+
+    Args:
+        fetch: Coroutine function fetching a page by number (1-based)
+        page_count: Returns the total number of pages given the first page
+        concurrency: Max concurrent page requests
+        ordered: Yield pages in page order; otherwise as they arrive
+
+    Yields:
+        (page_number, page) tuples
+    """
+    first = await fetch(1)
+    last = page_count(first)
+    yield 1, first
+
+    window = 2 * max(concurrency, 1)
+    next_page = 2
+    next_yield = 2
+    running: dict[asyncio.Task, int] = {}
+    finished_pages: dict[int, Page] = {}
+    try:
+        while next_page <= last or running:
+            while (
+                next_page <= last
+                and len(running) < concurrency
+                and (not ordered or next_page < next_yield + window)
+            ):
+                running[asyncio.ensure_future(fetch(next_page))] = next_page
+                next_page += 1
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                number = running.pop(task)
+                page = task.result()
+                if ordered:
+                    finished_pages[number] = page
+                else:
+                    yield number, page
+
+            while next_yield in finished_pages:
+                yield next_yield, finished_pages.pop(next_yield)
+                next_yield += 1
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+
+class _Failure:
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+_DONE = object()
+
+
+async def merge_streams(
+    streams: Iterable[AsyncIterator[T]],
+    concurrency: int = 4,
+    buffer: int = 256,
+) -> AsyncIterator[T]:
+    """Consume several async iterators concurrently and yield their items as one stream.
+
+    At most ``concurrency`` streams are consumed at a time; the next stream
+    starts when one finishes. Items are handed over through a queue of
+    ``buffer`` slots, so fast producers wait for the consumer instead of
+    piling up in memory. The first error raised by any stream is re-raised
+    and the remaining streams are cancelled.
+
+    Args:
+        streams: Async iterators to merge (started lazily, in order)
+        concurrency: Max streams consumed at once
+        buffer: Max items waiting for the consumer
+
+    Yields:
+        Items in arrival order
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=buffer)
+    sources = iter(streams)
+
+    async def worker() -> None:
+        try:
+            for stream in sources:
+                async for item in stream:
+                    await queue.put(item)
+        except Exception as e:
+            await queue.put(_Failure(e))
+        else:
+            await queue.put(_DONE)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(max(concurrency, 1))]
+    live = len(workers)
+    try:
+        while live:
+            item = await queue.get()
+            if item is _DONE:
+                live -= 1
+            elif isinstance(item, _Failure):
+                raise item.error
+            else:
+                yield item
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def concat_streams(
+    streams: AsyncIterable[AsyncIterator[T]],
+    concurrency: int = 4,
+    buffer: int = 256,
+) -> AsyncIterator[T]:
+    """Yield every item of each stream in turn, reading ahead into later streams.
+
+    Output order is the same as iterating the streams one after another, but
+    up to ``concurrency`` streams run at once: while the head stream is being
+    consumed, the next ones fill their own queues of ``buffer`` items, so
+    memory stays bounded at ``concurrency * buffer`` items.
+
+    Args:
+        streams: Async iterable of async iterators, consumed in order
+        concurrency: Max streams read at once (including the head)
+        buffer: Max items buffered per stream
+
+    Yields:
+        Items, stream by stream
+    """
+    sources = aiter(streams)
+    window: deque[tuple[asyncio.Queue, asyncio.Task]] = deque()
+    exhausted = False
+
+    async def pump(stream: AsyncIterator[T], queue: asyncio.Queue) -> None:
+        try:
+            async for item in stream:
+                await queue.put(item)
+        except Exception as e:
+            await queue.put(_Failure(e))
+        else:
+            await queue.put(_DONE)
+
+    async def fill() -> None:
+        nonlocal exhausted
+        while not exhausted and len(window) < max(concurrency, 1):
+            stream = await anext(sources, None)
+            if stream is None:
+                exhausted = True
+                return
+            queue: asyncio.Queue = asyncio.Queue(maxsize=buffer)
+            window.append((queue, asyncio.ensure_future(pump(stream, queue))))
+
+    try:
+        await fill()
+        while window:
+            queue, _ = window[0]
+            item = await queue.get()
+            if item is _DONE:
+                window.popleft()
+                await fill()
+            elif isinstance(item, _Failure):
+                raise item.error
+            else:
+                yield item
+    finally:
+        tasks = [task for _, task in window]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
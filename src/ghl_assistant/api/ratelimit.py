@@ -0,0 +1,184 @@
+"""Rate limiting - Token-bucket request scheduler for the GHL API.
+
+GHL enforces a burst limit per location (100 requests per 10 seconds) and a
+daily limit. Every response reports the current budget in headers:
+
+    X-RateLimit-Max                     Burst capacity
+    X-RateLimit-Remaining               Requests left in the current burst interval
+    X-RateLimit-Interval-Milliseconds   Length of the burst interval
+    X-RateLimit-Limit-Daily             Daily capacity
+    X-RateLimit-Daily-Remaining         Requests left today
+
+The limiter keeps a local token bucket sized just under the advertised burst
+limit, tightens it whenever the server reports less headroom than expected,
+and blocks all callers for the duration of a ``Retry-After`` after a 429.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Mapping
+
+
+@dataclass
+class RateLimitConfig:
+    """Rate limiter settings for a GHLClient.
+
+    Attributes:
+        enabled: Schedule requests through the token bucket (default True)
+        burst: Requests allowed per interval until the server reports its own limit
+        interval: Burst interval in seconds until the server reports its own
+        headroom: Fraction of the burst limit to use (keeps us just under the limit)
+        max_429_retries: How many times a 429 response is waited out and re-sent
+        default_retry_after: Seconds to wait after a 429 without a Retry-After header
+    """
+
+    enabled: bool = True
+    burst: int = 100
+    interval: float = 10.0
+    headroom: float = 0.9
+    max_429_retries: int = 5
+    default_retry_after: float = 10.0
+
+
+@dataclass
+class RateLimitStats:
+    """Counters describing limiter behaviour."""
+
+    requests: int = 0
+    throttled: int = 0
+    wait_seconds: float = 0.0
+    rate_limited: int = 0
+    daily_remaining: int | None = None
+    daily_limit: int | None = None
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "wait_seconds": round(self.wait_seconds, 3),
+            "rate_limited": self.rate_limited,
+            "daily_remaining": self.daily_remaining,
+            "daily_limit": self.daily_limit,
+        }
+
+
+def parse_retry_after(value: str | None, default: float) -> float:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> int | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """Token-bucket scheduler shared by every request a client makes.
+
+    Callers queue on a FIFO lock, so requests are released in the order they
+    were issued at a steady rate of ``capacity / interval`` per second.
+
+    Usage:
+        limiter = RateLimiter(RateLimitConfig(burst=100, interval=10))
+        await limiter.acquire()
+        resp = await http.get(...)
+        limiter.update(resp.headers)
+    """
+
+    def __init__(self, config: RateLimitConfig | None = None):
+        self.config = config or RateLimitConfig()
+        self.stats = RateLimitStats()
+        self._lock = asyncio.Lock()
+        self._limit = self.config.burst
+        self._interval = self.config.interval
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+    @property
+    def capacity(self) -> int:
+        """Tokens available per interval after applying headroom."""
+        return max(1, int(self._limit * self.config.headroom))
+
+    @property
+    def rate(self) -> float:
+        """Token refill rate in requests per second."""
+        return self.capacity / self._interval
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(float(self.capacity), self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent, then consume one token."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        self.stats.requests += 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+                self.stats.throttled += 1
+                self.stats.wait_seconds += wait
+                await asyncio.sleep(wait)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Adjust the bucket from rate-limit response headers."""
+        limit = _header_int(headers, "x-ratelimit-max")
+        interval_ms = _header_int(headers, "x-ratelimit-interval-milliseconds")
+        remaining = _header_int(headers, "x-ratelimit-remaining")
+
+        now = time.monotonic()
+        self._refill(now)
+
+        if limit and limit > 0:
+            self._limit = limit
+        if interval_ms and interval_ms > 0:
+            self._interval = interval_ms / 1000
+        if remaining is not None:
+            # Keep the same safety margin below the server's view of the budget
+            reserve = self._limit - self.capacity
+            self._tokens = min(self._tokens, float(remaining - reserve))
+
+        daily_limit = _header_int(headers, "x-ratelimit-limit-daily")
+        daily_remaining = _header_int(headers, "x-ratelimit-daily-remaining")
+        if daily_limit is not None:
+            self.stats.daily_limit = daily_limit
+        if daily_remaining is not None:
+            self.stats.daily_remaining = daily_remaining
+
+    def penalize(self, retry_after: float) -> None:
+        """Block every caller for ``retry_after`` seconds after a 429."""
+        now = time.monotonic()
+        self.stats.rate_limited += 1
+        self._blocked_until = max(self._blocked_until, now + retry_after)
+        self._tokens = 0.0
+        self._updated = now
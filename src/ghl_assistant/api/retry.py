@@ -0,0 +1,101 @@
+"""Retry policy - Jittered exponential backoff for transient GHL failures.
+
+Requests are classified before being re-sent:
+
+- Failures where the request never reached GHL (connection refused, connect
+  timeout, pool timeout) are safe to retry for every verb.
+- Idempotent verbs (GET, PUT, DELETE) are retried on transient errors
+  (502/503/504, connection resets, read timeouts).
+- Non-idempotent verbs (POST) are retried only when the caller supplies an
+  idempotency guard: an async lookup that runs before each re-send and either
+  returns the record the failed attempt already created (no re-send) or
+  ``None`` (safe to send again), or when the caller marks the write
+  ``retry_safe`` because applying it twice changes nothing (adding a tag).
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+IdempotencyGuard = Callable[[], Awaitable[Any]]
+
+# Errors raised before the request was written to the wire
+NOT_SENT_ERRORS: tuple[type[Exception], ...] = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+)
+
+
+@dataclass
+class RetryPolicy:
+    """Retry settings for a GHLClient.
+
+    Attributes:
+        enabled: Retry transient failures (default True)
+        max_attempts: Total attempts per request, including the first
+        base_delay: Backoff ceiling for the first retry, in seconds
+        max_delay: Upper bound on any single backoff, in seconds
+        retry_statuses: HTTP statuses treated as transient
+        idempotent_methods: Verbs that may be re-sent without a guard
+    """
+
+    enabled: bool = True
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 20.0
+    retry_statuses: frozenset[int] = frozenset({500, 502, 503, 504})
+    idempotent_methods: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number ``attempt`` (1-based)."""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def is_transient(self, error: Exception | None, status: int | None) -> bool:
+        """Whether a failure is worth retrying at all."""
+        if error is not None:
+            return isinstance(error, httpx.TransportError)
+        return status in self.retry_statuses
+
+
+@dataclass
+class RetryMetrics:
+    """Counters describing retry behaviour, for tuning throughput."""
+
+    retries: int = 0
+    recovered: int = 0
+    give_ups: int = 0
+    not_retried: int = 0
+    guard_checks: int = 0
+    guard_hits: int = 0
+    backoff_seconds: float = 0.0
+    reasons: dict[str, int] = field(default_factory=dict)
+
+    def record_retry(self, reason: str, delay: float) -> None:
+        self.retries += 1
+        self.backoff_seconds += delay
+        self.reasons[reason] = self.reasons.get(reason, 0) + 1
+
+    def to_dict(self) -> dict:
+        return {
+            "retries": self.retries,
+            "recovered": self.recovered,
+            "give_ups": self.give_ups,
+            "not_retried": self.not_retried,
+            "guard_checks": self.guard_checks,
+            "guard_hits": self.guard_hits,
+            "backoff_seconds": round(self.backoff_seconds, 3),
+            "reasons": dict(self.reasons),
+        }
+
+
+def failure_reason(error: Exception | None, status: int | None) -> str:
+    """Short label for a failed attempt, used as a metrics key."""
+    if error is not None:
+        return type(error).__name__
+    return str(status)
@@ -0,0 +1,222 @@
+"""Session helpers - Credential profiles, token identity and resolved IDs.
+
+Session files hold every captured request and response body and can grow to
+hundreds of MB, yet a client only needs one token and three IDs. Capture
+therefore writes a compact profile next to each session:
+
+    data/network_logs/session_20240101_120000.json   Full capture
+    data/network_logs/profile_20240101_120000.json   Token + IDs
+    data/network_logs/latest.json                    Points at the newest pair
+
+Sessions captured before profiles existed get one written on first load.
+
+IDs resolved after opening a client (``search_locations``) are persisted in
+``resolved_ids.json`` next to the session, keyed by token identity, so later
+opens can skip that round trip.
+
+Token identity comes from the JWT claims (user and company), so a refreshed
+token for the same account keeps hitting the same entry; opaque tokens fall
+back to a hash of the token itself.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import re
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+LOG_DIR = Path(__file__).parent.parent.parent.parent / "data" / "network_logs"
+RESOLVED_IDS_FILE = "resolved_ids.json"
+LATEST_FILE = "latest.json"
+
+ID_FIELDS = ("user_id", "company_id", "location_id")
+
+
+def decode_jwt_claims(token: str) -> dict[str, Any]:
+    """Decode a JWT payload without verifying it. Returns {} for opaque tokens."""
+    parts = token.split(".")
+    if len(parts) != 3:
+        return {}
+    try:
+        payload = base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4))
+        claims = json.loads(payload)
+    except (ValueError, UnicodeDecodeError):
+        return {}
+    return claims if isinstance(claims, dict) else {}
+
+
+def token_identity(token: str) -> str:
+    """Stable identity of the account a token belongs to."""
+    claims = decode_jwt_claims(token)
+    user = claims.get("user_id") or claims.get("userId") or claims.get("sub")
+    company = claims.get("company_id") or claims.get("companyId") or ""
+    if user:
+        return f"{user}:{company}"
+    return "sha256:" + hashlib.sha256(token.encode()).hexdigest()[:32]
+
+
+def extract_ids(api_calls: list[dict]) -> dict[str, str | None]:
+    """Scan captured API call URLs for user, company and location IDs."""
+    user_id = None
+    company_id = None
+    location_id = None
+
+    for call in api_calls:
+        url = call.get("url", "")
+        if "/users/" in url and not user_id:
+            parts = url.split("/users/")
+            if len(parts) > 1:
+                uid = parts[1].split("/")[0].split("?")[0]
+                if uid and uid != "identify":
+                    user_id = uid
+        if "companyId=" in url and not company_id:
+            match = re.search(r"companyId=([a-zA-Z0-9]+)", url)
+            if match:
+                company_id = match.group(1)
+        if "locationId=" in url and not location_id:
+            match = re.search(r"locationId=([a-zA-Z0-9]+)", url)
+            if match and match.group(1) != "undefined":
+                location_id = match.group(1)
+        if user_id and company_id and location_id:
+            break
+
+    return {"user_id": user_id, "company_id": company_id, "location_id": location_id}
+
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _read_resolved_ids(path: Path) -> dict[str, Any]:
+    """All entries in ``resolved_ids.json``; {} when it is missing, unreadable or corrupt."""
+    try:
+        with open(path) as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def load_resolved_ids(token: str, session_dir: str | Path | None = None) -> dict[str, str]:
+    """Return previously resolved IDs for the token's account, or {}."""
+    entry = _read_resolved_ids(Path(session_dir or LOG_DIR) / RESOLVED_IDS_FILE).get(
+        token_identity(token)
+    )
+    if not isinstance(entry, dict):
+        return {}
+    return {key: entry[key] for key in ID_FIELDS if entry.get(key)}
+
+
+def save_resolved_ids(
+    token: str, ids: dict[str, str | None], session_dir: str | Path | None = None
+) -> None:
+    """Merge resolved IDs for the token's account into ``resolved_ids.json``."""
+    path = Path(session_dir or LOG_DIR) / RESOLVED_IDS_FILE
+    entries = _read_resolved_ids(path)
+
+    identity = token_identity(token)
+    entry = entries.get(identity)
+    if not isinstance(entry, dict):
+        entry = {}
+    changed = False
+    for key in ID_FIELDS:
+        if ids.get(key) and entry.get(key) != ids[key]:
+            entry[key] = ids[key]
+            changed = True
+    if not changed:
+        return
+
+    entry["resolved_at"] = datetime.now().isoformat()
+    entries[identity] = entry
+    try:
+        _write_json_atomic(path, entries)
+    except OSError:
+        pass  # Caching resolved IDs is best effort
+
+
+# =========================================================================
+# Credential profiles
+# =========================================================================
+
+
+def profile_path_for(session_path: str | Path) -> Path:
+    """Profile file belonging to a session file (session_X.json -> profile_X.json)."""
+    path = Path(session_path)
+    stem = path.stem
+    if stem.startswith("profile_"):
+        return path
+    suffix = stem[len("session_"):] if stem.startswith("session_") else stem
+    return path.with_name(f"profile_{suffix}.json")
+
+
+def write_profile(
+    session_path: str | Path,
+    token: str,
+    ids: dict[str, str | None],
+    captured_at: str | None = None,
+) -> dict[str, Any]:
+    """Write the compact credential profile for a session file."""
+    profile = {
+        "token": token,
+        "identity": token_identity(token),
+        **{key: ids.get(key) for key in ID_FIELDS},
+        "captured_at": captured_at or datetime.now().isoformat(),
+        "session_file": Path(session_path).name,
+    }
+    try:
+        _write_json_atomic(profile_path_for(session_path), profile)
+    except OSError:
+        pass  # Profiles are an optimization; the session file stays authoritative
+    return profile
+
+
+def load_profile(session_path: str | Path) -> dict[str, Any] | None:
+    """Load the profile for a session file, or None if it has none."""
+    try:
+        with open(profile_path_for(session_path)) as f:
+            profile = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return profile if isinstance(profile, dict) and profile.get("token") else None
+
+
+def update_latest(session_path: str | Path) -> None:
+    """Point ``latest.json`` at a freshly captured session and its profile."""
+    path = Path(session_path)
+    _write_json_atomic(
+        path.parent / LATEST_FILE,
+        {"session": path.name, "profile": profile_path_for(path).name},
+    )
+
+
+def latest_session(log_dir: str | Path | None = None) -> Path:
+    """Most recent session file, via ``latest.json`` when present."""
+    log_dir = Path(log_dir or LOG_DIR)
+    try:
+        with open(log_dir / LATEST_FILE) as f:
+            pointer = json.load(f)
+        session = log_dir / pointer["session"]
+        if session.exists() or profile_path_for(session).exists():
+            return session
+    except (FileNotFoundError, ValueError, KeyError, TypeError):
+        pass
+
+    # No pointer yet (sessions captured by older versions): newest by name
+    sessions = sorted(log_dir.glob("session_*.json"))
+    if not sessions:
+        raise FileNotFoundError("No session files found. Run 'ghl auth login' first.")
+    return sessions[-1]
@@ -0,0 +1,203 @@
+"""Tag batching - Merge tag additions and removals into one change per contact.
+
+Tags are changed through GHL's per-contact tag endpoints (POST and DELETE
+``/contacts/{id}/tags``), which send only the tags added or removed. No read
+is needed first, and tags other writers added or removed in the meantime are
+left alone; writing the whole ``tags`` list from a copy read earlier would
+silently undo them.
+
+``TagBuffer`` collects add/remove operations and merges them per contact (the
+last operation on a tag wins), then on flush sends each contact's net change:
+one request for additions and one for removals.
+
+Usage:
+    async with ghl.contacts.tag_buffer(concurrency=10) as tags:
+        for contact_id in hot_leads:
+            tags.add(contact_id, "hot-lead")
+            tags.remove(contact_id, "cold")
+    # flushed on exit; see tags.report
+
+    report = await ghl.contacts.bulk_tag(contact_ids, add=["webinar-2024"])
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterable, TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from .contacts import ContactsAPI
+
+
+def apply_tag_ops(current: list[str], ops: dict[str, bool]) -> list[str]:
+    """Apply merged operations ({tag: True to add, False to remove}) to a tag list.
+
+    Tags compare case-insensitively, as GHL stores them lowercased.
+    """
+    wanted = {tag.casefold(): add for tag, add in ops.items()}
+    tags = [tag for tag in current if wanted.get(tag.casefold(), True)]
+    present = {tag.casefold() for tag in tags}
+    for tag, add in ops.items():
+        if add and tag.casefold() not in present:
+            tags.append(tag)
+            present.add(tag.casefold())
+    return tags
+
+
+def split_tag_ops(ops: dict[str, bool]) -> tuple[list[str], list[str]]:
+    """Merged operations as (tags to add, tags to remove)."""
+    return [tag for tag, add in ops.items() if add], [tag for tag, add in ops.items() if not add]
+
+
+async def write_tags(
+    contacts: "ContactsAPI", contact_id: str, ops: dict[str, bool]
+) -> dict[str, Any]:
+    """Apply tag operations to one contact as deltas, without reading it.
+
+    Args:
+        contacts: The contacts API to write through
+        contact_id: The contact ID
+        ops: Merged operations, {tag: True to add, False to remove}
+
+    Returns:
+        The last tag endpoint response ({"tags": [...]} after the change)
+    """
+    client = contacts._client
+    add, remove = split_tag_ops(ops)
+    result: dict[str, Any] = {}
+    try:
+        if remove:
+            result = await client._delete(f"/contacts/{contact_id}/tags", {"tags": remove})
+        if add:
+            # Adding a tag that is already present is a no-op, so a re-send is safe
+            result = await client._post(
+                f"/contacts/{contact_id}/tags", {"tags": add}, retry_safe=True
+            )
+    finally:
+        tags = result.get("tags")
+        if isinstance(tags, list):
+            client.contact_state.merge(contact_id, {"tags": tags})
+        else:
+            client.contact_state.invalidate(contact_id)
+    return result
+
+
+@dataclass
+class TagFlushReport:
+    """Outcome of flushing a ``TagBuffer``."""
+
+    contacts: int = 0
+    operations: int = 0
+    writes: int = 0
+    failed: dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def requests(self) -> int:
+        return self.writes
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "contacts": self.contacts,
+            "operations": self.operations,
+            "writes": self.writes,
+            "failed": dict(self.failed),
+            "requests": self.requests,
+            "elapsed": round(self.elapsed, 3),
+        }
+
+
+class TagBuffer:
+    """Pending tag operations, merged per contact and flushed with bounded concurrency.
+
+    Args:
+        contacts: The contacts API to write through
+        concurrency: Max contacts written at once
+    """
+
+    def __init__(self, contacts: "ContactsAPI", concurrency: int = 10):
+        self._contacts = contacts
+        self.concurrency = concurrency
+        self._pending: dict[str, dict[str, bool]] = {}
+        self._operations = 0
+        self.report = TagFlushReport()
+
+    def add(self, contact_id: str, *tags: str) -> None:
+        """Queue tags to add to a contact."""
+        ops = self._pending.setdefault(contact_id, {})
+        for tag in tags:
+            ops.pop(tag, None)  # Re-insert so the latest operation decides order too
+            ops[tag] = True
+            self._operations += 1
+
+    def remove(self, contact_id: str, *tags: str) -> None:
+        """Queue tags to remove from a contact."""
+        ops = self._pending.setdefault(contact_id, {})
+        for tag in tags:
+            ops.pop(tag, None)
+            ops[tag] = False
+            self._operations += 1
+
+    @property
+    def pending(self) -> int:
+        """Number of contacts with queued operations."""
+        return len(self._pending)
+
+    async def flush(self) -> TagFlushReport:
+        """Send every contact's merged tag change. Returns this flush's report."""
+        pending, self._pending = self._pending, {}
+        report = TagFlushReport(contacts=len(pending), operations=self._operations)
+        self._operations = 0
+        start = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def apply(contact_id: str, ops: dict[str, bool]) -> None:
+            async with semaphore:
+                try:
+                    await write_tags(self._contacts, contact_id, ops)
+                except httpx.HTTPError as e:
+                    report.failed[contact_id] = str(e) or type(e).__name__
+                    return
+            report.writes += sum(1 for tags in split_tag_ops(ops) if tags)
+
+        await asyncio.gather(*(apply(cid, ops) for cid, ops in pending.items()))
+        report.elapsed = time.perf_counter() - start
+        self._accumulate(report)
+        return report
+
+    def _accumulate(self, report: TagFlushReport) -> None:
+        total = self.report
+        total.contacts += report.contacts
+        total.operations += report.operations
+        total.writes += report.writes
+        total.failed.update(report.failed)
+        total.elapsed += report.elapsed
+
+    async def __aenter__(self) -> "TagBuffer":
+        return self
+
+    async def __aexit__(self, exc_type, *args) -> None:
+        if exc_type is None:
+            await self.flush()
+
+
+async def bulk_tag(
+    contacts: "ContactsAPI",
+    contact_ids: Iterable[str],
+    add: Iterable[str] = (),
+    remove: Iterable[str] = (),
+    concurrency: int = 10,
+) -> TagFlushReport:
+    """Add and/or remove the same tags on many contacts."""
+    add, remove = list(add), list(remove)
+    buffer = TagBuffer(contacts, concurrency=concurrency)
+    for contact_id in contact_ids:
+        if remove:
+            buffer.remove(contact_id, *remove)
+        if add:
+            buffer.add(contact_id, *add)
+    return await buffer.flush()
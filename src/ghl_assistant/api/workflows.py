@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING
+from pathlib import Path
+from typing import Any, Callable, Iterable, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .client import GHLClient
+    from .enrollment import EnrollmentReport
 
 
 class WorkflowsAPI:
@@ -21,6 +23,9 @@ class WorkflowsAPI:
 
             # Add contact to workflow
             await ghl.workflows.add_contact("workflow_id", "contact_id")
+
+            # Add many contacts, resumably
+            report = await ghl.workflows.bulk_enroll("workflow_id", contact_ids)
     """
 
     def __init__(self, client: "GHLClient"):
@@ -92,3 +97,47 @@ class WorkflowsAPI:
         return await self._client._delete(
             f"/workflows/{workflow_id}/contacts/{contact_id}?locationId={lid}"
         )
+
+    async def bulk_enroll(
+        self,
+        workflow_id: str,
+        contact_ids: Iterable[str],
+        concurrency: int = 10,
+        journal: str | Path | None = None,
+        location_id: str | None = None,
+        on_progress: Callable[["EnrollmentReport"], None] | None = None,
+    ) -> "EnrollmentReport":
+        """Add many contacts to a workflow concurrently.
+
+        Args:
+            workflow_id: The workflow ID
+            contact_ids: Contacts to enroll (any iterable; read lazily, duplicates skipped)
+            concurrency: Max enrollments in flight (all still pass the rate limiter)
+            journal: Progress journal file; rerunning with the same journal
+                skips contacts already enrolled and retries failures
+            location_id: Override default location
+            on_progress: Called with the running ``EnrollmentReport`` after each contact
+
+        Returns:
+            ``EnrollmentReport`` with counts, throughput and latency percentiles
+        """
+        from .enrollment import EnrollmentJob
+        from .journal import Journal
+
+        lid = location_id or self._location_id
+        job = None
+        if journal:
+            job = Journal(journal, meta={"workflow_id": workflow_id, "location_id": lid})
+        enrollment = EnrollmentJob(
+            self,
+            workflow_id,
+            lid,
+            concurrency=concurrency,
+            journal=job,
+            on_progress=on_progress,
+        )
+        try:
+            return await enrollment.run(contact_ids)
+        finally:
+            if job is not None:
+                job.close()
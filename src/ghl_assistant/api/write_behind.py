@@ -0,0 +1,327 @@
+"""Write-behind buffer - Merge bursts of contact mutations into one write.
+
+Event-driven integrations often change the same contact several times within
+a second (a field, a tag, DND). ``WriteBehindBuffer`` holds each contact's
+mutations for ``window`` seconds from the first one, merges them (later values
+win; custom fields and DND channels merge per entry), and sends one update.
+The write goes through the diff path, so mutations that cancel out send
+nothing. Tag additions and removals are merged too (the last operation on a
+tag wins) but sent through the per-contact tag endpoints, as deltas, so tags
+other writers change meanwhile are kept. Notes cannot be merged into an
+update; they are held with the contact and sent after its update.
+
+Every mutation returns a future resolved with the result of the request that
+carried it, or failed with that request's error. Pending mutations are
+flushed by ``flush()``, when the buffer's ``async with`` block exits, or, for
+the client's buffer, when the client exits.
+
+Usage:
+    async with GHLClient.from_session(write_behind=WriteBehindConfig(window=1.0)) as ghl:
+        ghl.write_behind.update(contact_id, first_name="Jane")
+        ghl.write_behind.add_tag(contact_id, "engaged")
+        done = ghl.write_behind.set_dnd(contact_id, True, channel="sms")
+        result = await done   # one PUT for the field and DND, one POST for the tag
+    # anything still pending is flushed on exit
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, TYPE_CHECKING
+
+from .diff import DiffUpdater, FIELD_NAMES
+from .tags import apply_tag_ops, split_tag_ops, write_tags
+
+if TYPE_CHECKING:
+    from .client import GHLClient
+
+
+@dataclass
+class WriteBehindConfig:
+    """Write-behind buffer settings for a GHLClient.
+
+    Attributes:
+        window: Seconds a contact's mutations are held after the first one
+            (None = only on ``flush()`` or exit)
+        concurrency: Max contacts written at once
+    """
+
+    window: float | None = 1.0
+    concurrency: int = 10
+
+
+@dataclass
+class WriteBehindStats:
+    mutations: int = 0
+    writes: int = 0
+    unchanged: int = 0
+    notes: int = 0
+    failed: int = 0
+
+    @property
+    def requests_saved(self) -> int:
+        return max(0, self.mutations - self.writes - self.notes)
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "mutations": self.mutations,
+            "writes": self.writes,
+            "unchanged": self.unchanged,
+            "notes": self.notes,
+            "failed": self.failed,
+            "requests_saved": self.requests_saved,
+        }
+
+
+@dataclass
+class _Pending:
+    """One contact's merged, unsent mutations."""
+
+    fields: dict[str, Any] = field(default_factory=dict)
+    custom: dict[str, Any] = field(default_factory=dict)
+    tags: dict[str, bool] = field(default_factory=dict)
+    notes: list[tuple[str, str | None, asyncio.Future]] = field(default_factory=list)
+    futures: list[asyncio.Future] = field(default_factory=list)
+    tag_futures: list[asyncio.Future] = field(default_factory=list)
+    timer: asyncio.TimerHandle | None = None
+
+
+class WriteBehindBuffer:
+    """Per-contact mutation buffer flushed after a window, on demand, or on exit.
+
+    Args:
+        client: The client to write through (must be entered before flushing)
+        config: Window and concurrency settings
+    """
+
+    def __init__(self, client: "GHLClient", config: WriteBehindConfig | None = None):
+        self._client = client
+        self.config = config or WriteBehindConfig()
+        self.stats = WriteBehindStats()
+        self._pending: dict[str, _Pending] = {}
+        self._writing: dict[str, asyncio.Task] = {}
+        self._semaphore = asyncio.Semaphore(self.config.concurrency)
+        self._updater: DiffUpdater | None = None
+
+    # ---------------------------------------------------------------------
+    # Mutations
+    # ---------------------------------------------------------------------
+
+    def _entry(self, contact_id: str) -> tuple[_Pending, asyncio.Future]:
+        """The contact's pending entry (timer started on first use) and a new future."""
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(contact_id)
+        if pending is None:
+            pending = self._pending[contact_id] = _Pending()
+            if self.config.window is not None:
+                pending.timer = loop.call_later(self.config.window, self._start, contact_id)
+        future = loop.create_future()
+        self.stats.mutations += 1
+        return pending, future
+
+    def update(
+        self,
+        contact_id: str,
+        first_name: str | None = None,
+        last_name: str | None = None,
+        email: str | None = None,
+        phone: str | None = None,
+        tags: list[str] | None = None,
+        custom_fields: dict[str, Any] | list[dict[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> asyncio.Future:
+        """Queue a field update; arguments as for ``ContactsAPI.update``.
+
+        ``tags`` replaces the list, discarding tag operations queued before it.
+
+        Returns:
+            Future resolved with the update response
+        """
+        pending, future = self._entry(contact_id)
+        named = {
+            "first_name": first_name,
+            "last_name": last_name,
+            "email": email,
+            "phone": phone,
+            "tags": tags,
+        }
+        for name, value in named.items():
+            if value is not None:
+                pending.fields[FIELD_NAMES[name]] = value
+        if tags is not None:
+            # Replaces earlier tag operations; their callers get this update's result
+            pending.tags.clear()
+            pending.futures.extend(pending.tag_futures)
+            pending.tag_futures.clear()
+        for name, value in kwargs.items():
+            if name == "dndSettings" and isinstance(value, dict):
+                value = {**(pending.fields.get(name) or {}), **value}
+            pending.fields[name] = value
+        if custom_fields is not None:
+            if isinstance(custom_fields, dict):
+                pending.custom.update(custom_fields)
+            else:
+                for item in custom_fields:
+                    name = item.get("id") or item.get("key") or item.get("name")
+                    pending.custom[name] = item.get("value", item.get("field_value"))
+        pending.futures.append(future)
+        return future
+
+    def add_tag(self, contact_id: str, *tags: str) -> asyncio.Future:
+        """Queue tags to add. Returns a future resolved with the tag endpoint response."""
+        return self._tag(contact_id, tags, True)
+
+    def remove_tag(self, contact_id: str, *tags: str) -> asyncio.Future:
+        """Queue tags to remove. Returns a future resolved with the tag endpoint response."""
+        return self._tag(contact_id, tags, False)
+
+    def _tag(self, contact_id: str, tags: tuple[str, ...], add: bool) -> asyncio.Future:
+        pending, future = self._entry(contact_id)
+        for tag in tags:
+            pending.tags.pop(tag, None)  # Re-insert so the latest operation decides order too
+            pending.tags[tag] = add
+        pending.tag_futures.append(future)
+        return future
+
+    def set_dnd(self, contact_id: str, dnd: bool, channel: str = "all") -> asyncio.Future:
+        """Queue a DND change; arguments as for ``ContactsAPI.set_dnd``."""
+        if channel == "all":
+            return self.update(contact_id, dnd=dnd)
+        setting = {channel: {"status": "active" if dnd else "inactive"}}
+        return self.update(contact_id, dndSettings=setting)
+
+    def add_note(
+        self, contact_id: str, body: str, location_id: str | None = None
+    ) -> asyncio.Future:
+        """Queue a note, sent after the contact's merged update.
+
+        Returns:
+            Future resolved with the created note
+        """
+        pending, future = self._entry(contact_id)
+        pending.notes.append((body, location_id, future))
+        return future
+
+    @property
+    def pending(self) -> int:
+        """Number of contacts with queued mutations."""
+        return len(self._pending)
+
+    # ---------------------------------------------------------------------
+    # Flush
+    # ---------------------------------------------------------------------
+
+    def _start(self, contact_id: str) -> asyncio.Task | None:
+        """Begin writing a contact's pending mutations, after any write already running."""
+        pending = self._pending.pop(contact_id, None)
+        if pending is None:
+            return None
+        if pending.timer is not None:
+            pending.timer.cancel()
+        previous = self._writing.get(contact_id)
+        task = asyncio.ensure_future(self._write(contact_id, pending, previous))
+        self._writing[contact_id] = task
+
+        def done(task: asyncio.Task) -> None:
+            if self._writing.get(contact_id) is task:
+                del self._writing[contact_id]
+
+        task.add_done_callback(done)
+        return task
+
+    async def _write(
+        self, contact_id: str, pending: _Pending, previous: asyncio.Task | None
+    ) -> None:
+        try:
+            if previous is not None:
+                await asyncio.wait([previous])  # Keep each contact's writes in order
+            if self._updater is None:
+                self._updater = DiffUpdater(self._client.contacts, read_missing=False)
+
+            async with self._semaphore:
+                fields = dict(pending.fields)
+                ops = pending.tags
+                futures, tag_futures = pending.futures, pending.tag_futures
+                if ops and "tags" in fields:
+                    # A full tag list was queued: later operations apply to it, in the update
+                    fields["tags"] = apply_tag_ops(list(fields["tags"]), ops)
+                    ops, futures, tag_futures = {}, futures + tag_futures, []
+                if pending.custom:
+                    fields["custom_fields"] = pending.custom
+
+                if futures:
+                    await self._settle(futures, lambda: self._update(contact_id, fields))
+                if ops:
+                    await self._settle(tag_futures, lambda: self._tags(contact_id, ops))
+                for body, location_id, future in pending.notes:
+                    await self._settle(
+                        [future], lambda: self._note(contact_id, body, location_id)
+                    )
+        except BaseException as e:
+            # Cancelled or crashed part way: no caller is left waiting forever
+            notes = [future for *_, future in pending.notes]
+            for future in (*pending.futures, *pending.tag_futures, *notes):
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+            raise
+
+    async def _settle(
+        self, futures: list[asyncio.Future], send: Callable[[], Awaitable[Any]]
+    ) -> None:
+        """Run one request and deliver its result or error to every future it carries."""
+        try:
+            result = await send()
+        except Exception as e:  # Delivered to the callers, whatever it is
+            self.stats.failed += 1
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for future in futures:
+                if not future.done():
+                    future.set_result(result)
+
+    async def _update(self, contact_id: str, fields: dict[str, Any]) -> dict[str, Any]:
+        report = self._updater.report
+        written = report.written
+        result = await self._updater.update(contact_id, **fields)
+        if report.written > written:
+            self.stats.writes += 1
+        else:
+            self.stats.unchanged += 1
+        return result
+
+    async def _tags(self, contact_id: str, ops: dict[str, bool]) -> dict[str, Any]:
+        result = await write_tags(self._client.contacts, contact_id, ops)
+        self.stats.writes += sum(1 for tags in split_tag_ops(ops) if tags)
+        return result
+
+    async def _note(self, contact_id: str, body: str, location_id: str | None) -> dict[str, Any]:
+        result = await self._client.contacts.add_note(contact_id, body, location_id=location_id)
+        self.stats.notes += 1
+        return result
+
+    async def flush(self) -> WriteBehindStats:
+        """Write every pending contact now and wait for writes in progress.
+
+        Failures are delivered to the callers' futures, not raised here.
+
+        Returns:
+            Running totals (``stats``)
+        """
+        for contact_id in list(self._pending):
+            self._start(contact_id)
+        while self._writing:
+            await asyncio.wait(list(self._writing.values()))
+        return self.stats
+
+    async def __aenter__(self) -> "WriteBehindBuffer":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.flush()
@@ -1,13 +1,14 @@
 """Browser automation agent with screenshot and network capture."""
 
 import asyncio
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import nodriver as uc
 
+from .. import codec
+from ..api.session import extract_ids, update_latest, write_profile
 from .network import NetworkCapture
 from .screenshots import take_screenshot
 
@@ -219,7 +220,11 @@ class BrowserAgent:
         return {}
 
     async def export_session(self, output_path: str | None = None) -> str:
-        """Export session data (network log, screenshots, state)."""
+        """Export session data (network log, screenshots, state).
+
+        Also writes the compact credential profile for the session and points
+        ``latest.json`` at it, so clients start without parsing the full dump.
+        """
         if output_path is None:
             output_path = str(
                 self.network_dir / f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
@@ -235,8 +240,18 @@ class BrowserAgent:
             "network_log_count": len(self.get_network_log()),
         }
 
-        with open(output_path, "w") as f:
-            json.dump(session_data, f, indent=2, default=str)
+        with open(output_path, "wb") as f:
+            f.write(codec.dumps(session_data, indent=True, default=str))
+
+        token = session_data["auth"].get("access_token")
+        if token:
+            write_profile(
+                output_path,
+                token,
+                extract_ids(session_data["api_calls"]),
+                session_data["captured_at"],
+            )
+            update_latest(output_path)
 
         print(f"Session exported: {output_path}")
         return output_path
@@ -1,12 +1,13 @@
 """Network traffic capture via Chrome DevTools Protocol."""
 
-import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
 import nodriver.cdp.network as network
 
+from .. import codec
+
 
 @dataclass
 class CapturedRequest:
@@ -163,7 +164,7 @@ class NetworkCapture:
             # Check for token in response body (common for OAuth)
             if req.response_body:
                 try:
-                    body = json.loads(req.response_body)
+                    body = codec.loads(req.response_body)
                     if isinstance(body, dict):
                         for key in ["access_token", "accessToken", "token", "id_token", "refresh_token"]:
                             if key in body:
@@ -173,7 +174,7 @@ class NetworkCapture:
                         for key in ["locationId", "location_id", "userId", "user_id", "companyId"]:
                             if key in body:
                                 tokens[key] = body[key]
-                except (json.JSONDecodeError, TypeError):
+                except (codec.DecodeError, TypeError):
                     pass
 
             # Check cookies
@@ -221,7 +222,7 @@ class NetworkCapture:
                 # Try to parse response for schema hints
                 if req.response_body:
                     try:
-                        body = json.loads(req.response_body)
+                        body = codec.loads(req.response_body)
                         if isinstance(body, dict):
                             endpoint["response_keys"] = list(body.keys())[:10]
                     except Exception:
@@ -270,8 +271,8 @@ class NetworkCapture:
             }
             har["log"]["entries"].append(entry)
 
-        with open(filepath, "w") as f:
-            json.dump(har, f, indent=2)
+        with open(filepath, "wb") as f:
+            f.write(codec.dumps(har, indent=True, default=str))
 
         print(f"HAR file exported: {filepath}")
 
@@ -17,11 +17,13 @@ auth_app = typer.Typer(help="Authentication commands")
 tdlc_app = typer.Typer(help="10DLC registration commands")
 templates_app = typer.Typer(help="Workflow template commands")
 browser_app = typer.Typer(help="Browser automation and traffic capture")
+contacts_app = typer.Typer(help="Contact commands")
 
 app.add_typer(auth_app, name="auth")
 app.add_typer(tdlc_app, name="10dlc")
 app.add_typer(templates_app, name="templates")
 app.add_typer(browser_app, name="browser")
+app.add_typer(contacts_app, name="contacts")
 
 
 # ============================================================================
@@ -365,6 +367,140 @@ def browser_token(
         console.print(f"[red]Error: {e}[/red]")
 
 
+# ============================================================================
+# Contact Commands
+# ============================================================================
+
+
+def _parse_mapping(entries: list[str]) -> dict[str, str]:
+    """COLUMN=FIELD options as a dict ("Notes=" ignores a column)."""
+    mapping = {}
+    for entry in entries:
+        column, sep, target = entry.partition("=")
+        if not sep:
+            console.print(f"[red]Invalid --map {entry!r}; expected COLUMN=FIELD[/red]")
+            raise typer.Exit(1)
+        mapping[column] = target
+    return mapping
+
+
+@contacts_app.command("import")
+def contacts_import(
+    file: str = typer.Argument(..., help="CSV or NDJSON file (optionally .gz)"),
+    map_: list[str] = typer.Option(
+        [],
+        "--map", "-m",
+        help="Column mapping COLUMN=FIELD, e.g. Mobile=phone or Plan=custom:Plan (repeatable)",
+    ),
+    format: str = typer.Option(
+        None,
+        "--format", "-f",
+        help="csv or ndjson (default: from the file name)",
+    ),
+    concurrency: int = typer.Option(10, "--concurrency", "-c", help="Creates in flight"),
+    tag: list[str] = typer.Option([], "--tag", "-t", help="Tag every imported contact"),
+    journal: str = typer.Option(
+        None,
+        "--journal", "-j",
+        help="Resume journal (default: <file>.journal)",
+    ),
+    no_resume: bool = typer.Option(False, "--no-resume", help="Do not journal progress"),
+):
+    """Import contacts from a CSV or NDJSON file.
+
+    Streams the file, so any size works. Progress is journaled; rerun the
+    same command after an interruption to continue where it stopped.
+    """
+    import asyncio
+    from pathlib import Path
+    from .api import GHLClient
+
+    if not Path(file).exists():
+        console.print(f"[red]File not found: {file}[/red]")
+        raise typer.Exit(1)
+    mapping = _parse_mapping(map_)
+
+    async def run_import():
+        async with GHLClient.from_session() as ghl:
+            with console.status("Importing...") as status:
+
+                def progress(report):
+                    if (report.created + report.failed) % 500 == 0:
+                        status.update(
+                            f"Importing... {report.rows} rows, {report.created} created, "
+                            f"{report.failed} failed"
+                        )
+
+                return await ghl.contacts.import_file(
+                    file,
+                    mapping=mapping,
+                    format=format,
+                    concurrency=concurrency,
+                    journal=False if no_resume else (journal or True),
+                    tags=tag,
+                    on_progress=progress,
+                )
+
+    try:
+        report = asyncio.run(run_import())
+    except (ValueError, FileNotFoundError) as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    console.print(f"[green]{report.summary()}[/green]")
+    if report.unmapped:
+        console.print(f"[yellow]Ignored columns: {', '.join(report.unmapped)}[/yellow]")
+    for row, error in report.errors[:10]:
+        console.print(f"[red]Row {row}: {error}[/red]")
+    if report.failed:
+        console.print("[dim]Failed rows are retried when the import is run again.[/dim]")
+        raise typer.Exit(1)
+
+
+@contacts_app.command("export")
+def contacts_export(
+    output: str = typer.Argument(
+        ..., help="Output file (.ndjson, .csv or .parquet; add .gz to compress)"
+    ),
+    format: str = typer.Option(
+        None,
+        "--format", "-f",
+        help="ndjson, csv or parquet (default: from the file name)",
+    ),
+    gzip_: bool = typer.Option(None, "--gzip/--no-gzip", help="Compress NDJSON/CSV output"),
+    raw: bool = typer.Option(False, "--raw", help="NDJSON only: keep contacts in API form"),
+):
+    """Export every contact in the location.
+
+    Streams page by page, so memory does not grow with the number of contacts.
+    Custom fields become one column each, named after the field.
+    """
+    import asyncio
+    from .api import GHLClient
+
+    async def run_export():
+        async with GHLClient.from_session() as ghl:
+            with console.status("Exporting...") as status:
+
+                def progress(report):
+                    status.update(f"Exporting... {report.rows} contacts")
+
+                return await ghl.contacts.export(
+                    output, format=format, compress=gzip_, flatten=not raw, on_progress=progress
+                )
+
+    try:
+        report = asyncio.run(run_export())
+    except (ValueError, ImportError) as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    console.print(
+        f"[green]Exported {report.rows} contacts ({len(report.columns)} columns, "
+        f"{report.bytes / 1e6:.1f} MB) to {report.path} in {report.elapsed:.1f}s[/green]"
+    )
+
+
 # ============================================================================
 # Main
 # ============================================================================
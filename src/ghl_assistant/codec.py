@@ -0,0 +1,135 @@
+"""JSON codec - Pluggable fast JSON encoding and decoding.
+
+Contact and submission pages are large, and decoding them with the stdlib
+``json`` module dominates CPU time in bulk jobs. This module picks the fastest
+installed backend:
+
+    orjson   pip install 'ghl-assistant[fast]'
+    msgspec
+    json     (stdlib fallback)
+
+Set ``GHL_JSON_BACKEND=json`` (or orjson/msgspec) to force a backend.
+
+Usage:
+    from ghl_assistant import codec
+
+    data = codec.loads(resp.content)
+    body = codec.dumps({"firstName": "John"})        # bytes
+    text = codec.dumps(data, indent=True, default=str).decode()
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Callable
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+class DecodeError(ValueError):
+    """Raised when input is not valid JSON, whichever backend is active."""
+
+
+def _load_backend(name: str) -> tuple[Callable, Callable]:
+    """Return (loads, dumps) implementations for a backend name."""
+    if name == "orjson":
+        import orjson
+
+        def loads(data):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError as e:
+                raise DecodeError(str(e)) from e
+
+        def dumps(obj, indent=False, default=None):
+            option = orjson.OPT_NON_STR_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, default=default, option=option)
+
+        return loads, dumps
+
+    if name == "msgspec":
+        import msgspec
+
+        decoder = msgspec.json.Decoder()
+        encoder = msgspec.json.Encoder()
+
+        def loads(data):
+            try:
+                return decoder.decode(data)
+            except msgspec.DecodeError as e:
+                raise DecodeError(str(e)) from e
+
+        def dumps(obj, indent=False, default=None):
+            enc = msgspec.json.Encoder(enc_hook=default) if default else encoder
+            out = enc.encode(obj)
+            return msgspec.json.format(out, indent=2) if indent else out
+
+        return loads, dumps
+
+    if name == "json":
+
+        def loads(data):
+            if isinstance(data, memoryview):
+                data = bytes(data)  # json.loads takes str, bytes and bytearray only
+            try:
+                return json.loads(data)
+            except json.JSONDecodeError as e:
+                raise DecodeError(str(e)) from e
+
+        def dumps(obj, indent=False, default=None):
+            # ensure_ascii=False: emit UTF-8 like orjson and msgspec, not \u escapes
+            if indent:
+                return json.dumps(obj, indent=2, default=default, ensure_ascii=False).encode()
+            return json.dumps(
+                obj, separators=(",", ":"), default=default, ensure_ascii=False
+            ).encode()
+
+        return loads, dumps
+
+    raise ValueError(f"Unknown JSON backend: {name} (choose from {', '.join(BACKENDS)})")
+
+
+def set_backend(name: str | None = None) -> str:
+    """Select a backend by name, or the fastest installed one if None.
+
+    Returns:
+        The name of the active backend
+    """
+    global BACKEND, _loads, _dumps
+
+    candidates = (name,) if name else BACKENDS
+    for candidate in candidates:
+        try:
+            _loads, _dumps = _load_backend(candidate)
+        except ImportError:
+            if name:
+                raise
+            continue
+        BACKEND = candidate
+        return candidate
+    raise RuntimeError("No JSON backend available")
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Decode JSON from bytes or str."""
+    return _loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False, default: Callable | None = None) -> bytes:
+    """Encode an object to UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to encode
+        indent: Pretty-print with two-space indentation
+        default: Called for objects the backend cannot serialize natively
+    """
+    return _dumps(obj, indent, default)
+
+
+BACKEND: str = ""
+_loads: Callable
+_dumps: Callable
+set_backend(os.environ.get("GHL_JSON_BACKEND") or None)
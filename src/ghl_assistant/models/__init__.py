@@ -0,0 +1,22 @@
+"""Compact typed records for GHL API data.
+
+Usage:
+    from ghl_assistant.models import Contact
+
+    page = await ghl.contacts.list(limit=100, as_records=True)
+    contacts: list[Contact] = page["contacts"]
+"""
+
+from .base import Record
+from .contact import Contact
+from .opportunity import Opportunity
+from .appointment import Appointment
+from .message import Message
+
+__all__ = [
+    "Record",
+    "Contact",
+    "Opportunity",
+    "Appointment",
+    "Message",
+]
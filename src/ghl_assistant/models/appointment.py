@@ -0,0 +1,33 @@
+"""Appointment record."""
+
+from __future__ import annotations
+
+from .base import Record
+
+
+class Appointment(Record):
+    """Compact appointment record.
+
+    Usage:
+        page = await ghl.calendars.get_appointments(calendar_id="...", as_records=True)
+        for appt in page["appointments"]:
+            print(appt.start_time, appt.title, appt.status)
+    """
+
+    FIELDS = (
+        ("id", "id"),
+        ("calendar_id", "calendarId"),
+        ("contact_id", "contactId"),
+        ("location_id", "locationId"),
+        ("title", "title"),
+        ("start_time", "startTime"),
+        ("end_time", "endTime"),
+        ("status", "appoinmentStatus"),  # sic - GHL's spelling
+        ("assigned_user_id", "assignedUserId"),
+        ("notes", "notes"),
+        ("date_added", "dateAdded"),
+        ("date_updated", "dateUpdated"),
+    )
+    INTERNED = frozenset({"calendar_id", "location_id", "status", "assigned_user_id"})
+
+    __slots__ = tuple(attr for attr, _ in FIELDS)
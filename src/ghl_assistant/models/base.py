@@ -0,0 +1,140 @@
+"""Compact record base - Slotted records with lazily decoded nested fields.
+
+API responses are plain dicts, which cost ~1 KB+ per contact once nested
+custom fields, DND settings and attribution are decoded. Records keep the
+frequently used scalar fields in ``__slots__``, intern values that repeat
+across records (location IDs, tags, statuses), and keep rarely used nested
+fields as encoded JSON bytes that are decoded only when accessed.
+
+Records are built from decoded dicts, whichever JSON backend is active; the
+response is not decoded straight into records (see ``Record.from_page``).
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, ClassVar, Iterable
+
+from .. import codec
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Record:
+    """Base class for compact API records.
+
+    Subclasses declare:
+        FIELDS: (attribute, JSON key) pairs stored as plain slots
+        INTERNED: attributes whose string values are interned
+        TUPLES: list-of-string attributes stored as tuples of interned strings
+        LAZY: (attribute, JSON key) pairs stored encoded and decoded on access
+
+    Any other keys are kept together as one encoded blob, exposed via ``extra``.
+    """
+
+    __slots__ = ("_extra",)
+
+    FIELDS: ClassVar[tuple[tuple[str, str], ...]] = ()
+    INTERNED: ClassVar[frozenset[str]] = frozenset()
+    TUPLES: ClassVar[frozenset[str]] = frozenset()
+    LAZY: ClassVar[tuple[tuple[str, str], ...]] = ()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Record":
+        """Build a record from an API response dict."""
+        self = cls.__new__(cls)
+        consumed = set()
+        for attr, key in cls.FIELDS:
+            value = data.get(key)
+            if attr in cls.INTERNED:
+                value = _intern(value)
+            elif attr in cls.TUPLES and value is not None:
+                value = tuple(_intern(item) for item in value)
+            setattr(self, attr, value)
+            consumed.add(key)
+        for attr, key in cls.LAZY:
+            value = data.get(key)
+            setattr(self, "_" + attr, codec.dumps(value) if value is not None else None)
+            consumed.add(key)
+        extra = {k: v for k, v in data.items() if k not in consumed}
+        self._extra = codec.dumps(extra) if extra else None
+        return self
+
+    @classmethod
+    def from_list(cls, items: Iterable[dict[str, Any]]) -> list["Record"]:
+        """Build records from a list of dicts."""
+        return [cls.from_dict(item) for item in items]
+
+    @classmethod
+    def from_page(cls, page: dict[str, Any], key: str) -> dict[str, Any]:
+        """Convert ``page[key]`` to records in place, one dict at a time.
+
+        The page arrives fully decoded to dicts by ``codec.loads``, even with
+        the msgspec backend: decoding straight into msgspec Structs would need
+        a typed Struct mirroring every record and every nested field, which the
+        lazily encoded fields exist to avoid. Instead each dict is released as
+        soon as its record exists, so peak memory stays at one decoded page
+        rather than the whole listing.
+        """
+        items = page.get(key) or []
+        for i, item in enumerate(items):
+            items[i] = cls.from_dict(item)
+        return page
+
+    def _lazy(self, attr: str) -> Any:
+        raw = getattr(self, "_" + attr)
+        return codec.loads(raw) if raw is not None else None
+
+    @property
+    def extra(self) -> dict[str, Any]:
+        """Fields not stored as slots, decoded on access."""
+        return codec.loads(self._extra) if self._extra is not None else {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style access by API (camelCase) key, for code written against dicts."""
+        for attr, field_key in self.FIELDS:
+            if field_key == key:
+                value = getattr(self, attr)
+                if value is None:
+                    return default
+                return list(value) if attr in self.TUPLES else value
+        for attr, field_key in self.LAZY:
+            if field_key == key:
+                value = self._lazy(attr)
+                return default if value is None else value
+        return self.extra.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            raise KeyError(key)
+        return value
+
+    def to_dict(self) -> dict[str, Any]:
+        """Rebuild the API dict representation."""
+        data = self.extra
+        for attr, key in self.FIELDS:
+            value = getattr(self, attr)
+            if value is not None:
+                data[key] = list(value) if attr in self.TUPLES else value
+        for attr, key in self.LAZY:
+            value = self._lazy(attr)
+            if value is not None:
+                data[key] = value
+        return data
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Record) or type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{attr}={getattr(self, attr)!r}" for attr, _ in self.FIELDS[:3]
+        )
+        return f"{type(self).__name__}({fields})"
@@ -0,0 +1,57 @@
+"""Contact record."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .base import Record
+
+
+class Contact(Record):
+    """Compact contact record.
+
+    Usage:
+        page = await ghl.contacts.list(limit=100, as_records=True)
+        for contact in page["contacts"]:
+            print(contact.id, contact.email, contact.tags)
+            value = contact.custom_field("cf_id")  # decodes customFields on demand
+    """
+
+    FIELDS = (
+        ("id", "id"),
+        ("location_id", "locationId"),
+        ("first_name", "firstName"),
+        ("last_name", "lastName"),
+        ("email", "email"),
+        ("phone", "phone"),
+        ("company_name", "companyName"),
+        ("type", "type"),
+        ("source", "source"),
+        ("assigned_to", "assignedTo"),
+        ("dnd", "dnd"),
+        ("tags", "tags"),
+        ("date_added", "dateAdded"),
+        ("date_updated", "dateUpdated"),
+    )
+    INTERNED = frozenset({"location_id", "type", "source", "assigned_to"})
+    TUPLES = frozenset({"tags"})
+    LAZY = (("custom_fields", "customFields"),)
+
+    __slots__ = tuple(attr for attr, _ in FIELDS) + tuple("_" + attr for attr, _ in LAZY)
+
+    @property
+    def name(self) -> str:
+        """Full name."""
+        return " ".join(part for part in (self.first_name, self.last_name) if part)
+
+    @property
+    def custom_fields(self) -> list[dict[str, Any]]:
+        """Custom field values ([{"id": ..., "value": ...}]), decoded on access."""
+        return self._lazy("custom_fields") or []
+
+    def custom_field(self, field_id: str, default: Any = None) -> Any:
+        """Value of one custom field by ID."""
+        for item in self.custom_fields:
+            if item.get("id") == field_id:
+                return item.get("value", default)
+        return default
@@ -0,0 +1,47 @@
+"""Message record."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .base import Record
+
+
+class Message(Record):
+    """Compact conversation message record.
+
+    Usage:
+        page = await ghl.conversations.messages("conversation_id", as_records=True)
+        for msg in page["messages"]:
+            print(msg.direction, msg.body)
+    """
+
+    FIELDS = (
+        ("id", "id"),
+        ("conversation_id", "conversationId"),
+        ("contact_id", "contactId"),
+        ("location_id", "locationId"),
+        ("direction", "direction"),
+        ("message_type", "messageType"),
+        ("type", "type"),
+        ("status", "status"),
+        ("body", "body"),
+        ("content_type", "contentType"),
+        ("date_added", "dateAdded"),
+    )
+    INTERNED = frozenset(
+        {"conversation_id", "location_id", "direction", "message_type", "status", "content_type"}
+    )
+    LAZY = (("attachments", "attachments"), ("meta", "meta"))
+
+    __slots__ = tuple(attr for attr, _ in FIELDS) + tuple("_" + attr for attr, _ in LAZY)
+
+    @property
+    def attachments(self) -> list[str]:
+        """Attachment URLs, decoded on access."""
+        return self._lazy("attachments") or []
+
+    @property
+    def meta(self) -> dict[str, Any]:
+        """Channel-specific metadata (email subject, call details, ...), decoded on access."""
+        return self._lazy("meta") or {}
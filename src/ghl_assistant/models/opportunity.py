@@ -0,0 +1,49 @@
+"""Opportunity record."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .base import Record
+
+
+class Opportunity(Record):
+    """Compact opportunity record.
+
+    Usage:
+        page = await ghl.opportunities.list(pipeline_id="...", as_records=True)
+        for opp in page["opportunities"]:
+            print(opp.name, opp.monetary_value, opp.status)
+    """
+
+    FIELDS = (
+        ("id", "id"),
+        ("name", "name"),
+        ("monetary_value", "monetaryValue"),
+        ("pipeline_id", "pipelineId"),
+        ("pipeline_stage_id", "pipelineStageId"),
+        ("status", "status"),
+        ("contact_id", "contactId"),
+        ("assigned_to", "assignedTo"),
+        ("source", "source"),
+        ("location_id", "locationId"),
+        ("last_status_change_at", "lastStatusChangeAt"),
+        ("created_at", "createdAt"),
+        ("updated_at", "updatedAt"),
+    )
+    INTERNED = frozenset(
+        {"pipeline_id", "pipeline_stage_id", "status", "assigned_to", "source", "location_id"}
+    )
+    LAZY = (("contact", "contact"), ("custom_fields", "customFields"))
+
+    __slots__ = tuple(attr for attr, _ in FIELDS) + tuple("_" + attr for attr, _ in LAZY)
+
+    @property
+    def contact(self) -> dict[str, Any] | None:
+        """Embedded contact summary, decoded on access."""
+        return self._lazy("contact")
+
+    @property
+    def custom_fields(self) -> list[dict[str, Any]]:
+        """Custom field values, decoded on access."""
+        return self._lazy("custom_fields") or []
@@ -0,0 +1,68 @@
+"""Shared fixtures: a GHLClient wired to an in-process mock transport."""
+
+from __future__ import annotations
+
+import re
+from typing import Callable
+
+import httpx
+import pytest
+
+from ghl_assistant import codec
+from ghl_assistant.api import GHLClient, GHLConfig, RateLimitConfig
+
+Handler = Callable[[httpx.Request, re.Match], tuple[int, dict]]
+
+
+class MockAPI:
+    """Routes requests to handlers by method and path regex; records every request."""
+
+    def __init__(self):
+        self.routes: list[tuple[str, re.Pattern, Handler]] = []
+        self.requests: list[httpx.Request] = []
+
+    def route(self, method: str, pattern: str) -> Callable[[Handler], Handler]:
+        def register(handler: Handler) -> Handler:
+            self.routes.append((method, re.compile(pattern + "$"), handler))
+            return handler
+
+        return register
+
+    def calls(self, method: str, path: str | None = None) -> list[httpx.Request]:
+        return [
+            r for r in self.requests
+            if r.method == method and (path is None or r.url.path == path)
+        ]
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        for method, pattern, handler in self.routes:
+            match = pattern.match(request.url.path)
+            if method == request.method and match:
+                status, body = handler(request, match)
+                return httpx.Response(status, content=codec.dumps(body))
+        return httpx.Response(404, content=b'{"message": "not found"}')
+
+
+@pytest.fixture
+def api() -> MockAPI:
+    return MockAPI()
+
+
+@pytest.fixture
+def make_client(api: MockAPI):
+    """Factory for an unentered GHLClient whose HTTP calls go to ``api``."""
+
+    def make(**kwargs) -> GHLClient:
+        kwargs.setdefault("rate_limit", RateLimitConfig(enabled=False))
+        client = GHLClient(
+            GHLConfig(token="test-token", location_id="loc1"),
+            base_url="http://ghl.test",
+            **kwargs,
+        )
+        client._build_http_client = lambda: httpx.AsyncClient(
+            base_url="http://ghl.test", transport=httpx.MockTransport(api)
+        )
+        return client
+
+    return make
@@ -0,0 +1,71 @@
+"""Tests for bulk contact upsert."""
+
+from ghl_assistant import codec
+
+
+async def test_merge_tags_adds_only_new_tags_and_keeps_concurrent_changes(api, make_client):
+    tags = {"c1": ["old"]}
+
+    @api.route("GET", r"/contacts/")
+    def page(request, match):
+        contacts = [{"id": "c1", "email": "jane@example.com", "tags": list(tags["c1"])}]
+        return 200, {"contacts": contacts, "meta": {"total": 1}}
+
+    @api.route("PUT", r"/contacts/(?P<id>[^/]+)")
+    def update(request, match):
+        return 200, {"succeded": True}
+
+    @api.route("POST", r"/contacts/(?P<id>[^/]+)/tags")
+    def add(request, match):
+        current = tags[match["id"]]
+        current.extend(t for t in codec.loads(request.content)["tags"] if t not in current)
+        return 200, {"tags": current}
+
+    async with make_client() as ghl:
+        rows = [{"email": "Jane@Example.com", "firstName": "Jane", "tags": ["imported"]}]
+        original_scan = ghl.contacts.iter_pages
+
+        async def scan_then_concurrent_write(*args, **kwargs):
+            async for page in original_scan(*args, **kwargs):
+                yield page
+            tags["c1"].append("from-workflow")  # Another writer, after the scan
+
+        ghl.contacts.iter_pages = scan_then_concurrent_write
+        report = await ghl.contacts.bulk_upsert(rows, resolve="scan")
+
+    assert report.updated == 1
+    assert tags["c1"] == ["old", "from-workflow", "imported"]
+    put = codec.loads(api.calls("PUT", "/contacts/c1")[0].content)
+    assert "tags" not in put and put["firstName"] == "Jane"
+    assert codec.loads(api.calls("POST", "/contacts/c1/tags")[0].content) == {
+        "tags": ["imported"]
+    }
+
+
+async def test_rows_sharing_an_email_create_one_contact(api, make_client):
+    created = []
+
+    @api.route("GET", r"/contacts/")
+    def page(request, match):
+        return 200, {"contacts": [], "meta": {"total": 0}}
+
+    @api.route("POST", r"/contacts/")
+    def create(request, match):
+        created.append(codec.loads(request.content))
+        return 200, {"contact": {"id": f"c{len(created)}"}}
+
+    @api.route("PUT", r"/contacts/(?P<id>[^/]+)")
+    def update(request, match):
+        return 200, {"succeded": True}
+
+    rows = [
+        {"email": "a@x.com", "firstName": "A"},
+        {"email": "A@X.com ", "lastName": "Again"},
+        {"phone": "(555) 123-4567", "firstName": "B"},
+    ]
+    async with make_client() as ghl:
+        report = await ghl.contacts.bulk_upsert(rows, resolve="scan")
+
+    assert (report.created, report.updated) == (2, 1)
+    assert report.results[1].contact_id == report.results[0].contact_id == "c1"
+    assert [c.get("email") for c in created] == ["a@x.com", None]
@@ -0,0 +1,71 @@
+"""Tests for the in-memory reference data cache."""
+
+import httpx
+
+from ghl_assistant.api import CacheConfig
+from ghl_assistant.api.cache import ResponseCache
+
+
+def response(body: bytes = b"{}") -> httpx.Response:
+    return httpx.Response(200, content=body)
+
+
+def test_only_reference_families_are_cached():
+    cache = ResponseCache()
+    assert cache.family_for("/opportunities/pipelines").name == "pipelines"
+    assert cache.family_for("/locations/loc1/customFields").name == "custom_fields"
+    assert cache.family_for("/calendars/slots") is None
+    assert cache.family_for("/contacts/") is None
+
+    cache.put(("/contacts/", ()), "/contacts/", response(), 0)
+    assert len(cache) == 0
+
+
+def test_entries_expire_after_family_ttl():
+    cache = ResponseCache(CacheConfig(ttl={"workflows": 0}))
+    key = ("/workflows/", ())
+    cache.put(key, "/workflows/", response(), 0)
+    assert cache.get(key, "/workflows/") is None
+    assert cache.stats.by_family["workflows"] == {"hits": 0, "misses": 1}
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(CacheConfig(max_entries=2))
+    keys = [("/workflows/", (("n", str(i)),)) for i in range(3)]
+    cache.put(keys[0], "/workflows/", response(), 0)
+    cache.put(keys[1], "/workflows/", response(), 0)
+    assert cache.get(keys[0], "/workflows/") is not None  # keys[1] is now the oldest
+    cache.put(keys[2], "/workflows/", response(), 0)
+    assert cache.get(keys[1], "/workflows/") is None
+    assert cache.get(keys[0], "/workflows/") is not None
+    assert cache.stats.evictions == 1
+
+
+def test_response_fetched_across_an_invalidation_is_not_cached():
+    cache = ResponseCache()
+    key = ("/forms/", ())
+    generation = cache.generation("/forms/")
+    cache.invalidate("/forms/f1")  # A write lands while the GET is in flight
+    cache.put(key, "/forms/", response(), generation)
+    assert cache.get(key, "/forms/") is None
+
+
+async def test_client_serves_repeat_reads_and_invalidates_on_write(api, make_client):
+    @api.route("GET", r"/opportunities/pipelines")
+    def pipelines(request, match):
+        return 200, {"pipelines": [{"id": "p1"}]}
+
+    @api.route("PUT", r"/opportunities/pipelines/(?P<id>[^/]+)")
+    def update(request, match):
+        return 200, {}
+
+    async with make_client(cache=CacheConfig()) as ghl:
+        first = await ghl.get_pipelines()
+        first["pipelines"].clear()  # Callers get their own copy
+        assert await ghl.get_pipelines() == {"pipelines": [{"id": "p1"}]}
+        assert len(api.calls("GET")) == 1
+
+        await ghl._put("/opportunities/pipelines/p1", {"name": "Sales"})
+        await ghl.get_pipelines()
+    assert len(api.calls("GET")) == 2
+    assert ghl.cache.stats.hits == 1
@@ -0,0 +1,167 @@
+"""Tests for GHLClient caching and lifecycle."""
+
+import asyncio
+import sys
+import types
+
+import httpx
+import pytest
+
+from ghl_assistant.api import GHLClient, PoolConfig
+
+
+def gated_fetch(ghl: GHLClient, gate: asyncio.Event, versions: list[int]):
+    """Replace ``ghl._fetch`` with one that waits on ``gate`` and returns the next version."""
+    started = []
+
+    async def fetch(endpoint, params):
+        started.append(endpoint)
+        version = len(started)
+        await gate.wait()
+        versions.append(version)
+        request = httpx.Request("GET", f"http://ghl.test{endpoint}")
+        return httpx.Response(200, json={"version": version}, request=request)
+
+    ghl._fetch = fetch
+    return started
+
+
+async def test_write_invalidates_cached_gets_of_the_addressed_location(
+    api, make_client, tmp_path
+):
+    @api.route("GET", r"/locations/(?P<lid>[^/]+)/customFields")
+    def fields(request, match):
+        return 200, {"customFields": [{"id": "f1", "location": match["lid"]}]}
+
+    @api.route("POST", r"/locations/(?P<lid>[^/]+)/customFields")
+    def create(request, match):
+        return 200, {"customField": {"id": "f2"}}
+
+    path = tmp_path / "cache.sqlite"
+    other = make_client(persistent_cache=path)
+    other.config.location_id = "loc2"  # Another process working in loc2
+    async with other, make_client(persistent_cache=path) as ghl:
+        await other.get_custom_fields()
+        await other.get_custom_fields()
+        assert len(api.calls("GET", "/locations/loc2/customFields")) == 1
+
+        await ghl._post("/locations/loc2/customFields", {"name": "Score"})
+        await other.get_custom_fields()
+        assert len(api.calls("GET", "/locations/loc2/customFields")) == 2
+
+
+async def test_exit_closes_persistent_cache(make_client, tmp_path):
+    ghl: GHLClient = make_client(persistent_cache=tmp_path / "cache.sqlite")
+    async with ghl:
+        assert ghl.persistent_cache._db is not None
+    assert ghl.persistent_cache._db is None
+
+    async with ghl:  # Re-entering reopens it
+        assert ghl.persistent_cache._db is not None
+
+
+async def test_unentered_client_holds_no_cache_connection(make_client, tmp_path):
+    ghl: GHLClient = make_client(persistent_cache=tmp_path / "cache.sqlite")
+    assert ghl.persistent_cache._db is None
+
+
+async def test_writes_outside_cached_families_skip_scope_resolution(
+    api, make_client, tmp_path, monkeypatch
+):
+    @api.route("POST", r"/contacts/")
+    def create(request, match):
+        return 200, {"contact": {"id": "c1"}}
+
+    ghl: GHLClient = make_client(persistent_cache=tmp_path / "cache.sqlite")
+    resolved = []
+    scope_for = ghl._scope_for
+    monkeypatch.setattr(ghl, "_scope_for", lambda *a: resolved.append(a) or scope_for(*a))
+    async with ghl:
+        await ghl._post("/contacts/", {"locationId": "loc1", "email": "a@x.com"})
+    assert resolved == []
+
+
+async def test_concurrent_identical_gets_share_one_request(make_client):
+    ghl: GHLClient = make_client()
+    gate = asyncio.Event()
+    started = gated_fetch(ghl, gate, [])
+    async with ghl:
+        first = asyncio.create_task(ghl._get("/contacts/c1"))
+        second = asyncio.create_task(ghl._get("/contacts/c1"))
+        await asyncio.sleep(0)
+        gate.set()
+        assert await first == await second == {"version": 1}
+    assert len(started) == 1
+    assert ghl.coalesced_gets == 1
+
+
+async def test_cancelling_one_caller_leaves_the_shared_request_running(make_client):
+    ghl: GHLClient = make_client()
+    gate = asyncio.Event()
+    started = gated_fetch(ghl, gate, [])
+    async with ghl:
+        first = asyncio.create_task(ghl._get("/contacts/c1"))
+        second = asyncio.create_task(ghl._get("/contacts/c1"))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        gate.set()
+        assert await second == {"version": 1}
+        with pytest.raises(asyncio.CancelledError):
+            await first
+    assert len(started) == 1
+
+
+async def test_get_issued_after_a_write_does_not_join_an_older_request(api, make_client):
+    @api.route("PUT", r"/contacts/c1")
+    def update(request, match):
+        return 200, {"contact": {"id": "c1"}}
+
+    ghl: GHLClient = make_client()
+    gate = asyncio.Event()
+    started = gated_fetch(ghl, gate, [])
+    async with ghl:
+        before = asyncio.create_task(ghl._get("/contacts/c1"))
+        await asyncio.sleep(0)
+        await ghl._put("/contacts/c1", {"firstName": "Ada"})
+        after = asyncio.create_task(ghl._get("/contacts/c1"))
+        await asyncio.sleep(0)
+        gate.set()
+        assert await before == {"version": 1}
+        assert await after == {"version": 2}
+        assert ghl._inflight == {}
+    assert len(started) == 2
+    assert ghl.coalesced_gets == 0
+
+
+def built_client_kwargs(ghl: GHLClient, monkeypatch) -> dict:
+    """Keyword arguments the client's real ``_build_http_client`` passes to httpx."""
+    captured = {}
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kwargs: captured.update(kwargs))
+    GHLClient._build_http_client(ghl)  # Bypass the conftest mock transport
+    return captured
+
+
+def test_pool_config_reaches_the_http_client(make_client, monkeypatch):
+    pool = PoolConfig(
+        max_connections=7, max_keepalive_connections=3, keepalive_expiry=4.5, timeout=12.0
+    )
+    kwargs = built_client_kwargs(make_client(pool=pool), monkeypatch)
+    assert kwargs["limits"] == httpx.Limits(
+        max_connections=7, max_keepalive_connections=3, keepalive_expiry=4.5
+    )
+    assert kwargs["timeout"] == 12.0
+    assert (kwargs["http1"], kwargs["http2"]) == (True, False)
+
+
+def test_http2_over_plain_http_uses_prior_knowledge(make_client, monkeypatch):
+    monkeypatch.setitem(sys.modules, "h2", types.ModuleType("h2"))
+    kwargs = built_client_kwargs(make_client(pool=PoolConfig(http2=True)), monkeypatch)
+    assert (kwargs["http1"], kwargs["http2"]) == (False, True)
+
+
+def test_http2_without_h2_raises_a_clear_import_error(make_client, monkeypatch):
+    monkeypatch.setitem(sys.modules, "h2", None)
+    ghl: GHLClient = make_client(pool=PoolConfig(http2=True))
+    with pytest.raises(ImportError, match=r"pip install 'ghl-assistant\[http2\]'"):
+        GHLClient._build_http_client(ghl)
@@ -0,0 +1,84 @@
+"""Tests for the pluggable JSON codec."""
+
+import importlib
+import sys
+
+import pytest
+
+from ghl_assistant import codec
+
+
+def installed(name: str) -> bool:
+    try:
+        codec._load_backend(name)
+    except ImportError:
+        return False
+    return True
+
+
+INSTALLED = [name for name in codec.BACKENDS if installed(name)]
+
+SAMPLE = {
+    "name": "Zoë ✓",
+    "values": [1, -2, 2.5, None, True, False, ""],
+    "nested": {"empty": [], "map": {}, "quote": 'say "hi"\n'},
+    7: "int key",
+}
+
+
+class Opaque:
+    def __str__(self):
+        return "opaque!"
+
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    active = codec.BACKEND
+    yield
+    codec.set_backend(active)
+
+
+@pytest.mark.parametrize("backend", INSTALLED)
+def test_round_trip_and_decode_errors(backend):
+    codec.set_backend(backend)
+    assert codec.loads(codec.dumps({"a": [1, "é"]})) == {"a": [1, "é"]}
+    assert codec.loads('{"a": 1}') == codec.loads(memoryview(b'{"a": 1}')) == {"a": 1}
+    for bad in (b"{not json", b"", b'{"a": 1} trailing'):
+        with pytest.raises(codec.DecodeError):
+            codec.loads(bad)
+    with pytest.raises(ValueError):  # DecodeError stays catchable as ValueError
+        codec.loads(b"[")
+
+
+@pytest.mark.parametrize("indent", [False, True])
+def test_dumps_is_identical_across_backends(indent):
+    outputs = {}
+    for backend in INSTALLED:
+        codec.set_backend(backend)
+        outputs[backend] = codec.dumps([SAMPLE, Opaque()], indent=indent, default=str)
+    assert len(set(outputs.values())) == 1, outputs
+    assert "Zoë ✓".encode() in outputs["json"]
+
+
+def test_env_var_forces_a_backend(monkeypatch):
+    monkeypatch.setenv("GHL_JSON_BACKEND", "json")
+    try:
+        assert importlib.reload(codec).BACKEND == "json"
+    finally:
+        monkeypatch.delenv("GHL_JSON_BACKEND")
+        importlib.reload(codec)
+    assert codec.BACKEND == INSTALLED[0]
+
+
+def test_falls_back_to_stdlib_when_no_fast_backend_is_installed(monkeypatch):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    assert codec.set_backend() == "json"
+    assert codec.loads(codec.dumps({"a": 1})) == {"a": 1}
+    with pytest.raises(ImportError):
+        codec.set_backend("orjson")  # Forcing a missing backend is an error
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        codec.set_backend("yaml")
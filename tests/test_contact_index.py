@@ -0,0 +1,76 @@
+"""Tests for the local email/phone contact index."""
+
+from ghl_assistant.api.contact_index import ContactIndex
+
+
+def test_lookups_normalize_email_and_phone():
+    index = ContactIndex("loc1")
+    index.apply({"id": "c1", "email": "Jane@Example.com", "phone": "(555) 123-4567"})
+    assert index.lookup_email(" jane@example.COM ") == "c1"
+    assert index.lookup_phone("+1 555 123 4567") == "c1"
+    assert index.lookup_email("other@example.com") is None
+    assert (index.stats.hits, index.stats.misses) == (2, 1)
+
+
+def test_update_replaces_old_keys_and_remove_drops_them():
+    index = ContactIndex("loc1")
+    index.apply({"id": "c1", "email": "old@x.com"})
+    index.apply({"id": "c1", "email": "new@x.com"})
+    assert index.lookup_email("old@x.com") is None
+    assert index.lookup_email("new@x.com") == "c1"
+    index.remove("c1")
+    assert index.lookup_email("new@x.com") is None
+    assert len(index) == 0
+
+
+def test_spilled_keys_are_found_and_counted_once():
+    index = ContactIndex("loc1", max_memory_keys=3)
+    for i in range(5):
+        index.apply({"id": f"c{i}", "email": f"{i}@x.com"})
+    assert index.stats.spills >= 1
+    assert index.lookup_email("0@x.com") == "c0"
+
+    # A spilled key moving to another contact is held in memory as well
+    index.apply({"id": "c9", "email": "0@x.com"})
+    assert index.lookup_email("0@x.com") == "c9"
+    assert len(index) == 5
+
+
+def test_len_after_spilling_runs_one_select_however_many_keys_are_in_memory():
+    index = ContactIndex("loc1", max_memory_keys=100)
+    for i in range(150):
+        index.apply({"id": f"c{i}", "email": f"{i}@x.com"})
+    index.apply({"id": "moved", "email": "0@x.com"})
+    selects = []
+    index._db.set_trace_callback(lambda sql: sql.startswith("SELECT") and selects.append(sql))
+    assert len(index) == 150
+    assert len(selects) == 1
+    assert len(index) == 150  # The scratch table is left empty
+
+
+def test_index_persists_between_runs(tmp_path):
+    path = tmp_path / "index.sqlite"
+    index = ContactIndex("loc1", path)
+    index.apply({"id": "c1", "email": "a@x.com"})
+    index.close()
+
+    reopened = ContactIndex("loc1", path)
+    assert reopened.lookup_email("a@x.com") == "c1"
+    reopened.close()
+
+
+async def test_find_by_email_uses_the_index_instead_of_searching(api, make_client, tmp_path):
+    @api.route("GET", r"/contacts/")
+    def page(request, match):
+        return 200, {"contacts": [{"id": "c1", "email": "jane@example.com"}], "meta": {}}
+
+    @api.route("GET", r"/contacts/(?P<id>[^/]+)")
+    def get(request, match):
+        return 200, {"contact": {"id": match["id"], "email": "jane@example.com"}}
+
+    async with make_client(contact_index=tmp_path / "index.sqlite") as ghl:
+        assert await ghl.contact_index.sync(ghl.contacts) == 1
+        contact = await ghl.contacts.find_by_email("Jane@Example.com")
+
+    assert contact["id"] == "c1"
+    assert [r.url.path for r in api.requests] == ["/contacts/", "/contacts/c1"]
@@ -0,0 +1,41 @@
+"""Tests for the contact state cache."""
+
+import time
+
+from ghl_assistant.api.contact_state import ContactStateCache
+
+
+def test_merge_keeps_unwritten_custom_fields_and_dnd_channels():
+    cache = ContactStateCache()
+    cache.put({
+        "id": "c1",
+        "firstName": "Jane",
+        "customFields": [{"id": "cf1", "value": 1}, {"id": "cf2", "value": "a"}],
+        "dndSettings": {"SMS": {"status": "active"}},
+    })
+    cache.merge("c1", {
+        "firstName": "Janet",
+        "customFields": [{"id": "cf2", "value": "b"}],
+        "dndSettings": {"Email": {"status": "active"}},
+    })
+    contact = cache.get("c1")
+    assert contact["firstName"] == "Janet"
+    assert contact["customFields"] == [{"id": "cf1", "value": 1}, {"id": "cf2", "value": "b"}]
+    assert contact["dndSettings"] == {
+        "SMS": {"status": "active"},
+        "Email": {"status": "active"},
+    }
+
+
+def test_merge_ignores_unknown_contacts():
+    cache = ContactStateCache()
+    cache.merge("missing", {"firstName": "Jane"})
+    assert cache.get("missing") is None
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    cache = ContactStateCache()
+    cache.put({"id": "c1"})
+    clock = time.monotonic() + cache.config.ttl + 1
+    monkeypatch.setattr("ghl_assistant.api.contact_state.time.monotonic", lambda: clock)
+    assert cache.get("c1") is None
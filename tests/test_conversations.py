@@ -0,0 +1,62 @@
+"""Tests for the streaming conversation and message iterators."""
+
+from ghl_assistant.models import Message
+
+
+def serve_history(api, conversations: int, messages: int):
+    """Route a location with ``conversations`` conversations of ``messages`` messages each."""
+    convs = [
+        {"id": f"conv{i}", "sort": [1_000 - i], "lastMessageDate": 1_000 - i}
+        for i in range(conversations)
+    ]
+
+    @api.route("GET", r"/conversations/search")
+    def search(request, match):
+        params = request.url.params
+        after = params.get("startAfterDate")
+        rest = [c for c in convs if after is None or c["sort"][0] < int(after)]
+        return 200, {"conversations": rest[: int(params["limit"])]}
+
+    @api.route("GET", r"/conversations/(?P<id>[^/]+)/messages")
+    def history(request, match):
+        params = request.url.params
+        msgs = [{"id": f"{match['id']}-m{i}", "body": str(i)} for i in range(messages)]
+        after = params.get("lastMessageId")
+        start = next(i + 1 for i, m in enumerate(msgs) if m["id"] == after) if after else 0
+        chunk = msgs[start:start + int(params["limit"])]
+        page = {
+            "messages": chunk,
+            "lastMessageId": chunk[-1]["id"] if chunk else None,
+            "nextPage": start + len(chunk) < len(msgs),
+        }
+        return 200, {"messages": page}
+
+    return convs
+
+
+async def test_iter_conversations_follows_start_after_date(api, make_client):
+    convs = serve_history(api, 5, 0)
+    async with make_client() as ghl:
+        seen = [c["id"] async for c in ghl.conversations.iter_conversations(page_size=2)]
+    assert seen == [c["id"] for c in convs]
+    assert api.calls("GET")[1].url.params["startAfterDate"] == "999"
+
+
+async def test_iter_messages_follows_last_message_id(api, make_client):
+    serve_history(api, 1, 5)
+    async with make_client() as ghl:
+        pages = ghl.conversations.iter_messages("conv0", page_size=2, as_records=True)
+        messages = [m async for m in pages]
+    assert all(isinstance(m, Message) for m in messages)
+    assert [m.id for m in messages] == [f"conv0-m{i}" for i in range(5)]
+    assert len(api.calls("GET")) == 3
+
+
+async def test_iter_history_keeps_each_conversation_contiguous(api, make_client):
+    serve_history(api, 4, 3)
+    async with make_client() as ghl:
+        pairs = [
+            (c["id"], m["id"])
+            async for c, m in ghl.conversations.iter_history(concurrency=3, page_size=2)
+        ]
+    assert pairs == [(f"conv{c}", f"conv{c}-m{m}") for c in range(4) for m in range(3)]
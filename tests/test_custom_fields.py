@@ -0,0 +1,135 @@
+"""Tests for custom field name-to-ID resolution."""
+
+import pytest
+
+from ghl_assistant import codec
+from ghl_assistant.api import CustomField, CustomFieldError
+
+FIELDS = [
+    {
+        "id": "cf1",
+        "name": "Subscription Plan",
+        "fieldKey": "contact.plan",
+        "dataType": "SINGLE_OPTIONS",
+        "picklistOptions": ["Gold", "Silver"],
+    },
+    {"id": "cf2", "name": "Score", "fieldKey": "contact.score", "dataType": "NUMERICAL"},
+    {
+        "id": "cf3",
+        "name": "Interests",
+        "dataType": "MULTIPLE_OPTIONS",
+        "picklistOptions": ["a", "b"],
+    },
+]
+
+
+def test_validate_coerces_unambiguous_values():
+    score = CustomField.from_api(FIELDS[1])
+    assert score.validate("1,200") == 1200
+    assert score.validate("2.5") == 2.5
+    with pytest.raises(CustomFieldError):
+        score.validate("lots")
+    with pytest.raises(CustomFieldError):
+        score.validate(True)
+
+    interests = CustomField.from_api(FIELDS[2])
+    assert interests.validate("a, b") == ["a", "b"]
+    with pytest.raises(CustomFieldError):
+        interests.validate("a, c")
+
+
+@pytest.fixture
+def fields_api(api):
+    loads = []
+
+    @api.route("GET", r"/locations/(?P<lid>[^/]+)/customFields")
+    def fields(request, match):
+        loads.append(match["lid"])
+        return 200, {"customFields": FIELDS}
+
+    return loads
+
+
+async def test_names_keys_and_ids_resolve_with_one_load(fields_api, make_client):
+    async with make_client() as ghl:
+        resolved = await ghl.custom_fields.resolve(
+            {"subscription plan": "Gold", "contact.score": "42", "cf3": ["a"]}
+        )
+        assert (await ghl.custom_fields.get("plan")).id == "cf1"
+
+    assert resolved == [
+        {"id": "cf1", "value": "Gold"},
+        {"id": "cf2", "value": 42},
+        {"id": "cf3", "value": ["a"]},
+    ]
+    assert fields_api == ["loc1"]
+
+
+async def test_unknown_name_reloads_once_then_raises(fields_api, make_client):
+    async with make_client() as ghl:
+        ghl.custom_fields.refresh_interval = 0
+        with pytest.raises(CustomFieldError, match="Nickname"):
+            await ghl.custom_fields.get("Nickname")
+    assert fields_api == ["loc1", "loc1"]
+
+
+async def test_create_sends_resolved_ids_and_field_writes_drop_definitions(
+    api, fields_api, make_client
+):
+    @api.route("POST", r"/contacts/")
+    def create(request, match):
+        return 200, {"contact": {"id": "c1"}}
+
+    @api.route("POST", r"/locations/loc1/customFields")
+    def add_field(request, match):
+        return 200, {"customField": {"id": "cf4"}}
+
+    async with make_client() as ghl:
+        await ghl.contacts.create(email="a@x.com", custom_fields={"Score": 7})
+        await ghl._post("/locations/loc1/customFields", {"name": "Nickname"})
+        await ghl.custom_fields.load()
+
+    body = codec.loads(api.calls("POST", "/contacts/")[0].content)
+    assert body["customFields"] == [{"id": "cf2", "value": 7}]
+    assert fields_api == ["loc1", "loc1"]
+
+
+async def test_update_resolves_against_the_given_location(fields_api, api, make_client):
+    @api.route("PUT", r"/contacts/c1")
+    def update(request, match):
+        return 200, {"succeded": True}
+
+    async with make_client() as ghl:
+        await ghl.contacts.update("c1", custom_fields={"Score": "7"}, location_id="loc2")
+        await ghl.contacts.update("c1", custom_fields=[{"id": "cf2", "value": 8}])
+
+    assert fields_api == ["loc2"]  # Already-resolved values need no definitions
+    bodies = [codec.loads(r.content) for r in api.calls("PUT", "/contacts/c1")]
+    assert [body["customFields"] for body in bodies] == [
+        [{"id": "cf2", "value": 7}],
+        [{"id": "cf2", "value": 8}],
+    ]
+
+
+async def test_diff_update_resolves_once_in_its_location(fields_api, api, make_client):
+    @api.route("PUT", r"/contacts/c1")
+    def update(request, match):
+        return 200, {"succeded": True}
+
+    async with make_client() as ghl:
+        resolve = ghl.custom_fields.resolve
+        calls = []
+
+        async def counting(values, location_id=None):
+            calls.append(location_id)
+            return await resolve(values, location_id)
+
+        ghl.custom_fields.resolve = counting
+        await ghl.contacts.update_changed(
+            "c1", read_missing=False, location_id="loc2", custom_fields={"Score": "7"}
+        )
+
+    assert calls == ["loc2"]
+    assert fields_api == ["loc2"]
+    body = codec.loads(api.calls("PUT", "/contacts/c1")[0].content)
+    assert body["customFields"] == [{"id": "cf2", "value": 7}]
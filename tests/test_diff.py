@@ -0,0 +1,87 @@
+"""Tests for diff-based contact updates."""
+
+from ghl_assistant.api.diff import apply_payload, diff_contact
+
+
+def test_unchanged_fields_are_skipped():
+    current = {"firstName": "Jane", "email": "Jane@Example.com", "tags": ["VIP", "lead"]}
+    desired = {"firstName": "Jane", "email": "jane@example.com", "tags": ["lead", "vip"]}
+    assert diff_contact(current, desired) == {}
+
+
+def test_phones_compare_in_e164():
+    assert diff_contact({"phone": "+15551234567"}, {"phone": "(555) 123-4567"}) == {}
+    assert diff_contact({"phone": "+15551234567"}, {"phone": "555-123-0000"}) == {
+        "phone": "555-123-0000"
+    }
+
+
+def test_leading_zero_postal_code_is_a_change():
+    assert diff_contact({"postalCode": "02134"}, {"postalCode": "2134"}) == {"postalCode": "2134"}
+
+
+def test_numeric_looking_text_compares_as_text():
+    assert diff_contact({"address1": "1.0"}, {"address1": "1"}) == {"address1": "1"}
+    assert diff_contact({"address1": "1_000"}, {"address1": "1000"}) == {"address1": "1000"}
+    assert diff_contact({"address1": " 12 "}, {"address1": "12"}) == {}
+
+
+def test_text_custom_field_with_leading_zeros_is_a_change():
+    current = {"customFields": [{"id": "cf1", "value": "007"}]}
+    desired = {"customFields": [{"id": "cf1", "value": "7"}]}
+    assert diff_contact(current, desired) == desired
+
+
+def test_numeric_custom_field_compares_by_value():
+    current = {"customFields": [{"id": "cf1", "value": "7.0"}, {"id": "cf2", "value": 3}]}
+    desired = {"customFields": [{"id": "cf1", "value": 7}, {"id": "cf2", "value": 4}]}
+    assert diff_contact(current, desired, numeric_fields={"cf1", "cf2"}) == {
+        "customFields": [{"id": "cf2", "value": 4}]
+    }
+
+
+def test_dnd_settings_send_only_changed_channels():
+    current = {"dndSettings": {"SMS": {"status": "active"}, "Email": {"status": "inactive"}}}
+    desired = {"dndSettings": {"SMS": {"status": "active"}, "Email": {"status": "active"}}}
+    assert diff_contact(current, desired) == {"dndSettings": {"Email": {"status": "active"}}}
+
+
+def test_apply_payload_merges_custom_fields_and_dnd():
+    contact = {
+        "customFields": [{"id": "cf1", "value": 1}, {"id": "cf2", "value": "a"}],
+        "dndSettings": {"SMS": {"status": "active"}},
+    }
+    merged = apply_payload(
+        contact,
+        {
+            "customFields": [{"id": "cf2", "value": "b"}],
+            "dndSettings": {"Email": {"status": "active"}},
+        },
+    )
+    assert merged["customFields"] == [{"id": "cf1", "value": 1}, {"id": "cf2", "value": "b"}]
+    assert merged["dndSettings"] == {
+        "SMS": {"status": "active"},
+        "Email": {"status": "active"},
+    }
+
+
+async def test_malformed_entries_are_recorded_per_row(api, make_client):
+    @api.route("GET", r"/contacts/(?P<id>[^/]+)")
+    def get(request, match):
+        return 200, {"contact": {"id": match["id"], "firstName": "Old"}}
+
+    @api.route("PUT", r"/contacts/(?P<id>[^/]+)")
+    def update(request, match):
+        return 200, {"succeded": True}
+
+    updates = [
+        ("c1", {"first_name": "New"}),
+        {"first_name": "no id"},
+        (None, {"first_name": "X"}),
+        ("c2", {"first_name": "Old"}),
+    ]
+    async with make_client() as ghl:
+        report = await ghl.contacts.bulk_update(updates)
+
+    assert (report.contacts, report.written, report.unchanged, report.failed) == (4, 1, 1, 2)
+    assert [cid for cid, _ in report.errors] == ["", ""]
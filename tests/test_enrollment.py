@@ -0,0 +1,39 @@
+"""Tests for bulk workflow enrollment."""
+
+from array import array
+
+from ghl_assistant import codec
+from ghl_assistant.api.enrollment import percentile
+
+
+def test_percentile_is_nearest_rank():
+    values = array("d", [0.4, 0.1, 0.3, 0.2])
+    assert percentile(values, 50) == 0.2
+    assert percentile(values, 100) == 0.4
+    assert percentile(array("d"), 95) == 0.0
+
+
+async def test_rerun_with_journal_skips_enrolled_and_retries_failures(api, make_client, tmp_path):
+    failing = {"c2"}
+    enrolled = []
+
+    @api.route("POST", r"/workflows/wf1/contacts")
+    def enroll(request, match):
+        cid = codec.loads(request.content)["contactId"]
+        if cid in failing:
+            return 400, {"message": "contact is in DND"}
+        enrolled.append(cid)
+        return 200, {}
+
+    ids = ["c0", "c1", "c2", "c1", "c3"]
+    journal = tmp_path / "wf1.journal"
+    async with make_client() as ghl:
+        first = await ghl.workflows.bulk_enroll("wf1", iter(ids), concurrency=2, journal=journal)
+        failing.clear()
+        second = await ghl.workflows.bulk_enroll("wf1", iter(ids), journal=journal)
+
+    assert (first.contacts, first.enrolled, first.duplicates, first.failed) == (5, 3, 1, 1)
+    assert first.errors[0][0] == "c2"
+    assert len(first.latencies) == 4
+    assert (second.enrolled, second.resumed, second.failed) == (1, 3, 0)
+    assert sorted(enrolled) == ["c0", "c1", "c2", "c3"]
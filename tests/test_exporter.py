@@ -0,0 +1,100 @@
+"""Tests for streaming contact export."""
+
+import httpx
+import pytest
+
+from ghl_assistant import codec
+from ghl_assistant.api.importer import read_rows
+
+FIELDS = [
+    {"id": "cf1", "name": "Plan", "dataType": "TEXT"},
+    {"id": "cf2", "name": "Score", "dataType": "NUMERICAL"},
+]
+
+
+@pytest.fixture
+def location(api):
+    contacts = [
+        {
+            "id": f"c{i}",
+            "firstName": f"N{i}",
+            "email": f"{i}@x.com",
+            "tags": ["a", "b"],
+            "customFields": [{"id": "cf1", "value": "gold"}, {"id": "cf2", "value": i}],
+        }
+        for i in range(150)
+    ]
+
+    @api.route("GET", r"/locations/loc1/customFields")
+    def fields(request, match):
+        return 200, {"customFields": FIELDS}
+
+    @api.route("GET", r"/contacts/")
+    def page(request, match):
+        after = request.url.params.get("startAfterId")
+        start = int(after[1:]) + 1 if after else 0
+        chunk = contacts[start:start + int(request.url.params["limit"])]
+        return 200, {"contacts": chunk, "meta": {"startAfterId": chunk[-1]["id"]}}
+
+    return contacts
+
+
+async def test_ndjson_rows_are_flattened_with_custom_field_columns(
+    location, make_client, tmp_path
+):
+    path = tmp_path / "contacts.ndjson"
+    async with make_client() as ghl:
+        report = await ghl.contacts.export(path)
+
+    assert (report.rows, report.pages) == (150, 2)
+    rows = [codec.loads(line) for line in path.read_bytes().splitlines()]
+    assert rows[3] == {
+        "id": "c3",
+        "firstName": "N3",
+        "email": "3@x.com",
+        "tags": ["a", "b"],
+        "Plan": "gold",
+        "Score": 3,
+    }
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+async def test_gzip_csv_round_trips_through_import_reader(location, make_client, tmp_path):
+    path = tmp_path / "contacts.csv.gz"
+    async with make_client() as ghl:
+        report = await ghl.contacts.export(path, columns=["id", "email", "tags"])
+
+    rows = list(read_rows(path))
+    assert report.columns == ["id", "email", "tags", "Plan", "Score"]
+    assert len(rows) == 150
+    assert rows[0] == {
+        "id": "c0", "email": "0@x.com", "tags": "a, b", "Plan": "gold", "Score": "0"
+    }
+
+
+async def test_parquet_columns_are_typed(location, make_client, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "contacts.parquet"
+    async with make_client() as ghl:
+        await ghl.contacts.export(path)
+
+    table = pq.read_table(path)
+    assert table.num_rows == 150
+    assert str(table.schema.field("Score").type) == "double"
+    assert table.column("tags")[0].as_py() == ["a", "b"]
+
+
+async def test_failed_export_leaves_no_file(api, make_client, tmp_path):
+    @api.route("GET", r"/locations/loc1/customFields")
+    def fields(request, match):
+        return 200, {"customFields": []}
+
+    @api.route("GET", r"/contacts/")
+    def page(request, match):
+        return 400, {"message": "bad request"}
+
+    path = tmp_path / "contacts.csv"
+    async with make_client() as ghl:
+        with pytest.raises(httpx.HTTPStatusError):
+            await ghl.contacts.export(path)
+    assert list(tmp_path.iterdir()) == []
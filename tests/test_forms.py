@@ -0,0 +1,23 @@
+"""Tests for form submission harvesting."""
+
+
+async def test_iter_submissions_fetches_every_page_and_skips_shifted_repeats(api, make_client):
+    submissions = [{"id": f"s{i}"} for i in range(250)]
+
+    @api.route("GET", r"/forms/submissions")
+    def page(request, match):
+        params = request.url.params
+        limit, number = int(params["limit"]), int(params["page"])
+        start = (number - 1) * limit
+        if number == 3:
+            start -= 1  # A new submission shifted the boundary by one
+        chunk = submissions[start:start + limit]
+        return 200, {"submissions": chunk, "meta": {"total": len(submissions)}}
+
+    async with make_client() as ghl:
+        seen = [s["id"] async for s in ghl.forms.iter_submissions("f1", concurrency=4)]
+
+    assert seen == [s["id"] for s in submissions]
+    calls = api.calls("GET", "/forms/submissions")
+    assert sorted(int(r.url.params["page"]) for r in calls) == [1, 2, 3]
+    assert all(r.url.params["formId"] == "f1" for r in calls)
@@ -0,0 +1,84 @@
+"""Tests for file reading and column mapping in contact imports."""
+
+import gzip
+
+import pytest
+
+from ghl_assistant.api.custom_fields import CustomField, CustomFieldError, CustomFieldSet
+from ghl_assistant.api.importer import ContactImporter, detect_format, read_rows
+
+FIELDS = [{"id": "cf1", "name": "Subscription Plan", "fieldKey": "contact.plan"}]
+
+
+def _importer(**kwargs) -> ContactImporter:
+    importer = ContactImporter(None, "loc1", **kwargs)
+    importer._custom_fields = CustomFieldSet([CustomField.from_api(d) for d in FIELDS])
+    return importer
+
+
+def test_detect_format():
+    assert detect_format("leads.csv.gz") == "csv"
+    assert detect_format("leads.jsonl") == "ndjson"
+    assert detect_format("out.parquet", ("ndjson", "csv", "parquet")) == "parquet"
+    with pytest.raises(ValueError):
+        detect_format("out.parquet")
+
+
+def test_read_rows_csv_with_bom_and_gzip(tmp_path):
+    path = tmp_path / "leads.csv.gz"
+    with gzip.open(path, "wb") as f:
+        f.write("﻿First Name,Email\nJane,jane@example.com\n".encode())
+    assert list(read_rows(path)) == [{"First Name": "Jane", "Email": "jane@example.com"}]
+
+
+def test_contact_maps_columns_by_name():
+    importer = _importer(tags=["imported"])
+    row = {
+        "Full Name": "Jane  Q Doe",
+        "E-mail": " jane@example.com ",
+        "Mobile": "555-0100",
+        "Tags": "vip, , lead",
+        "DND": "yes",
+        "Subscription Plan": "gold",
+        "Favourite Colour": "blue",
+        "Email Address": "",
+    }
+    assert importer._contact(row) == {
+        "firstName": "Jane",
+        "lastName": "Q Doe",
+        "email": "jane@example.com",
+        "phone": "555-0100",
+        "tags": ["vip", "lead", "imported"],
+        "dnd": True,
+        "customFields": [{"id": "cf1", "value": "gold"}],
+    }
+    assert importer.report.unmapped == ["Favourite Colour"]
+
+
+def test_explicit_mapping_overrides_detection():
+    importer = _importer(mapping={"Mobile": "", "Cell": "phone", "Tier": "custom:contact.plan"})
+    row = {"Mobile": "1", "Cell": "2", "Tier": "silver"}
+    assert importer._contact(row) == {
+        "phone": "2",
+        "customFields": [{"id": "cf1", "value": "silver"}],
+    }
+
+
+def test_plan_reports_every_unknown_custom_field_at_once():
+    importer = _importer(mapping={"A": "custom:Nope", "B": "custom:Tier", "C": "custom:plan"})
+    with pytest.raises(CustomFieldError) as raised:
+        importer.plan(["A", "B", "C"])
+    assert "'Nope'" in str(raised.value) and "'Tier'" in str(raised.value)
+
+
+async def test_unknown_custom_mapping_aborts_before_the_first_create(api, make_client):
+    @api.route("GET", r"/locations/loc1/customFields")
+    def fields(request, match):
+        return 200, {"customFields": FIELDS}
+
+    async with make_client() as ghl:
+        importer = ContactImporter(ghl.contacts, "loc1", mapping={"Plan": "custom:Missing"})
+        with pytest.raises(CustomFieldError):
+            await importer.run([{"Email": f"{n}@example.com", "Plan": "x"} for n in range(5)])
+    assert not api.calls("POST")
+    assert importer.report.rows == 0
@@ -0,0 +1,50 @@
+"""Tests for the shared bulk job loop."""
+
+import asyncio
+
+import pytest
+
+from ghl_assistant.api.jobs import MAX_ERRORS, keep_error, run_bounded
+
+
+async def test_run_bounded_caps_concurrency_and_reads_lazily():
+    running = peak = 0
+    read = []
+
+    def items():
+        for i in range(20):
+            read.append(i)
+            yield i
+
+    async def work(i: int) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        assert len(read) <= i + 4  # In flight plus the one waiting for a slot
+        await asyncio.sleep(0)
+        running -= 1
+
+    await run_bounded(items(), work, concurrency=3)
+    assert peak == 3
+    assert read == list(range(20))
+
+
+async def test_run_bounded_stops_reading_and_reraises_a_crash():
+    done = []
+
+    async def work(i: int) -> None:
+        if i == 2:
+            raise RuntimeError("journal write failed")
+        await asyncio.sleep(0)
+        done.append(i)
+
+    with pytest.raises(RuntimeError):
+        await run_bounded(iter(range(100)), work, concurrency=2)
+    assert len(done) < 10
+
+
+def test_keep_error_caps_the_list():
+    errors = []
+    for i in range(MAX_ERRORS + 5):
+        keep_error(errors, i, "boom")
+    assert len(errors) == MAX_ERRORS
@@ -0,0 +1,57 @@
+"""Tests for the resumable job journal."""
+
+import pytest
+
+from ghl_assistant.api.journal import Journal
+
+
+def test_resume_skips_done_rows_and_retries_failures(tmp_path):
+    path = tmp_path / "job.journal"
+    with Journal(path, meta={"source": "a.csv"}) as journal:
+        journal.record(0, id="c0")
+        journal.record(1, error="boom")
+        journal.record(3, id="c3")
+
+    with Journal(path, meta={"source": "a.csv"}) as journal:
+        assert journal.is_done(0) and journal.is_done(3)
+        assert not journal.is_done(1) and not journal.is_done(2)
+        assert journal.failed == {1: "boom"}
+
+    with Journal(path, retry_failed=False) as journal:
+        assert journal.is_done(1)
+
+
+def test_watermark_prunes_rows_below_it(tmp_path):
+    path = tmp_path / "job.journal"
+    with Journal(path) as journal:
+        for row in range(5):
+            journal.record(row)
+        journal.advance(4)
+        journal.advance(2)  # Never moves back
+        assert journal.watermark == 4 and journal.completed == {4}
+
+    with Journal(path) as journal:
+        assert journal.watermark == 4 and journal.completed == {4}
+        assert all(journal.is_done(row) for row in range(5))
+        assert not journal.is_done(5)
+
+
+def test_torn_last_line_is_dropped(tmp_path):
+    path = tmp_path / "job.journal"
+    with Journal(path) as journal:
+        journal.record(0)
+    with open(path, "ab") as f:
+        f.write(b'{"key": 1')  # Crash mid-write
+
+    with Journal(path) as journal:
+        assert journal.is_done(0) and not journal.is_done(1)
+        journal.record(2)
+    with Journal(path) as journal:
+        assert journal.completed == {0, 2}
+
+
+def test_meta_mismatch_raises(tmp_path):
+    path = tmp_path / "job.journal"
+    Journal(path, meta={"source": "a.csv"}).close()
+    with pytest.raises(ValueError):
+        Journal(path, meta={"source": "b.csv"})
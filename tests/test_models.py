@@ -0,0 +1,75 @@
+"""Tests for compact API records."""
+
+import pytest
+
+from ghl_assistant.models import Appointment, Contact, Message, Opportunity, Record
+
+
+def contact_data(**overrides):
+    data = {
+        "id": "c1",
+        "locationId": "".join(["lo", "c1"]),  # Built at runtime, so not interned already
+        "firstName": "Jane",
+        "lastName": "Doe",
+        "email": "jane@example.com",
+        "tags": ["".join(["v", "ip"]), "lead"],
+        "customFields": [{"id": "cf1", "value": "gold"}, {"id": "cf2", "value": 7}],
+        "dndSettings": {"SMS": {"status": "active"}},
+        "attributionSource": {"medium": "form"},
+    }
+    data.update(overrides)
+    return data
+
+
+def test_fields_are_slots_and_nested_values_stay_encoded():
+    contact = Contact.from_dict(contact_data())
+    assert (contact.id, contact.name, contact.tags) == ("c1", "Jane Doe", ("vip", "lead"))
+    assert contact.phone is None
+
+    assert isinstance(contact._custom_fields, bytes)
+    assert isinstance(contact._extra, bytes)  # dndSettings and other rare keys
+    assert contact.custom_field("cf2") == 7
+    assert contact.custom_field("missing", "n/a") == "n/a"
+    assert contact.extra == {
+        "dndSettings": {"SMS": {"status": "active"}},
+        "attributionSource": {"medium": "form"},
+    }
+    assert Contact.from_dict({"id": "c2"}).custom_fields == []
+
+
+def test_get_and_getitem_read_like_the_api_dict():
+    data = contact_data()
+    contact = Contact.from_dict(data)
+    assert contact.get("firstName") == "Jane"
+    assert contact["tags"] == ["vip", "lead"]
+    assert contact.get("customFields") == data["customFields"]
+    assert contact["dndSettings"] == {"SMS": {"status": "active"}}
+    assert contact.get("phone", "none") == "none"
+    with pytest.raises(KeyError):
+        contact["nope"]
+    assert contact.to_dict() == data
+    assert contact == Contact.from_dict(contact_data())
+    assert contact != Contact.from_dict(contact_data(email="other@example.com"))
+
+
+@pytest.mark.parametrize("model", [Contact, Opportunity, Appointment, Message])
+def test_records_have_no_instance_dict(model):
+    record = model.from_dict({"id": "x"})
+    assert isinstance(record, Record)
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.unexpected = 1
+
+
+def test_repeated_values_are_interned_across_records():
+    first = Contact.from_dict(contact_data())
+    second = Contact.from_dict(contact_data())
+    assert first.location_id is second.location_id
+    assert first.tags[0] is second.tags[0]
+
+
+def test_from_page_converts_in_place():
+    page = {"contacts": [contact_data(), contact_data(id="c2")], "meta": {"total": 2}}
+    assert Contact.from_page(page, "contacts") is page
+    assert [c.id for c in page["contacts"]] == ["c1", "c2"]
+    assert all(isinstance(c, Contact) for c in page["contacts"])
@@ -0,0 +1,30 @@
+"""Tests for phone and email normalization."""
+
+import pytest
+
+from ghl_assistant.api.normalize import normalize_email, normalize_phone
+
+
+@pytest.mark.parametrize(
+    "phone, country, expected",
+    [
+        ("(555) 010-0199", "1", "+15550100199"),
+        ("1-555-010-0199", "1", "+15550100199"),
+        ("+1 555 010 0199", "1", "+15550100199"),
+        ("0044 20 7946 0958", "1", "+442079460958"),
+        ("020 7946 0958", "44", "+442079460958"),
+        ("07946 095800", "44", "+447946095800"),
+        ("0555 010 0199", "1", None),   # No trunk prefix in NANP
+        ("555 0100", "1", None),        # Too short for NANP
+        ("+1 555 010 01999", "1", None),
+        ("", "1", None),
+        (None, "1", None),
+    ],
+)
+def test_normalize_phone(phone, country, expected):
+    assert normalize_phone(phone, country) == expected
+
+
+def test_normalize_email():
+    assert normalize_email("  Jane@Example.COM ") == "jane@example.com"
+    assert normalize_email("jane@example") is None
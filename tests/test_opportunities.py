@@ -0,0 +1,60 @@
+"""Tests for the sharded opportunity scan."""
+
+
+async def test_iter_all_scans_each_stage_and_yields_moved_opportunities_once(api, make_client):
+    stages = {
+        "s1": [{"id": f"o{i}", "stage": "s1"} for i in range(150)],
+        "s2": [{"id": "o149", "stage": "s2"}, {"id": "o200", "stage": "s2"}],  # o149 moved
+        "s3": [{"id": "o300", "stage": "s3"}],
+    }
+
+    @api.route("GET", r"/opportunities/pipelines")
+    def pipelines(request, match):
+        return 200, {
+            "pipelines": [
+                {"id": "p1", "stages": [{"id": "s1"}, {"id": "s2"}]},
+                {"id": "p2", "stages": [{"id": "s3"}]},
+            ]
+        }
+
+    @api.route("GET", r"/opportunities/")
+    def page(request, match):
+        params = request.url.params
+        opps = stages[params["stageId"]]
+        after = params.get("startAfterId")
+        start = next(i + 1 for i, o in enumerate(opps) if o["id"] == after) if after else 0
+        chunk = opps[start:start + int(params["limit"])]
+        meta = {"total": len(opps), "startAfterId": chunk[-1]["id"] if chunk else None}
+        return 200, {"opportunities": chunk, "meta": meta}
+
+    progress = {}
+    async with make_client() as ghl:
+        opps = [
+            o["id"]
+            async for o in ghl.opportunities.iter_all(
+                on_progress=lambda p: progress.__setitem__(p.stage_id, p)
+            )
+        ]
+
+    assert sorted(opps) == sorted({o["id"] for shard in stages.values() for o in shard})
+    assert len(opps) == len(set(opps)) == 152
+    assert all(p.done for p in progress.values())
+    assert progress["s1"].pages == 2 and progress["s1"].total == 150
+    assert progress["s1"].duplicates + progress["s2"].duplicates == 1
+
+
+async def test_iter_all_limits_to_one_pipeline(api, make_client):
+    @api.route("GET", r"/opportunities/pipelines")
+    def pipelines(request, match):
+        return 200, {"pipelines": [{"id": "p1", "stages": []}, {"id": "p2", "stages": []}]}
+
+    @api.route("GET", r"/opportunities/")
+    def page(request, match):
+        pid = request.url.params["pipelineId"]
+        return 200, {"opportunities": [{"id": pid}], "meta": {}}
+
+    async with make_client() as ghl:
+        opps = [o async for o in ghl.opportunities.iter_all(pipeline_id="p2", as_records=True)]
+
+    assert [o.id for o in opps] == ["p2"]
+    assert "stageId" not in api.calls("GET", "/opportunities/")[0].url.params
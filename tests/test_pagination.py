@@ -0,0 +1,151 @@
+"""Tests for the pagination helpers and the paginated contact iterators."""
+
+import asyncio
+
+import pytest
+
+from ghl_assistant.api.pagination import (
+    concat_streams,
+    cursor_pages,
+    merge_streams,
+    numbered_pages,
+)
+from ghl_assistant.models import Contact
+
+
+async def test_cursor_pages_follow_the_cursor_and_stop_on_a_repeat():
+    fetched = []
+
+    async def fetch(cursor):
+        fetched.append(cursor)
+        n = cursor.get("after", 0)
+        return {"items": [n], "next": min(n + 1, 2)}  # Page 2 echoes its own cursor
+
+    pages = [page async for page in cursor_pages(fetch, lambda p: {"after": p["next"]})]
+    assert [p["items"] for p in pages] == [[0], [1], [2]]
+    assert fetched == [{}, {"after": 1}, {"after": 2}]
+
+
+async def test_cursor_pages_prefetch_one_page_ahead():
+    started = []
+
+    async def fetch(cursor):
+        started.append(cursor.get("page", 1))
+        return {"page": cursor.get("page", 1)}
+
+    def next_cursor(page):
+        return {"page": page["page"] + 1} if page["page"] < 5 else None
+
+    async for page in cursor_pages(fetch, next_cursor):
+        await asyncio.sleep(0)  # Let the prefetch run while this page is "processed"
+        assert started[-1] <= page["page"] + 1
+        if page["page"] == 2:
+            assert 3 in started
+            break
+
+
+async def test_numbered_pages_run_concurrently_and_yield_in_order():
+    running = peak = 0
+
+    async def fetch(number):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001 * (10 - number))  # Later pages finish first
+        running -= 1
+        return {"page": number, "total": 9}
+
+    pages = [n async for n, _ in numbered_pages(fetch, lambda p: p["total"], concurrency=4)]
+    assert pages == list(range(1, 10))
+    assert peak == 4
+
+
+async def test_numbered_pages_unordered_yields_every_page_once():
+    async def fetch(number):
+        await asyncio.sleep(0.001 * (6 - number))
+        return {}
+
+    pages = [n async for n, _ in numbered_pages(fetch, lambda p: 5, ordered=False)]
+    assert pages[0] == 1
+    assert sorted(pages) == [1, 2, 3, 4, 5]
+
+
+async def stream(items, delay=0.0, fail=None):
+    for item in items:
+        await asyncio.sleep(delay)
+        if item == fail:
+            raise RuntimeError(f"failed at {item}")
+        yield item
+
+
+async def test_merge_streams_interleaves_all_items():
+    merged = [
+        i async for i in merge_streams([stream(range(0, 5), 0.001), stream(range(5, 8))], 2)
+    ]
+    assert sorted(merged) == list(range(8))
+    assert merged.index(5) < merged.index(4)  # The fast stream did not wait for the slow one
+
+
+async def test_merge_streams_reraises_the_first_failure():
+    with pytest.raises(RuntimeError, match="failed at 3"):
+        async for _ in merge_streams([stream(range(5), fail=3), stream(range(100), 0.001)]):
+            pass
+
+
+async def test_concat_streams_keeps_stream_order_while_reading_ahead():
+    started = []
+
+    def tracked(n, items, delay):
+        started.append(n)
+        return stream(items, delay)
+
+    async def streams():
+        yield tracked(0, [0, 1], 0.002)
+        yield tracked(1, [2, 3], 0)
+        yield tracked(2, [4], 0)
+
+    out = []
+    async for item in concat_streams(streams(), concurrency=2):
+        if item == 0:
+            assert started == [0, 1]  # The next stream started before the head finished
+        out.append(item)
+    assert out == [0, 1, 2, 3, 4]
+
+
+def serve_contacts(api, total: int):
+    """Route /contacts/ over ``total`` contacts, paginated by startAfterId."""
+    contacts = [
+        {"id": f"c{i:03}", "email": f"{i}@x.com", "tags": ["lead"], "startAfter": i}
+        for i in range(total)
+    ]
+
+    @api.route("GET", r"/contacts/")
+    def page(request, match):
+        params = request.url.params
+        limit = int(params["limit"])
+        after = params.get("startAfterId")
+        start = next(i + 1 for i, c in enumerate(contacts) if c["id"] == after) if after else 0
+        chunk = contacts[start:start + limit]
+        meta = {"total": total}
+        if chunk:
+            meta.update(startAfterId=chunk[-1]["id"], startAfter=chunk[-1]["startAfter"])
+        return 200, {"contacts": chunk, "meta": meta}
+
+    return contacts
+
+
+async def test_iter_all_streams_every_contact(api, make_client):
+    contacts = serve_contacts(api, 250)
+    async with make_client() as ghl:
+        seen = [c["id"] async for c in ghl.contacts.iter_all(page_size=100)]
+    assert seen == [c["id"] for c in contacts]
+    assert len(api.calls("GET", "/contacts/")) == 3
+    assert api.calls("GET")[1].url.params["startAfterId"] == "c099"
+
+
+async def test_iter_all_yields_records(api, make_client):
+    serve_contacts(api, 5)
+    async with make_client() as ghl:
+        records = [c async for c in ghl.contacts.iter_all(as_records=True)]
+    assert all(isinstance(r, Contact) for r in records)
+    assert records[0].email == "0@x.com" and records[0].tags == ("lead",)
@@ -0,0 +1,56 @@
+"""Tests for the token-bucket rate limiter."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from ghl_assistant.api import RateLimitConfig
+from ghl_assistant.api.ratelimit import RateLimiter, parse_retry_after
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3", 10.0) == 3.0
+    assert parse_retry_after(None, 10.0) == 10.0
+    assert parse_retry_after("soon", 10.0) == 10.0
+    when = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 < parse_retry_after(format_datetime(when, usegmt=True), 10.0) <= 30
+
+
+async def test_bucket_throttles_past_capacity():
+    limiter = RateLimiter(RateLimitConfig(burst=2, interval=0.05, headroom=1.0))
+    for _ in range(4):
+        await limiter.acquire()
+    assert limiter.stats.requests == 4
+    assert limiter.stats.throttled >= 2
+
+
+def test_headers_tighten_the_bucket_and_report_daily_budget():
+    limiter = RateLimiter(RateLimitConfig(burst=100, headroom=0.9))
+    limiter.update(
+        {
+            "x-ratelimit-max": "50",
+            "x-ratelimit-interval-milliseconds": "5000",
+            "x-ratelimit-remaining": "10",
+            "x-ratelimit-limit-daily": "200000",
+            "x-ratelimit-daily-remaining": "199000",
+        }
+    )
+    assert limiter.capacity == 45
+    assert limiter.rate == 9.0
+    assert limiter._tokens == 5.0  # Same 5-request margin under the server's remaining 10
+    assert (limiter.stats.daily_limit, limiter.stats.daily_remaining) == (200000, 199000)
+
+
+async def test_client_waits_out_429_and_resends(api, make_client):
+    attempts = []
+
+    @api.route("GET", r"/users/(?P<id>[^/]+)")
+    def user(request, match):
+        attempts.append(request)
+        if len(attempts) == 1:
+            return 429, {"message": "too many requests"}
+        return 200, {"id": match["id"]}
+
+    async with make_client(rate_limit=RateLimitConfig(default_retry_after=0)) as ghl:
+        assert await ghl.get_user("u1") == {"id": "u1"}
+        assert ghl.rate_limiter.stats.rate_limited == 1
+    assert len(attempts) == 2
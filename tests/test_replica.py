@@ -0,0 +1,92 @@
+"""Tests for replica sync and deletion reconcile."""
+
+from datetime import datetime, timedelta, timezone
+
+from ghl_assistant import codec
+from ghl_assistant.api.replica import ContactReplica
+
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _stamp(minutes: int) -> str:
+    return (EPOCH + timedelta(minutes=minutes)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def _contact(n: int) -> dict:
+    return {"id": f"c{n:05d}", "dateAdded": _stamp(n), "dateUpdated": _stamp(n)}
+
+
+def _remote(api, contacts: dict[str, dict]) -> None:
+    """Serve ``contacts`` from the list and search endpoints."""
+
+    @api.route("GET", r"/contacts/")
+    def list_(request, match):
+        ordered = sorted(contacts.values(), key=lambda c: c["id"])
+        after = request.url.params.get("startAfterId")
+        if after:
+            ordered = [c for c in ordered if c["id"] > after]
+        page = ordered[: int(request.url.params["limit"])]
+        meta = {"total": len(contacts), "startAfterId": page[-1]["id"] if page else None}
+        return 200, {"contacts": page, "meta": meta}
+
+    @api.route("POST", r"/contacts/search")
+    def search(request, match):
+        body = codec.loads(request.content)
+        found = list(contacts.values())
+        for f in body.get("filters") or []:
+            bounds = f["value"]
+            found = [
+                c for c in found
+                if ("gt" not in bounds or c[f["field"]] > bounds["gt"])
+                and ("gte" not in bounds or c[f["field"]] >= bounds["gte"])
+                and ("lt" not in bounds or c[f["field"]] < bounds["lt"])
+            ]
+        key = (body.get("sort") or [{"field": "id"}])[0]["field"]
+        found.sort(key=lambda c: (c[key], c["id"]))
+        if "searchAfter" in body:
+            found = [c for c in found if [c[key], c["id"]] > body["searchAfter"]]
+        page = [{**c, "searchAfter": [c[key], c["id"]]} for c in found[: body["pageLimit"]]]
+        return 200, {"contacts": page, "total": len(found)}
+
+
+async def test_reconcile_rereads_only_ranges_with_deletions(api, make_client, tmp_path):
+    remote = {c["id"]: c for c in map(_contact, range(3000))}
+    _remote(api, remote)
+
+    async with make_client() as ghl:
+        with ContactReplica("loc1", tmp_path / "r.sqlite", reconcile_interval=0) as replica:
+            assert (await replica.sync(ghl.contacts)).mode == "full"
+
+            del remote["c00100"]
+            report = await replica.sync(ghl.contacts)
+
+            assert report.mode == "incremental"
+            assert report.reconciled and report.deletions_detected
+            assert report.deleted == 1
+            assert replica.get("c00100") is None
+            assert replica.count() == 2999
+            assert report.fetched == 374  # Only the range that lost a contact is re-read
+            assert report.count_requests == 8
+            assert len(api.calls("GET", "/contacts/")) == 31 + 1  # Sweep pages, then the total
+
+
+async def test_reconcile_waits_for_interval_when_totals_match(api, make_client, tmp_path):
+    remote = {c["id"]: c for c in map(_contact, range(50))}
+    _remote(api, remote)
+
+    async with make_client() as ghl:
+        with ContactReplica("loc1", tmp_path / "r.sqlite") as replica:
+            await replica.sync(ghl.contacts)
+
+            # A deletion offset by a contact the updated feed did not report
+            del remote["c00007"]
+            remote["c00050"] = _contact(50)
+            report = await replica.sync(ghl.contacts)
+            assert not report.reconciled
+            assert replica.get("c00007") is not None
+
+            replica.reconcile_interval = 0
+            report = await replica.sync(ghl.contacts)
+            assert report.reconciled and not report.deletions_detected
+            assert report.deleted == 1 and replica.count() == 50
+            assert replica.get("c00050") is not None
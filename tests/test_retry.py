@@ -0,0 +1,80 @@
+"""Tests for retry backoff and idempotency classification."""
+
+import httpx
+import pytest
+
+from ghl_assistant.api import RetryPolicy
+
+
+def test_backoff_is_jittered_under_a_growing_ceiling():
+    policy = RetryPolicy(base_delay=0.5, max_delay=3.0)
+    for attempt, ceiling in ((1, 0.5), (2, 1.0), (3, 2.0), (4, 3.0), (10, 3.0)):
+        assert all(0 <= policy.backoff(attempt) <= ceiling for _ in range(50))
+
+
+def flaky(api, method, path, failures, body):
+    """Route answering 503 ``failures`` times, then 200 with ``body``."""
+    calls = []
+
+    @api.route(method, path)
+    def handler(request, match):
+        calls.append(request)
+        return (503, {"message": "unavailable"}) if len(calls) <= failures else (200, body)
+
+    return calls
+
+
+async def test_get_is_retried_until_it_succeeds(api, make_client):
+    calls = flaky(api, "GET", r"/users/u1", 2, {"id": "u1"})
+    async with make_client(retry=RetryPolicy(base_delay=0)) as ghl:
+        assert await ghl.get_user("u1") == {"id": "u1"}
+    assert len(calls) == 3
+    assert ghl.retry_metrics.retries == 2
+    assert ghl.retry_metrics.recovered == 1
+    assert ghl.retry_metrics.reasons == {"503": 2}
+
+
+async def test_get_gives_up_after_max_attempts(api, make_client):
+    calls = flaky(api, "GET", r"/users/u1", 10, {})
+    async with make_client(retry=RetryPolicy(base_delay=0, max_attempts=3)) as ghl:
+        with pytest.raises(httpx.HTTPStatusError):
+            await ghl.get_user("u1")
+    assert len(calls) == 3
+    assert ghl.retry_metrics.give_ups == 1
+
+
+async def test_post_without_guard_is_not_resent(api, make_client):
+    calls = flaky(api, "POST", r"/contacts/c1/notes", 1, {})
+    async with make_client(retry=RetryPolicy(base_delay=0)) as ghl:
+        with pytest.raises(httpx.HTTPStatusError):
+            await ghl._post("/contacts/c1/notes", {"body": "hi"})
+    assert len(calls) == 1
+    assert ghl.retry_metrics.not_retried == 1
+
+
+async def test_post_guard_returns_the_record_a_failed_attempt_created(api, make_client):
+    calls = flaky(api, "POST", r"/contacts/", 1, {"contact": {"id": "dup"}})
+
+    async def already_created():
+        return {"contact": {"id": "c1"}}
+
+    async with make_client(retry=RetryPolicy(base_delay=0)) as ghl:
+        result = await ghl._post("/contacts/", {"email": "a@x.com"}, already_created)
+    assert result == {"contact": {"id": "c1"}}
+    assert len(calls) == 1
+    assert (ghl.retry_metrics.guard_checks, ghl.retry_metrics.guard_hits) == (1, 1)
+
+
+async def test_connect_errors_are_retried_for_every_verb(api, make_client):
+    calls = []
+
+    @api.route("POST", r"/contacts/c1/notes")
+    def notes(request, match):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return 200, {"note": {"id": "n1"}}
+
+    async with make_client(retry=RetryPolicy(base_delay=0)) as ghl:
+        assert await ghl._post("/contacts/c1/notes", {"body": "hi"}) == {"note": {"id": "n1"}}
+    assert len(calls) == 2
@@ -0,0 +1,104 @@
+"""Tests for vectorized segment queries over a contact replica."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from ghl_assistant.api.custom_fields import (  # noqa: E402
+    CustomField,
+    CustomFieldError,
+    CustomFieldSet,
+)
+from ghl_assistant.api.replica import ContactReplica  # noqa: E402
+from ghl_assistant.api.segments import (  # noqa: E402
+    CreatedWithin,
+    Field,
+    Segment,
+    SegmentIndex,
+    Tag,
+    UpdatedWithin,
+)
+
+NOW = datetime(2024, 6, 1, tzinfo=timezone.utc)
+FIELDS = CustomFieldSet(
+    [
+        CustomField.from_api({"id": "cf1", "name": "Score", "dataType": "NUMERICAL"}),
+        CustomField.from_api({"id": "cf2", "name": "Interests", "dataType": "CHECKBOX"}),
+        CustomField.from_api({"id": "cf3", "name": "Zip Override"}),
+    ]
+)
+CONTACTS = [
+    {
+        "id": "c1",
+        "tags": ["VIP", "lead"],
+        "source": "Webinar",
+        "dateAdded": "2024-05-30T00:00:00.000Z",
+        "dateUpdated": "2024-05-31T00:00:00.000Z",
+        "customFields": [{"id": "cf1", "value": 40}, {"id": "cf2", "value": ["golf", "Tennis"]}],
+    },
+    {
+        "id": "c2",
+        "tags": ["lead"],
+        "source": "ads",
+        "dateAdded": "2024-01-01T00:00:00.000Z",
+        "dateUpdated": "2024-05-01T00:00:00.000Z",
+        "customFields": [{"id": "cf1", "value": "12"}],
+    },
+    {
+        "id": "c3",
+        "tags": [],
+        "postalCode": "02134",
+        "dateAdded": "2023-01-01T00:00:00.000Z",
+        "dateUpdated": "2023-01-01T00:00:00.000Z",
+    },
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    replica = ContactReplica("loc1", tmp_path / "replica.sqlite")
+    for contact in CONTACTS:
+        replica.apply(contact)
+    return SegmentIndex.load(replica, fields=FIELDS)
+
+
+def test_tags_and_text_compare_case_insensitively(index):
+    assert index.select(Tag("vip")) == ["c1"]
+    assert index.select(Tag("lead") & ~Tag("VIP")) == ["c2"]
+    assert index.select(Field("source") == "webinar") == ["c1"]
+    assert index.select(Field("source").isin(["ADS", "other"])) == ["c2"]
+
+
+def test_missing_values_match_no_comparison(index):
+    assert index.select(Field("source") != "ads") == ["c1"]
+    assert index.select(Field("source").exists()) == ["c1", "c2"]
+
+
+def test_custom_fields_by_name_compare_numbers_and_options(index):
+    assert index.select(Field("Score") > 30) == ["c1"]
+    assert index.select(Field("cf1") <= 12) == ["c2"]
+    assert index.select(Field("Interests") == "tennis") == ["c1"]
+    assert index.count(Field("Zip Override").exists()) == 0
+    with pytest.raises(CustomFieldError):
+        Field("Nope").exists().mask(index)
+    with pytest.raises(ValueError):
+        (Field("Score") > "lots").mask(index)
+
+
+def test_standard_columns_are_loaded(index):
+    assert index.select(Field("postalCode") == "02134") == ["c3"]
+    assert index.select(Field("cf1") == 12) == ["c2"]  # "12" stored as text, equal as a number
+
+
+def test_date_windows(index):
+    assert index.select(CreatedWithin(days=7, now=NOW)) == ["c1"]
+    assert index.select(UpdatedWithin(days=60, now=NOW)) == ["c1", "c2"]
+    assert index.select(Field("dateAdded") < "2023-06-01") == ["c3"]
+    assert index.select(Tag("lead") | CreatedWithin(days=7, now=NOW), limit=1) == ["c1"]
+
+
+def test_segment_is_abstract():
+    with pytest.raises(TypeError):
+        Segment()
@@ -0,0 +1,152 @@
+"""Tests for resolved-ID persistence and credential profiles."""
+
+import base64
+import json
+
+import pytest
+
+from ghl_assistant.api import GHLConfig
+from ghl_assistant.api.session import (
+    RESOLVED_IDS_FILE,
+    latest_session,
+    load_profile,
+    load_resolved_ids,
+    profile_path_for,
+    save_resolved_ids,
+    token_identity,
+    update_latest,
+    write_profile,
+)
+
+
+def jwt(**claims) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+def test_token_identity_follows_the_account_not_the_token():
+    first = jwt(user_id="u1", company_id="co1", iat=1)
+    refreshed = jwt(user_id="u1", company_id="co1", iat=2)
+    assert token_identity(first) == token_identity(refreshed) == "u1:co1"
+    assert token_identity("opaque") != token_identity("other-opaque")
+
+
+def test_resolved_ids_are_keyed_by_token_identity(tmp_path):
+    save_resolved_ids(jwt(user_id="u1", iat=1), {"location_id": "loc1"}, tmp_path)
+    save_resolved_ids(jwt(user_id="u2"), {"location_id": "loc2"}, tmp_path)
+
+    assert load_resolved_ids(jwt(user_id="u1", iat=2), tmp_path) == {"location_id": "loc1"}
+    assert load_resolved_ids(jwt(user_id="u2"), tmp_path) == {"location_id": "loc2"}
+    assert load_resolved_ids(jwt(user_id="u3"), tmp_path) == {}
+
+
+def test_saving_merges_into_the_accounts_entry(tmp_path):
+    token = jwt(user_id="u1")
+    save_resolved_ids(token, {"company_id": "co1"}, tmp_path)
+    save_resolved_ids(token, {"location_id": "loc1", "user_id": None}, tmp_path)
+    assert load_resolved_ids(token, tmp_path) == {"company_id": "co1", "location_id": "loc1"}
+
+
+def test_corrupt_resolved_ids_file_is_ignored_and_replaced(tmp_path):
+    token = jwt(user_id="u1")
+    for content in ("{not json", "[]", '{"u1:": "not an entry"}'):
+        (tmp_path / RESOLVED_IDS_FILE).write_text(content)
+        assert load_resolved_ids(token, tmp_path) == {}
+
+    save_resolved_ids(token, {"location_id": "loc1"}, tmp_path)
+    assert load_resolved_ids(token, tmp_path) == {"location_id": "loc1"}
+
+
+def test_unwritable_resolved_ids_file_is_ignored(tmp_path):
+    (tmp_path / RESOLVED_IDS_FILE).mkdir()  # Neither readable nor replaceable as a file
+    token = jwt(user_id="u1")
+    save_resolved_ids(token, {"location_id": "loc1"}, tmp_path)
+    assert load_resolved_ids(token, tmp_path) == {}
+
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_text("")
+    save_resolved_ids(token, {"location_id": "loc1"}, not_a_dir)
+    assert load_resolved_ids(token, not_a_dir) == {}
+
+
+def write_session(path, token, location_id="loc1"):
+    path.write_text(json.dumps({
+        "captured_at": "2024-01-01T12:00:00",
+        "auth": {"access_token": token},
+        "api_calls": [
+            {"url": f"https://api.example/users/u1?companyId=co1&locationId={location_id}"}
+        ],
+    }))
+    return path
+
+
+def test_profile_round_trips_next_to_its_session(tmp_path):
+    session = tmp_path / "session_20240101_120000.json"
+    write_profile(session, "tok", {"location_id": "loc1"}, "2024-01-01T12:00:00")
+
+    assert profile_path_for(session) == tmp_path / "profile_20240101_120000.json"
+    profile = load_profile(session)
+    assert profile["token"] == "tok" and profile["location_id"] == "loc1"
+    assert profile["session_file"] == session.name
+    assert load_profile(tmp_path / "session_other.json") is None
+
+    profile_path_for(session).write_text("[]")
+    assert load_profile(session) is None
+
+
+def test_legacy_session_gets_its_profile_backfilled(tmp_path):
+    session = write_session(tmp_path / "session_20240101_120000.json", jwt(user_id="u1"))
+    assert load_profile(session) is None
+
+    config = GHLConfig.from_session_file(session)
+    assert (config.user_id, config.company_id, config.location_id) == ("u1", "co1", "loc1")
+    profile = load_profile(session)
+    assert profile["location_id"] == "loc1"
+    assert profile["captured_at"] == "2024-01-01T12:00:00"
+
+    session.write_text("{}")  # Later loads read only the profile
+    assert GHLConfig.from_session_file(session).token == config.token
+
+
+def test_resolved_ids_override_the_profile(tmp_path):
+    token = jwt(user_id="u1")
+    session = write_session(tmp_path / "session_20240101_120000.json", token)
+    save_resolved_ids(token, {"location_id": "loc9"}, tmp_path)
+
+    config = GHLConfig.from_session_file(session)
+    assert config.location_id == "loc9"
+    assert config.company_id == "co1"
+    assert config.session_dir == str(tmp_path)
+
+
+def test_session_without_a_token_is_rejected(tmp_path):
+    session = tmp_path / "session_20240101_120000.json"
+    session.write_text(json.dumps({"auth": {}}))
+    with pytest.raises(ValueError, match="No access token"):
+        GHLConfig.from_session_file(session)
+
+
+def test_latest_pointer_wins_over_newest_by_name(tmp_path):
+    older = write_session(tmp_path / "session_20240101_000000.json", jwt(user_id="u1"))
+    write_session(tmp_path / "session_20240202_000000.json", jwt(user_id="u2"))
+    update_latest(older)
+    assert latest_session(tmp_path) == older
+
+    older.unlink()  # Stale pointer: fall back to the newest by name
+    assert latest_session(tmp_path) == tmp_path / "session_20240202_000000.json"
+
+    (tmp_path / "latest.json").write_text("{corrupt")
+    assert latest_session(tmp_path) == tmp_path / "session_20240202_000000.json"
+
+
+def test_latest_pointer_to_a_profile_only_capture_is_followed(tmp_path):
+    write_session(tmp_path / "session_20240202_000000.json", jwt(user_id="u2"))
+    session = tmp_path / "session_20240101_000000.json"
+    write_profile(session, "tok", {})
+    update_latest(session)
+    assert latest_session(tmp_path) == session
+
+
+def test_no_sessions_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        latest_session(tmp_path)
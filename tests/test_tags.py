@@ -0,0 +1,70 @@
+"""Tests for tag operations and the tag buffer."""
+
+from ghl_assistant import codec
+from ghl_assistant.api import RetryPolicy
+from ghl_assistant.api.tags import apply_tag_ops, split_tag_ops
+
+
+def test_apply_tag_ops_is_case_insensitive():
+    assert apply_tag_ops(["VIP", "lead"], {"vip": False, "hot": True, "Lead": True}) == [
+        "lead",
+        "hot",
+    ]
+
+
+def test_split_tag_ops():
+    assert split_tag_ops({"a": True, "b": False, "c": True}) == (["a", "c"], ["b"])
+
+
+async def test_buffer_sends_deltas_and_keeps_concurrent_tags(api, make_client):
+    tags = {"c1": ["old"]}
+
+    @api.route("GET", r"/contacts/(?P<id>[^/]+)")
+    def get(request, match):
+        return 200, {"contact": {"id": match["id"], "tags": list(tags[match["id"]])}}
+
+    @api.route("POST", r"/contacts/(?P<id>[^/]+)/tags")
+    def add(request, match):
+        current = tags[match["id"]]
+        current.extend(t for t in codec.loads(request.content)["tags"] if t not in current)
+        return 200, {"tags": current}
+
+    @api.route("DELETE", r"/contacts/(?P<id>[^/]+)/tags")
+    def remove(request, match):
+        gone = set(codec.loads(request.content)["tags"])
+        tags[match["id"]] = [t for t in tags[match["id"]] if t not in gone]
+        return 200, {"tags": tags[match["id"]]}
+
+    async with make_client() as ghl:
+        await ghl.contacts.get("c1")           # contact_state now holds ["old"]
+        tags["c1"].append("from-workflow")     # another writer
+        async with ghl.contacts.tag_buffer() as buffer:
+            buffer.add("c1", "hot")
+            buffer.remove("c1", "old")
+            buffer.add("c1", "x")
+            buffer.remove("c1", "x")
+
+    assert tags["c1"] == ["from-workflow", "hot"]
+    assert buffer.report.writes == 2
+    assert not api.calls("PUT")
+    assert len(api.calls("GET")) == 1
+    assert codec.loads(api.calls("POST")[0].content) == {"tags": ["hot"]}
+    assert codec.loads(api.calls("DELETE")[0].content) == {"tags": ["old", "x"]}
+
+
+async def test_add_tag_returns_contact_shape_and_retries_the_post(api, make_client):
+    attempts = []
+
+    @api.route("POST", r"/contacts/(?P<id>[^/]+)/tags")
+    def add(request, match):
+        attempts.append(request)
+        if len(attempts) == 1:
+            return 503, {"message": "unavailable"}
+        return 200, {"tags": ["old", "hot"]}
+
+    async with make_client(retry=RetryPolicy(base_delay=0)) as ghl:
+        result = await ghl.contacts.add_tag("c1", "hot")
+
+    assert result == {"contact": {"id": "c1", "tags": ["old", "hot"]}}
+    assert len(attempts) == 2
+    assert ghl.retry_metrics.guard_checks == 0
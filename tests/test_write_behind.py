@@ -0,0 +1,106 @@
+"""Tests for the write-behind buffer."""
+
+import asyncio
+
+import pytest
+
+from ghl_assistant import codec
+from ghl_assistant.api import WriteBehindConfig, write_behind
+
+
+@pytest.fixture
+def contacts(api):
+    store = {"c1": {"id": "c1", "firstName": "Old", "tags": ["old"]}}
+
+    @api.route("PUT", r"/contacts/(?P<id>[^/]+)")
+    def update(request, match):
+        store[match["id"]].update(codec.loads(request.content))
+        return 200, {"contact": dict(store[match["id"]])}
+
+    @api.route("POST", r"/contacts/(?P<id>[^/]+)/tags")
+    def add_tags(request, match):
+        tags = store[match["id"]]["tags"]
+        tags.extend(codec.loads(request.content)["tags"])
+        return 200, {"tags": list(tags)}
+
+    @api.route("POST", r"/notes/")
+    def note(request, match):
+        return 400, {"message": "rejected"}
+
+    return store
+
+
+async def test_mutations_merge_into_one_update(api, make_client, contacts):
+    async with make_client(write_behind=WriteBehindConfig(window=None)) as ghl:
+        buffer = ghl.write_behind
+        name = buffer.update("c1", first_name="Jane")
+        sms = buffer.set_dnd("c1", True, channel="sms")
+        email = buffer.set_dnd("c1", False, channel="email")
+        tag = buffer.add_tag("c1", "engaged")
+        note = buffer.add_note("c1", "hello")
+    # Flushed on client exit
+
+    assert len(api.calls("PUT")) == 1
+    sent = codec.loads(api.calls("PUT")[0].content)
+    assert sent == {
+        "firstName": "Jane",
+        "dndSettings": {"sms": {"status": "active"}, "email": {"status": "inactive"}},
+    }
+    assert name.result() is sms.result() is email.result()
+    assert tag.result() == {"tags": ["old", "engaged"]}
+    assert codec.loads(api.calls("POST", "/contacts/c1/tags")[0].content) == {"tags": ["engaged"]}
+    assert note.exception() is not None
+    assert buffer.stats.writes == 2 and buffer.stats.failed == 1
+
+
+async def test_full_tag_list_absorbs_later_operations(api, make_client, contacts):
+    async with make_client(write_behind=WriteBehindConfig(window=None)) as ghl:
+        earlier = ghl.write_behind.add_tag("c1", "dropped")
+        replaced = ghl.write_behind.update("c1", tags=["a", "b"])
+        later = ghl.write_behind.remove_tag("c1", "b")
+
+    assert codec.loads(api.calls("PUT")[0].content) == {"tags": ["a"]}
+    assert not api.calls("POST")
+    assert earlier.result() is replaced.result() is later.result()
+
+
+async def test_cancelled_write_cancels_every_waiting_future(make_client, contacts):
+    async with make_client(write_behind=WriteBehindConfig(window=None)) as ghl:
+        buffer = ghl.write_behind
+        started = asyncio.Event()
+
+        async def stuck(contact_id, fields):
+            started.set()
+            await asyncio.Event().wait()
+
+        buffer._update = stuck
+        futures = [
+            buffer.update("c1", first_name="Jane"),
+            buffer.add_tag("c1", "engaged"),
+            buffer.add_note("c1", "hello"),
+        ]
+        task = buffer._start("c1")
+        await started.wait()
+        task.cancel()
+        await asyncio.wait([task])
+
+    assert all(future.cancelled() for future in futures)
+
+
+async def test_crashed_write_fails_every_waiting_future(make_client, contacts, monkeypatch):
+    def crash(tags, ops):
+        raise RuntimeError("bug")
+
+    monkeypatch.setattr(write_behind, "apply_tag_ops", crash)
+    async with make_client(write_behind=WriteBehindConfig(window=None)) as ghl:
+        buffer = ghl.write_behind
+        futures = [
+            buffer.update("c1", tags=["a"]),
+            buffer.add_tag("c1", "b"),
+            buffer.add_note("c1", "hello"),
+        ]
+        task = buffer._start("c1")
+        await asyncio.wait([task])
+
+    assert isinstance(task.exception(), RuntimeError)
+    assert all(isinstance(future.exception(), RuntimeError) for future in futures)